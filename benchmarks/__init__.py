@@ -0,0 +1 @@
+"""Micro benchmarks for the HomeWizard Instant hot paths."""
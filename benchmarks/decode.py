@@ -0,0 +1,47 @@
+"""Benchmark decoding /api/v1/data responses per payload.
+
+Run from the repository root:
+
+    python -m benchmarks.decode
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from timeit import repeat
+
+from homewizard_energy.models import Measurement
+
+from custom_components.homewizard_instant.fastpath import decode_measurement
+
+FIXTURES = Path(__file__).parents[1] / "tests" / "fixtures" / "p1"
+NUMBER = 5_000
+
+
+def main() -> None:
+    """Print the decode time of the library and the fast path per fixture."""
+    print(f"best of 5 x {NUMBER} decodes")
+    for fixture in sorted(FIXTURES.glob("*.json")):
+        payload = fixture.read_bytes()
+        text = payload.decode()
+
+        library = min(
+            repeat(
+                lambda text=text: Measurement.from_json(text), number=NUMBER, repeat=5
+            )
+        )
+        fast = min(
+            repeat(
+                lambda payload=payload: decode_measurement(payload),
+                number=NUMBER,
+                repeat=5,
+            )
+        )
+        print(
+            f"{fixture.stem:>22}: library {library / NUMBER * 1e6:7.2f} µs, "
+            f"fast path {fast / NUMBER * 1e6:7.2f} µs"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark the per tick cost of reading all sensor values.
+
+Run from the repository root:
+
+    python -m benchmarks.extraction
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from timeit import repeat
+
+from homewizard_energy.models import CombinedModels, Device, Measurement, System
+
+from custom_components.homewizard_instant.extraction import ExtractionPlan
+from custom_components.homewizard_instant.sensor import SENSORS
+
+# Three phase DSMR 5 meter with gas and water meters
+PAYLOAD = (
+    Path(__file__).parents[1] / "tests" / "fixtures" / "p1" / "dsmr5_three_phase.json"
+)
+
+NUMBER = 10_000
+
+
+def _data() -> CombinedModels:
+    """Return combined models for the benchmark payload."""
+    return CombinedModels(
+        device=Device(
+            product_type="HWE-P1",
+            product_name="P1 meter",
+            serial="5c2fafabcdef",
+            api_version="v1",
+            firmware_version="6.00",
+        ),
+        measurement=Measurement.from_json(PAYLOAD.read_text()),
+        state=None,
+        system=System(wifi_rssi_db=-60, uptime_s=100),
+    )
+
+
+def main() -> None:
+    """Print the per tick cost of both approaches."""
+    data = _data()
+    descriptions = [description for description in SENSORS if description.has_fn(data)]
+    plan = ExtractionPlan(descriptions)
+    offsets = [plan.offsets[description.key] for description in descriptions]
+
+    def per_entity() -> None:
+        # native_value, then available calling native_value again
+        for description in descriptions:
+            description.value_fn(data)
+            description.value_fn(data)
+
+    def planned() -> None:
+        snapshot = plan.extract(data)
+        for offset in offsets:
+            snapshot[offset]
+            snapshot[offset]
+
+    print(f"{len(descriptions)} sensors, best of 5 x {NUMBER} ticks")
+    for name, func in (
+        ("per entity value_fn", per_entity),
+        ("extraction plan", planned),
+    ):
+        best = min(repeat(func, number=NUMBER, repeat=5)) / NUMBER
+        print(f"{name:>20}: {best * 1e6:8.2f} µs/tick")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""Fake HomeWizard P1 meters serving the local API v1 over HTTP.
+
+Each meter serves /api, /api/v1/data and /api/v1/system, with a new
+telegram every cadence seconds on the wall clock. The import total grows
+by 1 Wh per telegram, so a client can tell from a measurement which
+telegram it got and when that telegram was published. Run from the
+repository root to serve meters on consecutive ports:
+
+    python -m benchmarks.fake_p1 --meters 12 --port 18000 --latency 0.02
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser, Namespace
+import asyncio
+import json
+import math
+from pathlib import Path
+from random import Random
+from time import time
+from typing import Any
+
+from aiohttp import web
+
+FIXTURE = (
+    Path(__file__).parents[1] / "tests" / "fixtures" / "p1" / "dsmr5_three_phase.json"
+)
+
+# Import total of telegram zero and its growth per telegram
+IMPORT_BASE_KWH = 10_000.0
+IMPORT_PER_TELEGRAM_KWH = 0.001
+
+
+def published_at(import_kwh: float, cadence: float) -> float:
+    """Return when the telegram with an import total was published."""
+    telegram = round((import_kwh - IMPORT_BASE_KWH) / IMPORT_PER_TELEGRAM_KWH)
+    return telegram * cadence
+
+
+class FakeP1Meter:
+    """A fake P1 meter with configurable response time and failures."""
+
+    requests: int = 0
+    errors: int = 0
+
+    _runner: web.AppRunner | None = None
+    _telegram: int | None = None
+    _payload: bytes = b""
+
+    def __init__(
+        self,
+        serial: str = "5c2fafabcdef",
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        cadence: float = 1.0,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the meter."""
+        self.serial = serial
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.cadence = cadence
+        self._random = Random(seed)
+        self._template: dict[str, Any] = json.loads(FIXTURE.read_text())
+        # Each meter has its own gas and water meters
+        for external in self._template["external"]:
+            external["unique_id"] = (
+                external["unique_id"][:-12] + serial.encode().hex()[-12:]
+            )
+        self._device = json.dumps(
+            {
+                "product_type": "HWE-P1",
+                "product_name": "P1 meter",
+                "serial": serial,
+                "firmware_version": "6.00",
+                "api_version": "v1",
+            }
+        ).encode()
+        self._system = json.dumps({"cloud_enabled": True}).encode()
+
+        app = web.Application()
+        app.router.add_get("/api", self._handle_device)
+        app.router.add_get("/api/v1/data", self._handle_data)
+        app.router.add_get("/api/v1/system", self._handle_system)
+        self.app = app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving and return the host:port to connect to."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        return f"{host}:{port}"
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def telegram_at(self, now: float) -> int:
+        """Return the number of the telegram current at a wall-clock time."""
+        return math.floor(now / self.cadence)
+
+    def payload(self, telegram: int) -> bytes:
+        """Return the /api/v1/data response of a telegram."""
+        if telegram != self._telegram:
+            power = round(500 + 400 * math.sin(telegram / 30), 3)
+            data = self._template | {
+                "active_power_w": power,
+                "active_power_l1_w": round(power / 3, 3),
+                "active_power_l2_w": round(power / 3, 3),
+                "active_power_l3_w": round(power / 3, 3),
+                "total_power_import_kwh": round(
+                    IMPORT_BASE_KWH + telegram * IMPORT_PER_TELEGRAM_KWH, 3
+                ),
+            }
+            self._telegram = telegram
+            self._payload = json.dumps(data).encode()
+
+        return self._payload
+
+    async def _respond(self, body: bytes) -> web.Response:
+        """Answer after the configured delay, or fail at the error rate."""
+        self.requests += 1
+        if (delay := self.latency + self._random.uniform(-1, 1) * self.jitter) > 0:
+            await asyncio.sleep(delay)
+
+        if self._random.random() < self.error_rate:
+            self.errors += 1
+            return web.Response(status=503)
+
+        return web.Response(body=body, content_type="application/json")
+
+    async def _handle_device(self, request: web.Request) -> web.Response:
+        """Serve the device information."""
+        return await self._respond(self._device)
+
+    async def _handle_data(self, request: web.Request) -> web.Response:
+        """Serve the current telegram."""
+        return await self._respond(self.payload(self.telegram_at(time())))
+
+    async def _handle_system(self, request: web.Request) -> web.Response:
+        """Serve the system information."""
+        return await self._respond(self._system)
+
+
+def add_arguments(parser: ArgumentParser) -> None:
+    """Add the options of the fake meters to a parser."""
+    parser.add_argument("--meters", type=int, default=1, help="number of meters")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="response time in seconds"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="response time spread in seconds"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="share of failed requests"
+    )
+    parser.add_argument(
+        "--cadence", type=float, default=1.0, help="seconds between telegrams"
+    )
+
+
+def meter_arguments(args: Namespace) -> list[str]:
+    """Return the command line options that recreate the meters."""
+    return [
+        f"--meters={args.meters}",
+        f"--latency={args.latency}",
+        f"--jitter={args.jitter}",
+        f"--error-rate={args.error_rate}",
+        f"--cadence={args.cadence}",
+    ]
+
+
+async def serve(args: Namespace) -> None:
+    """Serve the meters until cancelled, printing one address per line."""
+    meters = [
+        FakeP1Meter(
+            f"5c2fafab{index:04x}",
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            cadence=args.cadence,
+            seed=index,
+        )
+        for index in range(args.meters)
+    ]
+    for index, meter in enumerate(meters):
+        print(await meter.start(port=args.port + index if args.port else 0))
+    print("ready", flush=True)
+
+    try:
+        await asyncio.Event().wait()
+    finally:
+        for meter in meters:
+            await meter.stop()
+
+
+def main() -> None:
+    """Serve fake meters from the command line."""
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    parser.add_argument(
+        "--port", type=int, default=0, help="port of the first meter, 0 for any"
+    )
+    try:
+        asyncio.run(serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""Load test the poll loop of the integration against fake P1 meters.
+
+The fake meters run in a separate process, so the CPU time measured here is
+that of Home Assistant and the integration alone. Each meter is set up as a
+config entry and polled by the real coordinator over HTTP. Run from the
+repository root:
+
+    python -m benchmarks.load --meters 12 --duration 30 --latency 0.02
+
+End-to-end latency runs from the moment a telegram is published by a meter
+to the moment its coordinator notifies the entities of it.
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser, Namespace
+import asyncio
+from collections.abc import Callable
+import logging
+import sys
+from tempfile import TemporaryDirectory
+from time import monotonic, process_time, time
+
+from homeassistant import loader
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_IP_ADDRESS
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_test_home_assistant,
+)
+
+from custom_components.homewizard_instant.const import DOMAIN
+from custom_components.homewizard_instant.coordinator import (
+    HWEnergyDeviceUpdateCoordinator,
+)
+from custom_components.homewizard_instant.scheduler import async_get_scheduler
+
+from .fake_p1 import add_arguments, meter_arguments, published_at
+
+# Entries whose first requests failed are set up again this many times
+SETUP_ATTEMPTS = 10
+
+
+class LatencyProbe:
+    """Record the end-to-end latency of each new telegram of one meter."""
+
+    def __init__(self, coordinator: HWEnergyDeviceUpdateCoordinator) -> None:
+        """Initialize the probe."""
+        self.coordinator = coordinator
+        self.latencies: list[float] = []
+        self._last: float | None = None
+
+    def listener(self, cadence: float) -> Callable[[], None]:
+        """Return a coordinator listener recording telegrams it has not seen."""
+
+        def _async_update() -> None:
+            if (data := self.coordinator.data) is None:
+                return
+            import_kwh = data.measurement.energy_import_kwh
+            if import_kwh is None or import_kwh == self._last:
+                return
+            self._last = import_kwh
+            self.latencies.append(time() - published_at(import_kwh, cadence))
+
+        return _async_update
+
+
+def percentile(values: list[float], quantile: float) -> float | None:
+    """Return the value below which the quantile of values falls."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(quantile * len(ordered)))]
+
+
+def ms(value: float | None) -> str:
+    """Format seconds as milliseconds."""
+    return "-" if value is None else f"{value * 1000:.1f} ms"
+
+
+async def start_meters(args: Namespace) -> tuple[asyncio.subprocess.Process, list[str]]:
+    """Start the fake meters and return their addresses."""
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-m",
+        "benchmarks.fake_p1",
+        *meter_arguments(args),
+        stdout=asyncio.subprocess.PIPE,
+    )
+    assert process.stdout is not None
+    hosts = []
+    while (line := (await process.stdout.readline()).decode().strip()) != "ready":
+        if not line:
+            raise RuntimeError("fake meters exited before they were ready")
+        hosts.append(line)
+
+    return process, hosts
+
+
+async def setup_entries(
+    hass: HomeAssistant, entries: list[MockConfigEntry]
+) -> list[MockConfigEntry]:
+    """Set up the entries and return those that loaded.
+
+    With errors enabled the first requests to a meter can fail, which leaves
+    its entry waiting to retry. Those entries are set up again right away.
+    """
+    for _ in range(SETUP_ATTEMPTS):
+        pending = [
+            entry for entry in entries if entry.state is not ConfigEntryState.LOADED
+        ]
+        if not pending:
+            break
+        for entry in pending:
+            if entry.state is ConfigEntryState.NOT_LOADED:
+                await hass.config_entries.async_setup(entry.entry_id)
+            else:
+                await hass.config_entries.async_reload(entry.entry_id)
+        await hass.async_block_till_done()
+
+    for entry in entries:
+        if entry.state is not ConfigEntryState.LOADED:
+            print(f"{entry.title} did not set up: {entry.state.value}")
+
+    return [entry for entry in entries if entry.state is ConfigEntryState.LOADED]
+
+
+async def run(hass: HomeAssistant, args: Namespace, hosts: list[str]) -> None:
+    """Set up one entry per meter, measure, and print the results."""
+    entries = []
+    for index, host in enumerate(hosts):
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title=f"P1 Meter {index}",
+            unique_id=f"{DOMAIN}_HWE-P1_{index}",
+            data={CONF_IP_ADDRESS: host},
+        )
+        entry.add_to_hass(hass)
+        entries.append(entry)
+
+    if not (loaded := await setup_entries(hass, entries)):
+        raise RuntimeError("no meter could be set up")
+
+    coordinators: list[HWEnergyDeviceUpdateCoordinator] = [
+        entry.runtime_data for entry in loaded
+    ]
+    await asyncio.sleep(args.warmup)
+
+    probes = []
+    for coordinator in coordinators:
+        probe = LatencyProbe(coordinator)
+        coordinator.async_add_listener(probe.listener(args.cadence))
+        probes.append(probe)
+    polls = [coordinator.poll_stats.polls for coordinator in coordinators]
+    failures = [coordinator.poll_stats.failures for coordinator in coordinators]
+    cpu_start = process_time()
+    start = monotonic()
+
+    await asyncio.sleep(args.duration)
+
+    elapsed = monotonic() - start
+    cpu = process_time() - cpu_start
+    rates = [
+        (coordinator.poll_stats.polls - before) / elapsed
+        for coordinator, before in zip(coordinators, polls, strict=True)
+    ]
+    failed = sum(
+        coordinator.poll_stats.failures - before
+        for coordinator, before in zip(coordinators, failures, strict=True)
+    )
+    latencies = [latency for probe in probes for latency in probe.latencies]
+    telegrams = len(latencies) / len(probes) / (elapsed / args.cadence)
+    scheduler = async_get_scheduler(hass).as_dict()
+
+    print(f"{len(coordinators)} of {len(hosts)} meters for {elapsed:.1f} s")
+    print(
+        f"poll rate per meter     mean {sum(rates) / len(rates):.2f}/s"
+        f"  min {min(rates):.2f}/s  failed polls {failed}"
+    )
+    print(
+        f"end-to-end latency      p50 {ms(percentile(latencies, 0.5))}"
+        f"  p95 {ms(percentile(latencies, 0.95))}"
+        f"  max {ms(max(latencies, default=None))}"
+    )
+    print(
+        "poll latency            p95 of slowest meter "
+        + ms(
+            max(
+                (coordinator.poll_stats.latency_percentile(monotonic(), 0.95) or 0)
+                / 1000
+                for coordinator in coordinators
+            )
+        )
+    )
+    print(f"telegrams received      {telegrams:.1%}")
+    print(
+        f"CPU per meter           {cpu / elapsed / len(coordinators) * 1000:.2f} ms/s"
+        f"  ({cpu / elapsed / len(coordinators):.2%})"
+    )
+    print(
+        f"scheduler               missed ticks {scheduler['missed_ticks']}"
+        f"  slot waits {scheduler['slot_waits']}"
+        f"  max concurrent polls {scheduler['active_polls_max']}"
+    )
+
+    for entry in entries:
+        await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def load_test(args: Namespace) -> None:
+    """Run the load test with fake meters in a separate process."""
+    process, hosts = await start_meters(args)
+    try:
+        with TemporaryDirectory() as config_dir:
+            async with async_test_home_assistant(config_dir=config_dir) as hass:
+                # Load the integration from this repository
+                hass.data.pop(loader.DATA_CUSTOM_COMPONENTS)
+                await run(hass, args, hosts)
+                await hass.async_stop(force=True)
+    finally:
+        process.terminate()
+        await process.wait()
+
+
+def main() -> None:
+    """Run the load test from the command line."""
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    parser.add_argument(
+        "--duration", type=float, default=30.0, help="seconds to measure"
+    )
+    parser.add_argument(
+        "--warmup", type=float, default=3.0, help="seconds before measuring"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    asyncio.run(load_test(args))
+
+
+if __name__ == "__main__":
+    main()
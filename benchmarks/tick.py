@@ -0,0 +1,283 @@
+"""Benchmark a full poll tick against a stored baseline.
+
+A tick is one coordinator refresh: decoding a new telegram, updating the
+statistics, extracting all sensor values and writing the state of every
+entity that changed, including the external gas and water meters. Only the
+HTTP request is left out. Run from the repository root:
+
+    python -m benchmarks.tick           # compare with benchmarks/baseline.json
+    python -m benchmarks.tick --check   # exit with an error on a regression
+    python -m benchmarks.tick --save    # store the results as the new baseline
+
+Times are scaled by a fixed calibration workload before they are compared,
+but they are only reported. --check fails when the function calls or
+allocations per tick grow, which do not depend on the machine. They do
+depend on the Python and Home Assistant versions, so store a new baseline
+after upgrading either.
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser
+import asyncio
+from cProfile import Profile
+from collections.abc import Iterator
+from contextlib import contextmanager
+import gc
+import json
+import logging
+from pathlib import Path
+import platform
+from pstats import Stats
+import sys
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from timeit import repeat
+import tracemalloc
+from typing import Any
+from unittest.mock import patch
+
+from homewizard_energy.models import Device, Measurement, System
+
+from homeassistant import loader
+from homeassistant.const import CONF_IP_ADDRESS
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_test_home_assistant,
+)
+
+from custom_components.homewizard_instant.const import DOMAIN
+from custom_components.homewizard_instant.coordinator import (
+    HWEnergyDeviceUpdateCoordinator,
+)
+from custom_components.homewizard_instant.fastpath import decode_measurement
+
+FIXTURES = Path(__file__).parents[1] / "tests" / "fixtures" / "p1"
+BASELINE = Path(__file__).parent / "baseline.json"
+
+# Payload and whether to keep its external devices, per scenario
+SCENARIOS = {
+    "single_phase": ("dsmr4_single_phase.json", False),
+    "three_phase": ("dsmr5_three_phase.json", False),
+    "external_devices": ("dsmr5_three_phase.json", True),
+}
+
+TICKS = 500
+REPEAT = 7
+# Allowed increase over the baseline before --check fails, time is only
+# reported as it varies too much between runs on shared machines
+CALLS_TOLERANCE = 0.05
+ALLOC_TOLERANCE = 0.10
+
+
+class FakeApi:
+    """Answer device and system requests of the coordinator."""
+
+    host = "127.0.0.1"
+
+    async def device(self, reset_cache: bool = False) -> Device:
+        """Return the device information."""
+        return Device(
+            product_type="HWE-P1",
+            product_name="P1 meter",
+            serial="5c2fafabcdef",
+            api_version="v1",
+            firmware_version="6.00",
+        )
+
+    async def system(self) -> System:
+        """Return the system information."""
+        return System(wifi_rssi_db=-60, uptime_s=100)
+
+    async def close(self) -> None:
+        """Close the api."""
+
+
+class FakeReader:
+    """Decode a new telegram on every read, like the device connection."""
+
+    def __init__(self, payloads: list[bytes]) -> None:
+        """Initialize the reader."""
+        self.payloads = payloads
+        self._index = 0
+
+    async def async_read(self) -> Measurement:
+        """Return the next telegram."""
+        self._index += 1
+        return decode_measurement(self.payloads[self._index % len(self.payloads)])
+
+
+def payloads(fixture: str, external: bool) -> list[bytes]:
+    """Return distinct telegrams of a fixture, with power moving each tick."""
+    data = json.loads((FIXTURES / fixture).read_text())
+    if not external:
+        data["external"] = []
+
+    return [
+        json.dumps(data | {"active_power_w": data["active_power_w"] + index}).encode()
+        for index in range(60)
+    ]
+
+
+def calibrate() -> float:
+    """Return the time of a fixed workload in µs, to compare machines."""
+    text = (FIXTURES / "dsmr5_three_phase.json").read_text()
+    number = 2_000
+    return (
+        min(repeat(lambda: Measurement.from_json(text), number=number, repeat=REPEAT))
+        / number
+        * 1e6
+    )
+
+
+@contextmanager
+def integration_patches(fixture: str, external: bool) -> Iterator[None]:
+    """Replace the HTTP layer of the integration."""
+    reader = FakeReader(payloads(fixture, external))
+    with (
+        patch(
+            "custom_components.homewizard_instant.HomeWizardEnergyV1",
+            return_value=FakeApi(),
+        ),
+        patch(
+            "custom_components.homewizard_instant.coordinator.MeasurementReader",
+            return_value=reader,
+        ),
+    ):
+        yield
+
+
+async def measure(fixture: str, external: bool) -> dict[str, Any]:
+    """Return the time and allocations per tick of a scenario."""
+    with TemporaryDirectory() as config_dir, integration_patches(fixture, external):
+        async with async_test_home_assistant(config_dir=config_dir) as hass:
+            # Load the integration from this repository
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS)
+            entry = MockConfigEntry(
+                domain=DOMAIN,
+                title="P1 Meter",
+                unique_id=f"{DOMAIN}_HWE-P1_5c2fafabcdef",
+                data={CONF_IP_ADDRESS: "127.0.0.1"},
+                # Ticks are driven by the benchmark
+                pref_disable_polling=True,
+            )
+            entry.add_to_hass(hass)
+            assert await hass.config_entries.async_setup(entry.entry_id)
+            await hass.async_block_till_done()
+            coordinator: HWEnergyDeviceUpdateCoordinator = entry.runtime_data
+
+            async def ticks(number: int) -> float:
+                # Like timeit, leave garbage collection out of the timing
+                gc.disable()
+                start = perf_counter()
+                for _ in range(number):
+                    await coordinator.async_refresh()
+                elapsed = perf_counter() - start
+                gc.enable()
+                return elapsed
+
+            # Fill the rolling windows and entity caches first
+            await ticks(TICKS)
+            best = min([await ticks(TICKS) for _ in range(REPEAT)]) / TICKS
+
+            gc.collect()
+            tracemalloc.start()
+            allocated = 0
+            for _ in range(TICKS):
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+                await coordinator.async_refresh()
+                allocated += tracemalloc.get_traced_memory()[1] - before
+            tracemalloc.stop()
+
+            # Function calls do not depend on the machine or its load
+            profile = Profile()
+            profile.enable()
+            await ticks(TICKS)
+            profile.disable()
+            calls = Stats(profile).total_calls  # type: ignore[attr-defined]
+
+            result = {
+                "entities": len(coordinator._listeners),
+                "tick_us": round(best * 1e6, 1),
+                "calls": round(calls / TICKS),
+                "alloc_kib": round(allocated / TICKS / 1024, 1),
+            }
+            assert await hass.config_entries.async_unload(entry.entry_id)
+            await hass.async_stop(force=True)
+
+    return result
+
+
+def compare(
+    results: dict[str, dict[str, Any]], calibration: float, baseline: dict[str, Any]
+) -> bool:
+    """Print the results next to the baseline and return if none regressed."""
+    if (python := platform.python_version()) != baseline["python"]:
+        print(f"baseline stored with Python {baseline['python']}, running {python}")
+    scale = calibration / baseline["calibration_us"]
+    print(f"calibration {calibration:.1f} µs, {scale:.2f}x its time in the baseline")
+    passed = True
+    for name, result in results.items():
+        if (stored := baseline["scenarios"].get(name)) is None:
+            print(f"{name:>17}: no baseline")
+            continue
+
+        tick = result["tick_us"] / (stored["tick_us"] * scale) - 1
+        calls = result["calls"] / stored["calls"] - 1
+        alloc = result["alloc_kib"] / stored["alloc_kib"] - 1
+        regressed = calls > CALLS_TOLERANCE or alloc > ALLOC_TOLERANCE
+        passed &= not regressed
+        print(
+            f"{name:>17}: {tick:+7.1%} time  {calls:+7.1%} calls"
+            f"  {alloc:+7.1%} allocated" + ("  REGRESSED" if regressed else "")
+        )
+
+    return passed
+
+
+def main() -> None:
+    """Run all scenarios and compare or store the baseline."""
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="fail on a regression")
+    parser.add_argument("--save", action="store_true", help="store a new baseline")
+    parser.add_argument(
+        "--baseline", type=Path, default=BASELINE, help="baseline file to use"
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    calibration = calibrate()
+    results = {
+        name: asyncio.run(measure(fixture, external))
+        for name, (fixture, external) in SCENARIOS.items()
+    }
+    calibration = min(calibration, calibrate())
+
+    print(f"best of {REPEAT} x {TICKS} ticks")
+    for name, result in results.items():
+        print(
+            f"{name:>17}: {result['tick_us']:8.1f} µs/tick"
+            f"  {result['calls']:6} calls/tick"
+            f"  {result['alloc_kib']:6.1f} KiB/tick"
+            f"  {result['entities']} entities"
+        )
+
+    if args.save:
+        baseline = {
+            "python": platform.python_version(),
+            "calibration_us": round(calibration, 2),
+            "scenarios": results,
+        }
+        args.baseline.write_text(json.dumps(baseline, indent=2) + "\n")
+        print(f"saved {args.baseline}")
+        return
+
+    if args.baseline.exists():
+        passed = compare(results, calibration, json.loads(args.baseline.read_text()))
+        if args.check and not passed:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,45 +1,146 @@
 """The Homewizard integration."""
 
+from typing import cast
+
 from homewizard_energy import HomeWizardEnergyV1
 
-from homeassistant.const import CONF_IP_ADDRESS
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    CONF_IP_ADDRESS,
+    CONF_TOKEN,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    Platform,
+)
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.start import async_at_started
 
-from .const import PLATFORMS
+from .aggregate import AggregateCoordinator, HomeWizardAggregateConfigEntry
+from .connection import DeviceConnection
+from .const import CONF_METERS, DOMAIN, HISTORY_FLUSH_INTERVAL, PLATFORMS
 from .coordinator import HomeWizardConfigEntry, HWEnergyDeviceUpdateCoordinator
+from .demand import demand_store
+from .device_cache import device_cache_store
+from .history import async_backfill_statistics, async_remove_history
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: HomeWizardConfigEntry) -> bool:
     """Set up Homewizard from a config entry."""
+    if CONF_METERS in entry.data:
+        return await _async_setup_aggregate_entry(
+            hass, cast(HomeWizardAggregateConfigEntry, entry)
+        )
 
+    # Polls use a dedicated keep-alive connection per device, closed however
+    # setup ends
+    connection = DeviceConnection()
     api = HomeWizardEnergyV1(
-        entry.data[CONF_IP_ADDRESS],
-        clientsession=async_get_clientsession(hass),
+        entry.data[CONF_IP_ADDRESS], clientsession=connection.session
     )
+    entry.async_on_unload(api.close)
+    entry.async_on_unload(connection.async_close)
 
-    coordinator = HWEnergyDeviceUpdateCoordinator(hass, entry, api)
     try:
-        await coordinator.async_config_entry_first_refresh()
+        return await _async_setup_device_entry(hass, entry, api, connection)
+    except Exception:
+        # Unload callbacks only run on config entry errors
+        await api.close()
+        await connection.async_close()
+        raise
 
-    except ConfigEntryNotReady:
-        await coordinator.api.close()
 
-        if coordinator.api_disabled:
-            entry.async_start_reauth(hass)
+async def _async_setup_device_entry(
+    hass: HomeAssistant,
+    entry: HomeWizardConfigEntry,
+    api: HomeWizardEnergyV1,
+    connection: DeviceConnection,
+) -> bool:
+    """Set up a single HomeWizard device on its connection."""
+    coordinator = HWEnergyDeviceUpdateCoordinator(hass, entry, api, connection)
+    await coordinator.async_restore()
 
-        raise
+    # Set up entities from the cached snapshot without waiting for the device
+    if not await coordinator.async_load_device_cache():
+        try:
+            await coordinator.async_config_entry_first_refresh()
+
+        except ConfigEntryNotReady:
+            if coordinator.api_disabled:
+                entry.async_start_reauth(hass)
+
+            raise
 
     entry.runtime_data = coordinator
 
+    # Prefer pushed measurements when the device was paired for API v2
+    # The long lived WebSocket stays on the shared session
+    if (token := entry.data.get(CONF_TOKEN)) is not None:
+        await coordinator.async_start_push(async_get_clientsession(hass), token)
+
+    # Keep the recent power samples on disk across restarts
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass, coordinator.async_flush_history, HISTORY_FLUSH_INTERVAL
+        )
+    )
+    entry.async_on_unload(
+        hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_FINAL_WRITE, coordinator.async_flush_history
+        )
+    )
+
     # Finalize
-    entry.async_on_unload(coordinator.api.close)
+    entry.async_on_unload(coordinator.async_flush_history)
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Import the hours the recorder missed from the samples kept on disk, once
+    # it had the chance to compile them itself after Home Assistant started
+    if "recorder" in hass.config.components and (
+        entity_id := er.async_get(hass).async_get_entity_id(
+            Platform.SENSOR, DOMAIN, f"{entry.unique_id}_active_power_w"
+        )
+    ):
+
+        @callback
+        def _async_backfill(hass: HomeAssistant) -> None:
+            entry.async_create_background_task(
+                hass,
+                async_backfill_statistics(hass, entity_id, coordinator.history),
+                f"{DOMAIN} backfill statistics",
+            )
+
+        entry.async_on_unload(async_at_started(hass, _async_backfill))
+
     return True
 
 
+async def _async_setup_aggregate_entry(
+    hass: HomeAssistant, entry: HomeWizardAggregateConfigEntry
+) -> bool:
+    """Set up a virtual meter that sums several P1 meters."""
+    coordinator = AggregateCoordinator(hass, entry)
+    coordinator.async_start()
+    entry.runtime_data = coordinator
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    return True
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: HomeWizardConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: HomeWizardConfigEntry) -> bool:
     """Unload a config entry."""
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: HomeWizardConfigEntry) -> None:
+    """Remove the stored data of the config entry."""
+    await demand_store(hass, entry.entry_id).async_remove()
+    await device_cache_store(hass, entry.entry_id).async_remove()
+    await async_remove_history(hass, entry.entry_id)
@@ -0,0 +1,196 @@
+"""Virtual meter combining the measurements of several P1 meters."""
+
+from __future__ import annotations
+
+from collections import deque
+from time import time
+
+from homewizard_energy.models import Measurement
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util.signal_type import SignalTypeFormat
+
+from .const import (
+    AGGREGATE_BUFFER_SIZE,
+    AGGREGATE_DELAY,
+    AGGREGATE_ENERGY_METRICS,
+    AGGREGATE_MAX_AGE,
+    AGGREGATE_POWER_METRICS,
+    CONF_METERS,
+    DOMAIN,
+    LOGGER,
+)
+from .polling import AlignedTicker
+from .scheduler import async_get_scheduler
+
+type AggregateData = dict[str, float | None]
+type HomeWizardAggregateConfigEntry = ConfigEntry[AggregateCoordinator]
+
+# Sent by the coordinator of a meter for each new measurement
+SIGNAL_MEASUREMENT: SignalTypeFormat[float, Measurement] = SignalTypeFormat(
+    f"{DOMAIN}_measurement_{{}}"
+)
+
+_METRICS = (*AGGREGATE_POWER_METRICS, *AGGREGATE_ENERGY_METRICS)
+
+
+class AlignedSamples:
+    """Recent measurements of one meter, read at any moment."""
+
+    def __init__(self, size: int = AGGREGATE_BUFFER_SIZE) -> None:
+        """Initialize the samples."""
+        self._samples: deque[tuple[float, tuple[float | None, ...]]] = deque(
+            maxlen=size
+        )
+
+    @callback
+    def add(self, now: float, measurement: Measurement) -> None:
+        """Add a measurement received at a wall-clock time."""
+        self._samples.append(
+            (
+                now,
+                (
+                    *(
+                        getattr(measurement, metric)
+                        for metric in AGGREGATE_POWER_METRICS
+                    ),
+                    # Meters report zero for a total they do not know
+                    *(
+                        getattr(measurement, metric) or None
+                        for metric in AGGREGATE_ENERGY_METRICS
+                    ),
+                ),
+            )
+        )
+
+    def values_at(self, moment: float) -> tuple[float | None, ...] | None:
+        """Return the metrics at a moment, or None without a recent sample.
+
+        Between two samples the values are interpolated linearly. After the
+        last sample, or across a gap, the earlier value is held for up to
+        AGGREGATE_MAX_AGE seconds.
+        """
+        later: tuple[float, tuple[float | None, ...]] | None = None
+        for sampled, values in reversed(self._samples):
+            if sampled > moment:
+                later = (sampled, values)
+                continue
+
+            if moment - sampled > AGGREGATE_MAX_AGE:
+                return None
+
+            if later is None or later[0] - sampled > AGGREGATE_MAX_AGE:
+                return values
+
+            weight = (moment - sampled) / (later[0] - sampled)
+            return tuple(
+                value + (next_value - value) * weight
+                if value is not None and next_value is not None
+                else value
+                for value, next_value in zip(values, later[1], strict=True)
+            )
+
+        return None
+
+
+def combine(readings: list[tuple[float | None, ...] | None]) -> AggregateData:
+    """Sum the metrics of all meters.
+
+    Power is summed over the meters that report it, so single phase meters
+    add nothing to the other phases. Energy totals are only known when all
+    meters report them, a partial sum would look like a meter reset.
+    """
+    if any(values is None for values in readings):
+        return dict.fromkeys(_METRICS)
+
+    data: AggregateData = {}
+    for index, metric in enumerate(_METRICS):
+        values = [values[index] for values in readings if values is not None]
+        known = [value for value in values if value is not None]
+        if metric in AGGREGATE_ENERGY_METRICS and len(known) < len(values):
+            data[metric] = None
+        else:
+            data[metric] = sum(known) if known else None
+
+    return data
+
+
+class AggregateCoordinator(DataUpdateCoordinator[AggregateData]):
+    """Combine the meters of an aggregate entry at common ticks.
+
+    The coordinators of the meters send each new measurement with the time it
+    was received. Every whole second the meters are read at the same moment,
+    AGGREGATE_DELAY in the past, and summed. Meters may be set up, reloaded or
+    unreachable in any order; the sum is unknown until all of them report.
+    """
+
+    config_entry: HomeWizardAggregateConfigEntry
+
+    _tick: float = 0.0
+    _unsub_tick: CALLBACK_TYPE | None = None
+
+    def __init__(
+        self, hass: HomeAssistant, config_entry: HomeWizardAggregateConfigEntry
+    ) -> None:
+        """Initialize the aggregate coordinator."""
+        super().__init__(
+            hass,
+            LOGGER,
+            config_entry=config_entry,
+            name=DOMAIN,
+            always_update=False,
+        )
+        self.sources = {
+            entry_id: AlignedSamples() for entry_id in config_entry.data[CONF_METERS]
+        }
+        self.ticker = AlignedTicker()
+        self.scheduler = async_get_scheduler(hass)
+        self.data = dict.fromkeys(_METRICS)
+
+    @callback
+    def async_start(self) -> None:
+        """Receive the measurements of the meters and start ticking."""
+        for entry_id, samples in self.sources.items():
+            self.config_entry.async_on_unload(
+                async_dispatcher_connect(
+                    self.hass, SIGNAL_MEASUREMENT.format(entry_id), samples.add
+                )
+            )
+
+        self._async_schedule_tick()
+
+    async def async_shutdown(self) -> None:
+        """Stop ticking."""
+        if self._unsub_tick is not None:
+            self._unsub_tick()
+            self._unsub_tick = None
+        await super().async_shutdown()
+
+    def values_at(self, moment: float) -> AggregateData:
+        """Return the sum of the meters at a moment."""
+        return combine([samples.values_at(moment) for samples in self.sources.values()])
+
+    async def _async_update_data(self) -> AggregateData:
+        """Combine the meters on request."""
+        return self.values_at(time() - AGGREGATE_DELAY)
+
+    @callback
+    def _async_schedule_tick(self) -> None:
+        """Schedule the next whole second from the shared scheduler."""
+        now = time()
+        self._tick = self.ticker.next_tick(now, 1)
+        self._unsub_tick = self.scheduler.async_schedule(
+            self.hass.loop.time() + self._tick - now, self._async_handle_tick
+        )
+
+    @callback
+    def _async_handle_tick(self) -> None:
+        """Combine the meters and notify entities when the sum changed."""
+        self.ticker.record_tick(time())
+        if (data := self.values_at(self._tick - AGGREGATE_DELAY)) != self.data:
+            self.async_set_updated_data(data)
+
+        self._async_schedule_tick()
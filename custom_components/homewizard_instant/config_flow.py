@@ -6,23 +6,62 @@ import asyncio
 from collections.abc import Mapping
 from typing import Any
 
-from homewizard_energy import HomeWizardEnergyV1
+from homewizard_energy import HomeWizardEnergyV1, HomeWizardEnergyV2, has_v2_api
 from homewizard_energy.const import Model
 from homewizard_energy.errors import DisabledError, RequestError
 from homewizard_energy.models import Device
 import voluptuous as vol
 
 from homeassistant.components import onboarding
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
-from homeassistant.const import CONF_IP_ADDRESS
-from homeassistant.data_entry_flow import AbortFlow
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
+from homeassistant.const import CONF_IP_ADDRESS, CONF_NAME, CONF_TOKEN, UnitOfTime
+from homeassistant.data_entry_flow import AbortFlow, section
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from aiohttp import ClientSession
-from homeassistant.helpers.selector import TextSelector
-
-from .const import CONF_PRODUCT_NAME, CONF_PRODUCT_TYPE, CONF_SERIAL, DOMAIN, LOGGER
+from homeassistant.helpers.selector import (
+    BooleanSelector,
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
+    SelectOptionDict,
+    SelectSelector,
+    SelectSelectorConfig,
+    TextSelector,
+)
+
+from .const import (
+    CONF_DEADBAND,
+    CONF_DEADBAND_TYPE,
+    CONF_ENABLE_PUSH,
+    CONF_GRACE_FAILURES,
+    CONF_GRACE_PERIOD,
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_METERS,
+    CONF_MIN_WRITE_INTERVAL,
+    CONF_PRODUCT_NAME,
+    CONF_PRODUCT_TYPE,
+    CONF_SERIAL,
+    DEADBAND_ABSOLUTE,
+    DEADBAND_RELATIVE,
+    DEFAULT_GRACE_FAILURES,
+    DEFAULT_GRACE_PERIOD,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DOMAIN,
+    GRACE_FAILURES_LIMIT,
+    GRACE_PERIOD_LIMIT,
+    LOGGER,
+    MAX_UPDATE_INTERVAL_LIMIT,
+    MIN_WRITE_INTERVAL_LIMIT,
+    PUSH_TOKEN_NAME,
+    SENSOR_GROUPS,
+)
 
 # Only support P1 meter
 SUPPORTED_PRODUCT_TYPES = [Model.P1_METER]
@@ -38,10 +77,35 @@ class HomeWizardConfigFlow(ConfigFlow, domain=DOMAIN):
     product_type: str | None = None
     serial: str | None = None
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: ConfigEntry,
+    ) -> HomeWizardOptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return HomeWizardOptionsFlowHandler()
+
+    @classmethod
+    @callback
+    def async_supports_options_flow(cls, config_entry: ConfigEntry) -> bool:
+        """Return if the entry has options, aggregate meters have none."""
+        return CONF_METERS not in config_entry.data
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Handle a flow initiated by the user."""
+        if user_input is None and len(self._meter_options()) >= 2:
+            return self.async_show_menu(
+                step_id="user", menu_options=["meter", "aggregate"]
+            )
+
+        return await self.async_step_meter(user_input)
+
+    async def async_step_meter(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Set up a P1 meter by its IP address."""
         errors: dict[str, str] | None = None
         if user_input is not None:
             try:
@@ -68,7 +132,7 @@ class HomeWizardConfigFlow(ConfigFlow, domain=DOMAIN):
 
         user_input = user_input or {}
         return self.async_show_form(
-            step_id="user",
+            step_id="meter",
             data_schema=vol.Schema(
                 {
                     vol.Required(
@@ -79,6 +143,50 @@ class HomeWizardConfigFlow(ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    async def async_step_aggregate(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Set up a virtual meter that sums several P1 meters."""
+        errors: dict[str, str] | None = None
+        if user_input is not None:
+            if len(user_input[CONF_METERS]) < 2:
+                errors = {CONF_METERS: "too_few_meters"}
+            else:
+                meters = sorted(user_input[CONF_METERS])
+                await self.async_set_unique_id(_aggregate_unique_id(meters))
+                self._abort_if_unique_id_configured()
+                return self.async_create_entry(
+                    title=user_input[CONF_NAME], data={CONF_METERS: meters}
+                )
+
+        return self.async_show_form(
+            step_id="aggregate",
+            data_schema=self.add_suggested_values_to_schema(
+                vol.Schema(
+                    {
+                        vol.Required(CONF_NAME): TextSelector(),
+                        vol.Required(CONF_METERS): self._meter_selector(),
+                    }
+                ),
+                user_input,
+            ),
+            errors=errors,
+        )
+
+    def _meter_options(self) -> list[SelectOptionDict]:
+        """Return the configured P1 meters an aggregate meter can sum."""
+        return [
+            SelectOptionDict(value=entry.entry_id, label=entry.title)
+            for entry in self._async_current_entries(include_ignore=False)
+            if CONF_METERS not in entry.data
+        ]
+
+    def _meter_selector(self) -> SelectSelector:
+        """Return a selector for several P1 meters."""
+        return SelectSelector(
+            SelectSelectorConfig(options=self._meter_options(), multiple=True)
+        )
+
     async def async_step_zeroconf(self, discovery_info: Any) -> ConfigFlowResult:
         """Handle zeroconf discovery."""
 
@@ -214,6 +322,8 @@ class HomeWizardConfigFlow(ConfigFlow, domain=DOMAIN):
         """Handle reconfiguration of the integration."""
         errors: dict[str, str] = {}
         reconfigure_entry = self._get_reconfigure_entry()
+        if CONF_METERS in reconfigure_entry.data:
+            return await self.async_step_reconfigure_aggregate()
 
         if user_input:
             try:
@@ -229,6 +339,14 @@ class HomeWizardConfigFlow(ConfigFlow, domain=DOMAIN):
                     f"{DOMAIN}_{device_info.product_type}_{device_info.serial}"
                 )
                 self._abort_if_unique_id_mismatch(reason="wrong_device")
+
+                # Offer push updates when the device speaks API v2
+                if await has_v2_api(
+                    user_input[CONF_IP_ADDRESS], async_get_clientsession(self.hass)
+                ):
+                    self.ip_address = user_input[CONF_IP_ADDRESS]
+                    return await self.async_step_authorize()
+
                 return self.async_update_reload_and_abort(
                     self._get_reconfigure_entry(),
                     data_updates=user_input,
@@ -249,6 +367,160 @@ class HomeWizardConfigFlow(ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    async def async_step_reconfigure_aggregate(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Change the P1 meters an aggregate meter sums."""
+        errors: dict[str, str] | None = None
+        reconfigure_entry = self._get_reconfigure_entry()
+        if user_input is not None:
+            if len(user_input[CONF_METERS]) < 2:
+                errors = {CONF_METERS: "too_few_meters"}
+            else:
+                meters = sorted(user_input[CONF_METERS])
+                return self.async_update_reload_and_abort(
+                    reconfigure_entry,
+                    unique_id=_aggregate_unique_id(meters),
+                    data={CONF_METERS: meters},
+                )
+
+        return self.async_show_form(
+            step_id="reconfigure_aggregate",
+            data_schema=self.add_suggested_values_to_schema(
+                vol.Schema({vol.Required(CONF_METERS): self._meter_selector()}),
+                user_input or reconfigure_entry.data,
+            ),
+            description_placeholders={"title": reconfigure_entry.title},
+            errors=errors,
+        )
+
+    async def async_step_authorize(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Pair with an API v2 device so measurements are pushed over WebSocket."""
+        errors: dict[str, str] | None = None
+        if user_input is not None and self.ip_address is not None:
+            reconfigure_entry = self._get_reconfigure_entry()
+            data = {**reconfigure_entry.data, CONF_IP_ADDRESS: self.ip_address}
+            data.pop(CONF_TOKEN, None)
+
+            if user_input[CONF_ENABLE_PUSH]:
+                try:
+                    data[CONF_TOKEN] = await async_request_token(
+                        self.hass, self.ip_address
+                    )
+                except RecoverableError as ex:
+                    LOGGER.debug("Push authorization failed: %s", ex)
+                    errors = {"base": ex.error_code}
+
+            if errors is None:
+                return self.async_update_reload_and_abort(reconfigure_entry, data=data)
+
+        return self.async_show_form(
+            step_id="authorize",
+            data_schema=vol.Schema(
+                {vol.Required(CONF_ENABLE_PUSH, default=True): BooleanSelector()}
+            ),
+            errors=errors,
+        )
+
+
+class HomeWizardOptionsFlowHandler(OptionsFlow):
+    """Handle HomeWizard options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the polling, availability and write limit options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        options = self.config_entry.options
+        schema: dict[vol.Marker, Any] = {
+            vol.Required(
+                CONF_MAX_UPDATE_INTERVAL,
+                default=options.get(
+                    CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL
+                ),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=1,
+                    max=MAX_UPDATE_INTERVAL_LIMIT,
+                    step=1,
+                    unit_of_measurement=UnitOfTime.SECONDS,
+                    mode=NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Required(
+                CONF_GRACE_FAILURES,
+                default=options.get(CONF_GRACE_FAILURES, DEFAULT_GRACE_FAILURES),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=0,
+                    max=GRACE_FAILURES_LIMIT,
+                    step=1,
+                    mode=NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Required(
+                CONF_GRACE_PERIOD,
+                default=options.get(CONF_GRACE_PERIOD, DEFAULT_GRACE_PERIOD),
+            ): NumberSelector(
+                NumberSelectorConfig(
+                    min=0,
+                    max=GRACE_PERIOD_LIMIT,
+                    step=1,
+                    unit_of_measurement=UnitOfTime.SECONDS,
+                    mode=NumberSelectorMode.BOX,
+                )
+            ),
+        }
+
+        for group in SENSOR_GROUPS:
+            limits = options.get(group, {})
+            schema[vol.Required(group)] = section(
+                vol.Schema(
+                    {
+                        vol.Required(
+                            CONF_DEADBAND, default=limits.get(CONF_DEADBAND, 0)
+                        ): NumberSelector(
+                            NumberSelectorConfig(
+                                min=0, step="any", mode=NumberSelectorMode.BOX
+                            )
+                        ),
+                        vol.Required(
+                            CONF_DEADBAND_TYPE,
+                            default=limits.get(CONF_DEADBAND_TYPE, DEADBAND_ABSOLUTE),
+                        ): SelectSelector(
+                            SelectSelectorConfig(
+                                options=[DEADBAND_ABSOLUTE, DEADBAND_RELATIVE],
+                                translation_key=CONF_DEADBAND_TYPE,
+                            )
+                        ),
+                        vol.Required(
+                            CONF_MIN_WRITE_INTERVAL,
+                            default=limits.get(CONF_MIN_WRITE_INTERVAL, 0),
+                        ): NumberSelector(
+                            NumberSelectorConfig(
+                                min=0,
+                                max=MIN_WRITE_INTERVAL_LIMIT,
+                                step=1,
+                                unit_of_measurement=UnitOfTime.SECONDS,
+                                mode=NumberSelectorMode.BOX,
+                            )
+                        ),
+                    }
+                ),
+                {"collapsed": True},
+            )
+
+        return self.async_show_form(step_id="init", data_schema=vol.Schema(schema))
+
+
+def _aggregate_unique_id(meters: list[str]) -> str:
+    """Return the unique ID of an aggregate meter over sorted entry IDs."""
+    return f"{DOMAIN}_aggregate_{'_'.join(meters)}"
+
 
 async def async_try_connect(
     hass: HomeAssistant,
@@ -290,6 +562,45 @@ async def async_try_connect(
         await energy_api.close()
 
 
+async def async_request_token(
+    hass: HomeAssistant,
+    ip_address: str,
+    clientsession: ClientSession | None = None,
+) -> str:
+    """Request an API v2 token.
+
+    The device only hands out a token shortly after its button was pressed.
+    """
+
+    energy_api = HomeWizardEnergyV2(
+        ip_address,
+        clientsession=clientsession or async_get_clientsession(hass),
+    )
+
+    try:
+        return await energy_api.get_token(PUSH_TOKEN_NAME)
+
+    except DisabledError as ex:
+        raise RecoverableError(
+            "Button on the device was not pressed", "authorization_required"
+        ) from ex
+
+    except RequestError as ex:
+        raise RecoverableError(
+            "Device unreachable or unexpected response", "network_error"
+        ) from ex
+
+    except asyncio.CancelledError:
+        raise
+
+    except Exception as ex:
+        LOGGER.exception("Unexpected exception")
+        raise AbortFlow("unknown_error") from ex
+
+    finally:
+        await energy_api.close()
+
+
 class RecoverableError(HomeAssistantError):
     """Raised when a connection has been failed but can be retried."""
 
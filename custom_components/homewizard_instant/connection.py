@@ -0,0 +1,141 @@
+"""Dedicated keep-alive HTTP connection for polling a single device."""
+
+from __future__ import annotations
+
+from collections import deque
+from time import monotonic
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import (
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+    ThreadedResolver,
+    TraceConfig,
+    TraceConnectionCreateEndParams,
+    TraceConnectionReuseconnParams,
+)
+from aiohttp.hdrs import USER_AGENT
+
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+
+from .const import (
+    CONNECT_TIMEOUT,
+    DNS_CACHE_TTL,
+    KEEPALIVE_TIMEOUT,
+    READ_TIMEOUT,
+    REQUEST_TIMEOUT,
+)
+
+DEVICE_TIMEOUT = ClientTimeout(
+    total=REQUEST_TIMEOUT, sock_connect=CONNECT_TIMEOUT, sock_read=READ_TIMEOUT
+)
+
+_HOUR = 3600.0
+
+
+class ConnectionStats:
+    """Count new and reused connections to the device."""
+
+    connections_created: int = 0
+    connections_reused: int = 0
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self._created_at: deque[float] = deque()
+
+    def record_created(self, now: float) -> None:
+        """Record a newly opened connection."""
+        self.connections_created += 1
+        self._created_at.append(now)
+        self._prune(now)
+
+    def record_reused(self) -> None:
+        """Record a request sent over a kept-alive connection."""
+        self.connections_reused += 1
+
+    def created_last_hour(self, now: float) -> int:
+        """Return the number of connections opened in the last hour."""
+        self._prune(now)
+        return len(self._created_at)
+
+    @property
+    def reuse_ratio(self) -> float | None:
+        """Return the share of requests that reused a connection."""
+        if not (total := self.connections_created + self.connections_reused):
+            return None
+
+        return self.connections_reused / total
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        """Return the statistics for diagnostics."""
+        return {
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "connections_created_last_hour": self.created_last_hour(now),
+            "reuse_ratio": self.reuse_ratio,
+        }
+
+    def _prune(self, now: float) -> None:
+        """Forget connections opened more than an hour ago."""
+        while self._created_at and self._created_at[0] <= now - _HOUR:
+            self._created_at.popleft()
+
+
+class DeviceConnection:
+    """Own the HTTP session used to poll a single device.
+
+    The shared Home Assistant session pools connections for every
+    integration. Polling once per second is cheaper over a single connection
+    that is kept alive between polls, so each device gets its own connector
+    limited to one connection. IP literals are never resolved; host names
+    are resolved in a thread and cached.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the connection."""
+        self.stats = ConnectionStats()
+
+        # aiohttp types its trace signals with the wrong callback signature
+        trace_config = TraceConfig()
+        trace_config.on_connection_create_end.append(
+            self._on_connection_created  # type: ignore[arg-type]
+        )
+        trace_config.on_connection_reuseconn.append(
+            self._on_connection_reused  # type: ignore[arg-type]
+        )
+
+        self.session = ClientSession(
+            connector=TCPConnector(
+                limit_per_host=1,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                resolver=ThreadedResolver(),
+            ),
+            headers={USER_AGENT: SERVER_SOFTWARE},
+            timeout=DEVICE_TIMEOUT,
+            trace_configs=[trace_config],
+        )
+
+    async def async_close(self) -> None:
+        """Close the session and its kept-alive connection."""
+        await self.session.close()
+
+    async def _on_connection_created(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceConnectionCreateEndParams,
+    ) -> None:
+        """Count a newly opened connection."""
+        self.stats.record_created(monotonic())
+
+    async def _on_connection_reused(
+        self,
+        session: ClientSession,
+        context: SimpleNamespace,
+        params: TraceConnectionReuseconnParams,
+    ) -> None:
+        """Count a reused connection."""
+        self.stats.record_reused()
@@ -18,5 +18,113 @@ LOGGER = logging.getLogger(__package__)
 CONF_PRODUCT_NAME = "product_name"
 CONF_PRODUCT_TYPE = "product_type"
 CONF_SERIAL = "serial"
+CONF_ENABLE_PUSH = "enable_push"
+CONF_MAX_UPDATE_INTERVAL = "max_update_interval"
+CONF_GRACE_FAILURES = "grace_failures"
+CONF_GRACE_PERIOD = "grace_period"
+CONF_METERS = "meters"
 
 UPDATE_INTERVAL = timedelta(seconds=1)
+REQUEST_TIMEOUT = 10
+SYSTEM_UPDATE_INTERVAL = timedelta(seconds=30)
+
+# Per device HTTP connection. Connect and read timeouts stay below the
+# fastest poll interval; the connection outlives the slowest one.
+CONNECT_TIMEOUT = 0.5
+READ_TIMEOUT = 0.9
+KEEPALIVE_TIMEOUT = 75
+DNS_CACHE_TTL = 300
+
+# Poll statistics sensors are written on their own interval, not every poll.
+POLL_STATISTICS_INTERVAL = timedelta(seconds=30)
+
+# One scheduler runs the polls of all meters. Meters are spread evenly over
+# each second and at most this many fetches run at the same time.
+SCHEDULER_MAX_CONCURRENT_POLLS = 4
+
+# Adaptive polling. The default ceiling keeps fast meters at 1 s; slow
+# meters are still polled in step with their own telegram cadence.
+DEFAULT_MAX_UPDATE_INTERVAL = 1
+MAX_UPDATE_INTERVAL_LIMIT = 60
+ADAPTIVE_BACKOFF_FACTOR = 1.5
+ADAPTIVE_CADENCE_SMOOTHING = 0.25
+ADAPTIVE_TELEGRAM_MARGIN = 0.2
+ADAPTIVE_VOLATILE_POWER_W = 25.0
+
+# Entities stay available with their last values until this many polls in a
+# row failed, or the last successful poll is this many seconds old.
+DEFAULT_GRACE_FAILURES = 3
+DEFAULT_GRACE_PERIOD = 30
+GRACE_FAILURES_LIMIT = 60
+GRACE_PERIOD_LIMIT = 600
+
+# Circuit breaker for an unreachable device. Polling backs off after a few
+# consecutive failures and probes the device with exponentially growing,
+# jittered delays until it answers again.
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_BACKOFF_MIN = timedelta(seconds=2)
+CIRCUIT_BACKOFF_MAX = timedelta(seconds=60)
+CIRCUIT_BACKOFF_JITTER = 0.2
+
+# Repeated poll failures are logged as one summary per interval.
+FAILURE_LOG_INTERVAL = timedelta(seconds=60)
+
+# Rolling statistics over the last 1, 5 and 15 minutes of samples.
+ROLLING_METRICS = ("power_w", "current_l1_a", "current_l2_a", "current_l3_a")
+ROLLING_WINDOWS = (60, 300, 900)
+ROLLING_BUFFER_SIZE = 1024
+
+# Local quarter-hour demand. Samples further apart are not bridged, and a
+# quarter only counts towards the monthly peak when mostly observed.
+DEMAND_PERIOD = 900
+DEMAND_MAX_GAP = 30
+DEMAND_MIN_COVERAGE = 0.9
+DEMAND_SAVE_DELAY = 10
+DEMAND_STORAGE_VERSION = 1
+
+# Locally integrated energy. Samples further apart are not bridged; the
+# totals may lead the meter totals by their resolution in Wh plus one
+# telegram, of the learned period or else the 10 s of DSMR 4.
+ENERGY_METRICS = ("power_w", "power_l1_w", "power_l2_w", "power_l3_w")
+ENERGY_MAX_GAP = 30
+ENERGY_METER_RESOLUTION = 1.0
+ENERGY_TELEGRAM_PERIOD = 10.0
+
+# Power samples of the last two hours are mirrored to disk, to backfill
+# hourly statistics the recorder missed. Only hours without a longer gap
+# between samples, or at their start or end, are backfilled.
+HISTORY_BUFFER_SIZE = 7200
+HISTORY_MAX_GAP = 60
+HISTORY_FLUSH_INTERVAL = timedelta(minutes=1)
+
+# Device snapshot cached to set up entities before the first poll.
+DEVICE_CACHE_SAVE_DELAY = 10
+DEVICE_CACHE_STORAGE_VERSION = 1
+
+# Aggregate meter. The meters are combined at whole seconds this long ago,
+# so most have a sample on both sides to interpolate between. A meter's last
+# value is held this long; energy totals need every meter to report them.
+AGGREGATE_POWER_METRICS = ("power_w", "power_l1_w", "power_l2_w", "power_l3_w")
+AGGREGATE_ENERGY_METRICS = ("energy_import_kwh", "energy_export_kwh")
+AGGREGATE_DELAY = 1.0
+AGGREGATE_MAX_AGE = 30
+AGGREGATE_BUFFER_SIZE = 4
+
+# API v2 push updates.
+PUSH_TOKEN_NAME = "home_assistant_instant"
+PUSH_UPDATE_INTERVAL = timedelta(seconds=30)
+PUSH_RECONNECT_INTERVAL = timedelta(seconds=5)
+PUSH_HEARTBEAT = timedelta(seconds=30)
+
+# Per sensor group write limits, all disabled by default.
+CONF_DEADBAND = "deadband"
+CONF_DEADBAND_TYPE = "deadband_type"
+CONF_MIN_WRITE_INTERVAL = "min_write_interval"
+DEADBAND_ABSOLUTE = "absolute"
+DEADBAND_RELATIVE = "relative"
+SENSOR_GROUPS = ("power", "voltage", "current", "frequency", "power_factor", "totals")
+MIN_WRITE_INTERVAL_LIMIT = 3600
+WRITE_SETTLE_DELAY = timedelta(seconds=30)
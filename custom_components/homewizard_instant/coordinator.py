@@ -2,16 +2,66 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
+from datetime import datetime, timedelta
+import math
+from time import monotonic, time
+
+from aiohttp import ClientSession
 from homewizard_energy import HomeWizardEnergy
-from homewizard_energy.errors import DisabledError, RequestError
-from homewizard_energy.models import CombinedModels as DeviceResponseEntry
+from homewizard_energy.errors import DisabledError, RequestError, UnsupportedError
+from homewizard_energy.models import (
+    CombinedModels as DeviceResponseEntry,
+    Device,
+    Measurement,
+    System,
+)
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, LOGGER, UPDATE_INTERVAL
+from .const import (
+    CONF_GRACE_FAILURES,
+    CONF_GRACE_PERIOD,
+    CONF_MAX_UPDATE_INTERVAL,
+    DEFAULT_GRACE_FAILURES,
+    DEFAULT_GRACE_PERIOD,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DEMAND_SAVE_DELAY,
+    DEVICE_CACHE_SAVE_DELAY,
+    DOMAIN,
+    ENERGY_METRICS,
+    ENERGY_TELEGRAM_PERIOD,
+    LOGGER,
+    PUSH_UPDATE_INTERVAL,
+    ROLLING_METRICS,
+    SYSTEM_UPDATE_INTERVAL,
+    UPDATE_INTERVAL,
+)
+from .aggregate import SIGNAL_MEASUREMENT
+from .connection import DeviceConnection
+from .demand import QuarterHourDemand, demand_store
+from .device_cache import cache_from_data, data_from_cache, device_cache_store
+from .energy import EnergyCounter
+from .extraction import ExtractionPlan, SensorSnapshot
+from .failure_log import FailureLog, is_timeout
+from .fastpath import MeasurementReader
+from .history import SampleHistory, history_path
+from .poll_stats import PollStatistics
+from .polling import (
+    AdaptivePollInterval,
+    AlignedTicker,
+    CircuitBreaker,
+    telegram_changed,
+)
+from .push import HomeWizardPushClient, async_create_ssl_context
+from .rolling import RollingSamples
+from .scheduler import async_get_scheduler
+from .write_limits import write_limits_from_options
 
 type HomeWizardConfigEntry = ConfigEntry[HWEnergyDeviceUpdateCoordinator]
 
@@ -21,14 +71,31 @@ class HWEnergyDeviceUpdateCoordinator(DataUpdateCoordinator[DeviceResponseEntry]
 
     api: HomeWizardEnergy
     api_disabled: bool = False
+    available: bool = True
+    consecutive_failures: int = 0
+    from_cache: bool = False
+    push: HomeWizardPushClient | None = None
+    state_writes: int = 0
+    state_writes_skipped: int = 0
 
     config_entry: HomeWizardConfigEntry
 
+    _device: Device | None = None
+    _system: System | None = None
+    _next_system_update: float = 0.0
+    _sampled: Measurement | None = None
+    _fetching: bool = False
+    _cache_saved: bool = False
+    _cancel_grace: CALLBACK_TYPE | None = None
+    # Unknown until the first poll, a previous setup may have left the issue
+    _api_disabled_issue: bool | None = None
+
     def __init__(
         self,
         hass: HomeAssistant,
         config_entry: HomeWizardConfigEntry,
         api: HomeWizardEnergy,
+        connection: DeviceConnection | None = None,
     ) -> None:
         """Initialize update coordinator."""
         super().__init__(
@@ -37,20 +104,282 @@ class HWEnergyDeviceUpdateCoordinator(DataUpdateCoordinator[DeviceResponseEntry]
             config_entry=config_entry,
             name=DOMAIN,
             update_interval=UPDATE_INTERVAL,
+            always_update=False,
         )
         self.api = api
+        self.connection = connection
+        self.reader = (
+            MeasurementReader(connection.session, api.host)
+            if connection is not None
+            else None
+        )
+        self.adaptive_interval = AdaptivePollInterval(
+            UPDATE_INTERVAL.total_seconds(),
+            config_entry.options.get(
+                CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL
+            ),
+        )
+        self.ticker = AlignedTicker()
+        self.scheduler = async_get_scheduler(hass)
+        self.scheduler.async_add(config_entry.title, self.ticker)
+        self.breaker = CircuitBreaker()
+        self.poll_stats = PollStatistics()
+        self.failure_log = FailureLog(LOGGER, config_entry.title)
+        self.grace_failures: int = config_entry.options.get(
+            CONF_GRACE_FAILURES, DEFAULT_GRACE_FAILURES
+        )
+        self.grace_period: float = config_entry.options.get(
+            CONF_GRACE_PERIOD, DEFAULT_GRACE_PERIOD
+        )
+        self._last_success = monotonic()
+        self.write_limits = write_limits_from_options(config_entry.options)
+        self.extraction = ExtractionPlan(())
+        self.snapshot: SensorSnapshot = ()
+        self.rolling = {metric: RollingSamples() for metric in ROLLING_METRICS}
+        self.demand = QuarterHourDemand()
+        self.energy = {metric: EnergyCounter() for metric in ENERGY_METRICS}
+        self._demand_store = demand_store(hass, config_entry.entry_id)
+        self.history = SampleHistory(history_path(hass, config_entry.entry_id))
+        self._cache_store = device_cache_store(hass, config_entry.entry_id)
+
+    async def async_restore(self) -> None:
+        """Restore the monthly demand peak and the recent power samples."""
+        if (data := await self._demand_store.async_load()) is not None:
+            self.demand.restore(data)
+        await self.hass.async_add_executor_job(self.history.load)
+
+    async def async_load_device_cache(self) -> bool:
+        """Start from the cached device snapshot, return if there was one.
+
+        Entities are set up from the snapshot right away and stay unavailable
+        until the first poll succeeded.
+        """
+        if (cache := await self._cache_store.async_load()) is None:
+            return False
+
+        try:
+            data = data_from_cache(cache)
+        except (KeyError, TypeError, ValueError) as err:
+            LOGGER.debug("Ignoring the cached snapshot of %s: %s", self.name, err)
+            return False
+
+        self.data = data
+        # The cached values are not samples
+        self._sampled = data.measurement
+        self.from_cache = True
+        self.available = False
+        self.last_update_success = False
+        self._last_success = -math.inf
+        return True
+
+    async def async_flush_history(self, _: object = None) -> None:
+        """Write the recent power samples to disk."""
+        await self.history.async_flush(self.hass)
+
+    @callback
+    def async_set_extraction(self, extraction: ExtractionPlan) -> None:
+        """Set the plan that extracts sensor values on each update."""
+        self.extraction = extraction
+        self.snapshot = extraction.extract(self.data)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Extract all sensor values once, then notify the entities."""
+        if self.data is not None:
+            if (measurement := self.data.measurement) is not self._sampled:
+                self._sampled = measurement
+                self._add_samples(measurement)
+            self.snapshot = self.extraction.extract(self.data)
+
+        super().async_update_listeners()
+
+    def _add_samples(self, measurement: Measurement) -> None:
+        """Add a new measurement to the statistics, demand, energy and history."""
+        now = monotonic()
+        wall_time = time()
+        for metric, samples in self.rolling.items():
+            if (value := getattr(measurement, metric)) is not None:
+                samples.add(now, value)
+
+        for metric, counter in self.energy.items():
+            if (value := getattr(measurement, metric)) is not None:
+                counter.add(now, value)
+        self.energy["power_w"].anchor(
+            measurement.energy_import_kwh,
+            measurement.energy_export_kwh,
+            self.adaptive_interval.cadence or ENERGY_TELEGRAM_PERIOD,
+        )
+
+        if (power := measurement.power_w) is not None:
+            self.history.add(wall_time, power)
+            if self.demand.add(wall_time, power):
+                self._demand_store.async_delay_save(
+                    self.demand.as_dict, DEMAND_SAVE_DELAY
+                )
+
+        # Aggregate meters align the measurements on the time they arrived
+        async_dispatcher_send(
+            self.hass,
+            SIGNAL_MEASUREMENT.format(self.config_entry.entry_id),
+            wall_time,
+            measurement,
+        )
+
+    async def async_shutdown(self) -> None:
+        """Cancel the grace period timer and stop refreshing."""
+        self._async_cancel_grace()
+        self.scheduler.async_remove(self.ticker)
+        await super().async_shutdown()
+
+    @property
+    def stale(self) -> bool:
+        """Return if entities show values from before a failed poll."""
+        return self.available and not self.last_update_success
+
+    @callback
+    def _async_refresh_finished(self) -> None:
+        """Count failed polls and update the availability of entities."""
+        if self.last_update_success:
+            self.consecutive_failures = 0
+        else:
+            self.consecutive_failures += 1
+
+        self._async_update_availability()
+
+        # Without a new measurement samples still age out of the windows
+        if self.data is None or self.data.measurement is self._sampled:
+            now = monotonic()
+            expired = False
+            for samples in self.rolling.values():
+                expired |= samples.expire(now)
+            if expired:
+                self.async_update_listeners()
+
+    @callback
+    def _async_update_availability(self, _now: datetime | None = None) -> None:
+        """Keep entities available during the grace period after a failure.
+
+        Entities become unavailable once grace_failures polls in a row failed
+        or the last successful poll is grace_period seconds old, whichever
+        comes first.
+        """
+        now = monotonic()
+        if self.last_update_success:
+            self.from_cache = False
+            self._last_success = now
+            self._async_cancel_grace()
+            available = True
+        else:
+            stale_for = now - self._last_success
+            available = (
+                self.consecutive_failures < self.grace_failures
+                and stale_for < self.grace_period
+            )
+            # Polls may back off, so end the grace period on time without one
+            if available and self._cancel_grace is None:
+                self._cancel_grace = async_call_later(
+                    self.hass,
+                    self.grace_period - stale_for,
+                    self._async_grace_expired,
+                )
+
+        if available is self.available:
+            return
+
+        self.available = available
+        # Listeners are not notified when a failed poll follows another one
+        if not self.last_update_success:
+            self.async_update_listeners()
+
+    @callback
+    def _async_grace_expired(self, _now: datetime) -> None:
+        """End the grace period once the data is too old."""
+        self._cancel_grace = None
+        self._async_update_availability()
+
+    @callback
+    def _async_cancel_grace(self) -> None:
+        """Cancel the grace period timer."""
+        if self._cancel_grace is not None:
+            self._cancel_grace()
+            self._cancel_grace = None
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next refresh on a wall-clock aligned tick.
+
+        The tick runs from the shared poll scheduler, at the offset within
+        the second it gave this meter.
+        """
+        if self._update_interval_seconds is None:
+            return
+
+        # A poll that was running during shutdown does not schedule another
+        if self.config_entry.pref_disable_polling or self._shutdown_requested:
+            return
+
+        self._async_unsub_refresh()
+
+        now = time()
+        tick = self.ticker.next_tick(now, self._update_interval_seconds)
+        self._unsub_refresh = self.scheduler.async_schedule(
+            self.hass.loop.time() + tick - now, self._async_handle_tick
+        )
+
+    @callback
+    def _async_handle_tick(self) -> None:
+        """Start a refresh for a tick."""
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self._handle_refresh_interval(),
+            name=f"{self.name} - {self.config_entry.title} - refresh",
+            eager_start=True,
+        )
+
+    async def _handle_refresh_interval(self, _now: datetime | None = None) -> None:
+        """Refresh on a tick unless a poll is still running."""
+        self.ticker.record_tick(time())
+
+        self._unsub_refresh = None
+
+        # The running poll schedules the next tick when it finishes
+        if self._fetching:
+            self.ticker.record_skipped()
+            return
+
+        await self._async_refresh(log_failures=False, scheduled=True)
+
+    async def async_refresh(self) -> None:
+        """Refresh data, leaving failure logging to the failure log."""
+        await self._async_refresh(log_failures=False, raise_on_auth_failed=True)
 
     async def _async_update_data(self) -> DeviceResponseEntry:
         """Fetch all device and sensor data from api."""
+        self._fetching = True
+        self.breaker.before_poll()
+        start = monotonic()
         try:
-            data = await self.api.combined()
+            async with self.scheduler.slot(self.ticker):
+                # Time the device, not the wait for a slot
+                start = monotonic()
+                data = await self._async_fetch()
 
         except RequestError as ex:
+            self._record_poll(start, ex)
+            self._log_failure(ex)
+            # Device info is fetched again once the device is reachable, which
+            # keeps the probe after a backoff to a single small request
+            self._device = None
+            if (backoff := self.breaker.record_failure()) is not None:
+                self.update_interval = timedelta(seconds=backoff)
             raise UpdateFailed(
                 ex, translation_domain=DOMAIN, translation_key="communication_error"
             ) from ex
 
         except DisabledError as ex:
+            self._record_poll(start, ex)
+            self._log_failure(ex)
+            self._device = None
             if not self.api_disabled:
                 self.api_disabled = True
 
@@ -63,9 +392,13 @@ class HWEnergyDeviceUpdateCoordinator(DataUpdateCoordinator[DeviceResponseEntry]
                     translation_key="local_api_disabled",
                     data={"entry_id": self.config_entry.entry_id},
                 )
+                self._api_disabled_issue = True
 
+                # Entities set up from the cache wait for the reauth instead
+                if self.from_cache:
+                    self.config_entry.async_start_reauth(self.hass)
                 # Do not reload when performing first refresh
-                if self.data is not None:
+                elif self.data is not None:
                     # Reload config entry to let init flow handle retrying and trigger reauth
                     self.hass.config_entries.async_schedule_reload(
                         self.config_entry.entry_id
@@ -75,8 +408,141 @@ class HWEnergyDeviceUpdateCoordinator(DataUpdateCoordinator[DeviceResponseEntry]
                 ex, translation_domain=DOMAIN, translation_key="api_disabled"
             ) from ex
 
+        finally:
+            self._fetching = False
+
+        self._record_poll(start)
+        self.breaker.record_success()
+        self.failure_log.success(monotonic())
+        # The recovery is reported by the failure log, not on every flap
+        self.last_update_success = True
         self.api_disabled = False
-        ir.async_delete_issue(self.hass, DOMAIN, "local_api_disabled")
+        if self._api_disabled_issue is not False:
+            ir.async_delete_issue(self.hass, DOMAIN, "local_api_disabled")
+            self._api_disabled_issue = False
+
+        # Refresh the cached snapshot once per setup
+        if not self._cache_saved:
+            self._cache_saved = True
+            self._cache_store.async_delay_save(
+                lambda: cache_from_data(self.data), DEVICE_CACHE_SAVE_DELAY
+            )
+
+        if self.push is None or not self.push.connected:
+            self.update_interval = timedelta(
+                seconds=self.adaptive_interval.update(monotonic(), data.measurement)
+            )
+        else:
+            self.update_interval = PUSH_UPDATE_INTERVAL
 
         self.data = data
         return data
+
+    def _log_failure(self, error: Exception) -> None:
+        """Log a failed poll, setup failures are logged by the config entry."""
+        if self.data is not None:
+            self.failure_log.failure(monotonic(), error)
+
+    def _record_poll(self, start: float, error: Exception | None = None) -> None:
+        """Record the latency and outcome of a poll."""
+        now = monotonic()
+        self.poll_stats.record(
+            now,
+            now - start,
+            success=error is None,
+            timeout=error is not None and is_timeout(error),
+        )
+
+    async def _async_fetch(self) -> DeviceResponseEntry:
+        """Fetch each endpoint on its own schedule and merge the latest results.
+
+        Measurements are fetched every tick unless they are pushed, system
+        info every SYSTEM_UPDATE_INTERVAL and device info only at startup or
+        after the device was unreachable. The previous data is returned as is
+        when nothing changed, so listeners are not notified for a repeated
+        telegram.
+        """
+        if self._device is None:
+            self._device = await self.api.device(reset_cache=True)
+
+        if self.data is not None and self.push is not None and self.push.connected:
+            measurement = self.data.measurement
+        elif self.reader is not None:
+            measurement = await self.reader.async_read()
+        else:
+            measurement = await self.api.measurement()
+
+        system_updated = False
+        if (now := monotonic()) >= self._next_system_update:
+            self._next_system_update = now + SYSTEM_UPDATE_INTERVAL.total_seconds()
+            try:
+                self._system = await self.api.system()
+            except UnsupportedError:
+                self._system = None
+                system_updated = True
+            except RequestError as ex:
+                # The measurement came through, keep the last system info
+                LOGGER.debug("Could not fetch system info of %s: %s", self.name, ex)
+            else:
+                system_updated = True
+
+        if (
+            self.data is not None
+            and self.data.device is self._device
+            and not system_updated
+            and not telegram_changed(self.data.measurement, measurement)
+        ):
+            return self.data
+
+        return DeviceResponseEntry(
+            device=self._device,
+            measurement=measurement,
+            system=self._system,
+            state=None,
+        )
+
+    async def async_start_push(self, session: ClientSession, token: str) -> None:
+        """Switch to WebSocket push updates with the stored API v2 token.
+
+        A token is only stored for devices that speak API v2, so the device is
+        not probed again. While it is unreachable the push client reconnects
+        and the coordinator keeps polling.
+        """
+        self.push = HomeWizardPushClient(
+            session,
+            f"wss://{self.api.host}/api/ws",
+            token,
+            ssl_context=await async_create_ssl_context(self.hass),
+            on_connect=self._async_push_connected,
+            on_measurement=self._async_push_measurement,
+            on_disconnect=self._async_push_disconnected,
+        )
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self.push.run(),
+            name=f"{DOMAIN} - {self.config_entry.title} - push",
+        )
+
+    @callback
+    def _async_push_connected(self) -> None:
+        """Slow down polling while measurements are pushed."""
+        LOGGER.debug("Push updates active for %s", self.api.host)
+        self.update_interval = PUSH_UPDATE_INTERVAL
+
+    @callback
+    def _async_push_disconnected(self) -> None:
+        """Fall back to polling every second until push reconnects."""
+        LOGGER.debug("Push updates lost for %s, polling instead", self.api.host)
+        self.update_interval = UPDATE_INTERVAL
+        self._schedule_refresh()
+
+    @callback
+    def _async_push_measurement(self, measurement: Measurement) -> None:
+        """Merge a pushed measurement into the coordinator data."""
+        if self.data is None:
+            return
+
+        self.data = replace(self.data, measurement=measurement)
+        self.last_update_success = True
+        self._async_update_availability()
+        self.async_update_listeners()
@@ -0,0 +1,131 @@
+"""Local quarter-hour average demand and monthly peak."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DEMAND_MAX_GAP,
+    DEMAND_MIN_COVERAGE,
+    DEMAND_PERIOD,
+    DEMAND_STORAGE_VERSION,
+    DOMAIN,
+)
+
+
+def demand_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store that keeps the monthly peak of a config entry."""
+    return Store(hass, DEMAND_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.demand")
+
+
+class QuarterHourDemand:
+    """Average the imported power per clock quarter-hour.
+
+    Each power sample is held until the next one, so the energy imported in
+    the quarter so far is known after every sample. The forecast assumes the
+    latest power holds until the quarter ends. Completed quarters update the
+    peak of the month they started in.
+    """
+
+    peak: float | None = None
+    peak_at: datetime | None = None
+
+    _month: str | None = None
+    _quarter_start: float | None = None
+    _last_time: float = 0.0
+    _power: float = 0.0
+    _energy: float = 0.0
+    _observed: float = 0.0
+
+    @property
+    def average(self) -> float | None:
+        """Return the average demand of the current quarter so far."""
+        if not self._observed:
+            return None
+
+        return self._energy / self._observed
+
+    @property
+    def forecast(self) -> float | None:
+        """Return the expected average demand at the end of the quarter."""
+        if self._quarter_start is None:
+            return None
+
+        remaining = self._quarter_start + DEMAND_PERIOD - self._last_time
+        return (self._energy + self._power * remaining) / (self._observed + remaining)
+
+    def add(self, now: float, power: float) -> bool:
+        """Add a power sample, return if the monthly peak changed."""
+        changed = False
+        quarter_start = now - now % DEMAND_PERIOD
+        if self._quarter_start is None:
+            self._quarter_start = quarter_start
+        elif 0 <= now - self._last_time <= DEMAND_MAX_GAP:
+            if now >= (end := self._quarter_start + DEMAND_PERIOD):
+                self._hold(end)
+                changed = self._finish_quarter(end)
+            self._hold(now)
+        elif quarter_start != self._quarter_start:
+            # Nothing is known about the gap, start over in the current quarter
+            if quarter_start > self._quarter_start:
+                changed = self._finish_quarter(self._quarter_start + DEMAND_PERIOD)
+            self._quarter_start = quarter_start
+            self._energy = 0.0
+            self._observed = 0.0
+
+        self._last_time = now
+        # Exported power does not count towards the demand
+        self._power = max(power, 0.0)
+        return changed
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the monthly peak to store."""
+        return {
+            "month": self._month,
+            "peak_w": self.peak,
+            "peak_at": self.peak_at.isoformat() if self.peak_at is not None else None,
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Restore a stored monthly peak."""
+        self._month = data["month"]
+        self.peak = data["peak_w"]
+        self.peak_at = (
+            dt_util.parse_datetime(peak_at)
+            if (peak_at := data["peak_at"]) is not None
+            else None
+        )
+
+    def _hold(self, until: float) -> None:
+        """Add the energy of the last power sample up to a time."""
+        elapsed = until - self._last_time
+        self._energy += self._power * elapsed
+        self._observed += elapsed
+        self._last_time = until
+
+    def _finish_quarter(self, end: float) -> bool:
+        """Close the current quarter, return if the monthly peak changed."""
+        observed = self._observed
+        average = self._energy / observed if observed else 0.0
+        self._quarter_start = end
+        self._energy = 0.0
+        self._observed = 0.0
+
+        if observed < DEMAND_PERIOD * DEMAND_MIN_COVERAGE:
+            return False
+
+        month = dt_util.as_local(
+            dt_util.utc_from_timestamp(end - DEMAND_PERIOD)
+        ).strftime("%Y-%m")
+        if month != self._month or self.peak is None or average > self.peak:
+            self._month = month
+            self.peak = average
+            self.peak_at = dt_util.utc_from_timestamp(end)
+            return True
+
+        return False
@@ -0,0 +1,83 @@
+"""Cached device snapshot to set up entities before the first poll."""
+
+from __future__ import annotations
+
+from dataclasses import fields
+from typing import Any
+
+from awesomeversion import AwesomeVersion
+from homewizard_energy.models import (
+    CombinedModels,
+    Device,
+    ExternalDevice,
+    Measurement,
+    System,
+)
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DEVICE_CACHE_STORAGE_VERSION, DOMAIN
+
+
+def device_cache_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store that keeps the device snapshot of a config entry."""
+    return Store(
+        hass, DEVICE_CACHE_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.device_cache"
+    )
+
+
+def _plain_fields(model: Any) -> dict[str, Any]:
+    """Return the fields of a model that hold a plain value."""
+    return {
+        field.name: value
+        for field in fields(model)
+        if isinstance(value := getattr(model, field.name), (bool, int, float, str))
+    }
+
+
+def cache_from_data(data: CombinedModels) -> dict[str, Any]:
+    """Return the parts of the device data that decide which entities exist."""
+    return {
+        "device": _plain_fields(data.device),
+        "measurement": _plain_fields(data.measurement),
+        "external_devices": {
+            unique_id: {"type": device.type, "unit": device.unit, "value": device.value}
+            for unique_id, device in (data.measurement.external_devices or {}).items()
+        },
+        "system": _plain_fields(data.system) if data.system is not None else None,
+    }
+
+
+def data_from_cache(cache: dict[str, Any]) -> CombinedModels:
+    """Rebuild device data from a cached snapshot.
+
+    Values that are not plain, such as timestamps, are left out. The
+    snapshot only decides which entities exist; its values are never shown.
+    """
+    device = dict(cache["device"])
+    device["api_version"] = AwesomeVersion(device["api_version"])
+    measurement = Measurement(**cache["measurement"])
+    if external_devices := cache["external_devices"]:
+        measurement.external_devices = {
+            unique_id: ExternalDevice(
+                unique_id=unique_id,
+                type=(
+                    ExternalDevice.DeviceType(external["type"])
+                    if external["type"] is not None
+                    else None
+                ),
+                value=external["value"],
+                unit=external["unit"],
+                timestamp=dt_util.utc_from_timestamp(0),
+            )
+            for unique_id, external in external_devices.items()
+        }
+
+    return CombinedModels(
+        device=Device(**device),
+        measurement=measurement,
+        state=None,
+        system=System(**cache["system"]) if cache["system"] is not None else None,
+    )
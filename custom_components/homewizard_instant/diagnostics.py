@@ -4,12 +4,15 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from dataclasses import asdict, is_dataclass
-from typing import Any
+from time import monotonic
+from typing import Any, cast
 
 from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.const import CONF_IP_ADDRESS
 from homeassistant.core import HomeAssistant
 
+from .aggregate import HomeWizardAggregateConfigEntry
+from .const import CONF_METERS
 from .coordinator import HomeWizardConfigEntry
 
 TO_REDACT = {
@@ -49,11 +52,32 @@ def _serialize_data(data: Any) -> dict[str, Any]:
     return {"value": data}
 
 
+def _aggregate_diagnostics(entry: HomeWizardAggregateConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for an aggregate meter."""
+    coordinator = entry.runtime_data
+    return {
+        "entry": {
+            "data": dict(entry.data),
+            "title": entry.title,
+        },
+        "data": coordinator.data,
+        "statistics": {
+            "scheduler": coordinator.ticker.as_dict(),
+        },
+    }
+
+
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: HomeWizardConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
-    data = entry.runtime_data.data
+    if CONF_METERS in entry.data:
+        return _aggregate_diagnostics(cast(HomeWizardAggregateConfigEntry, entry))
+
+    coordinator = entry.runtime_data
+    data = coordinator.data
+    connection = coordinator.connection
+    now = monotonic()
 
     return async_redact_data(
         {
@@ -64,6 +88,22 @@ async def async_get_config_entry_diagnostics(
                 "unique_id": entry.unique_id,
             },
             "data": _serialize_data(data),
+            "statistics": {
+                "state_writes": coordinator.state_writes,
+                "state_writes_skipped": coordinator.state_writes_skipped,
+                "polls": coordinator.poll_stats.as_dict(now),
+                "scheduler": coordinator.ticker.as_dict(),
+                "poll_scheduler": coordinator.scheduler.as_dict(),
+                "circuit_breaker": coordinator.breaker.as_dict(),
+                "availability": {
+                    "available": coordinator.available,
+                    "stale": coordinator.stale,
+                    "consecutive_failures": coordinator.consecutive_failures,
+                },
+                "connection": connection.stats.as_dict(now)
+                if connection is not None
+                else None,
+            },
         },
         TO_REDACT,
     )
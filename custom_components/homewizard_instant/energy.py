@@ -0,0 +1,93 @@
+"""Energy integrated locally from the power measurements."""
+
+from __future__ import annotations
+
+import math
+
+from .const import ENERGY_MAX_GAP, ENERGY_METER_RESOLUTION
+
+
+def _anchor(
+    value: float, total_kwh: float | None, previous_kwh: float | None, lead: float
+) -> tuple[float, float]:
+    """Return a counter in Wh corrected by a meter total, and its upper limit."""
+    # Meters report zero for totals they do not keep
+    if not total_kwh:
+        return value, math.inf
+
+    total = total_kwh * 1000
+    # Restart from the meter total when it went backwards, or when a counter
+    # restored from before a restart is too far ahead of it
+    if (previous_kwh is not None and total_kwh < previous_kwh) or (
+        previous_kwh is None and value > total + lead
+    ):
+        return total, total + lead
+
+    # Catch up when the meter counted more, never count down
+    return max(value, total), total + lead
+
+
+def _advance(value: float, energy: float, limit: float) -> float:
+    """Add energy in Wh to a counter without passing its limit or decreasing."""
+    return max(value, min(value + energy, limit))
+
+
+class EnergyCounter:
+    """Integrate power into imported and exported energy in Wh.
+
+    Each power sample is held until the next one. Anchored counters integrate
+    freely between meter totals, which lag by up to one telegram. They jump
+    ahead when the meter counted more, restart from the meter total when it
+    went backwards, and only pause when they lead it by more than the energy
+    of one telegram period at the current power, so they never decrease.
+    """
+
+    imported: float = 0.0
+    exported: float = 0.0
+
+    _last_time: float | None = None
+    _power: float = 0.0
+    _import_limit: float = math.inf
+    _export_limit: float = math.inf
+    _import_total: float | None = None
+    _export_total: float | None = None
+
+    def add(self, now: float, power: float) -> None:
+        """Add a power sample in W."""
+        if (last := self._last_time) is not None and now - last <= ENERGY_MAX_GAP:
+            energy = self._power * (now - last) / 3600
+            if energy >= 0:
+                self.imported = _advance(self.imported, energy, self._import_limit)
+            else:
+                self.exported = _advance(self.exported, -energy, self._export_limit)
+
+        self._last_time = now
+        self._power = power
+
+    def restore(
+        self, *, imported: float | None = None, exported: float | None = None
+    ) -> None:
+        """Continue from counters in Wh kept across a restart."""
+        # A counter anchored since is only restored as far as the meter allows
+        if imported is not None:
+            self.imported = max(self.imported, min(imported, self._import_limit))
+        if exported is not None:
+            self.exported = max(self.exported, min(exported, self._export_limit))
+
+    def anchor(
+        self, imported_kwh: float | None, exported_kwh: float | None, period: float
+    ) -> None:
+        """Correct drift against the meter totals in kWh.
+
+        The period is the time in seconds between telegrams of the meter.
+        """
+        # Allow for a late telegram as well as the resolution of the totals
+        lead = ENERGY_METER_RESOLUTION + abs(self._power) * 2 * period / 3600
+        self.imported, self._import_limit = _anchor(
+            self.imported, imported_kwh, self._import_total, lead
+        )
+        self.exported, self._export_limit = _anchor(
+            self.exported, exported_kwh, self._export_total, lead
+        )
+        self._import_total = imported_kwh or self._import_total
+        self._export_total = exported_kwh or self._export_total
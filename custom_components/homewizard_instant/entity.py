@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from homeassistant.const import ATTR_CONNECTIONS, ATTR_IDENTIFIERS
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC, DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -15,6 +18,8 @@ class HomeWizardEntity(CoordinatorEntity[HWEnergyDeviceUpdateCoordinator]):
 
     _attr_has_entity_name = True
 
+    _written_state: tuple[Any, ...] | None = None
+
     def __init__(self, coordinator: HWEnergyDeviceUpdateCoordinator) -> None:
         """Initialize the HomeWizard entity."""
         super().__init__(coordinator)
@@ -35,3 +40,38 @@ class HomeWizardEntity(CoordinatorEntity[HWEnergyDeviceUpdateCoordinator]):
             self._attr_device_info[ATTR_CONNECTIONS] = {
                 (CONNECTION_NETWORK_MAC, serial_number)
             }
+
+    async def async_added_to_hass(self) -> None:
+        """Remember the state written when the entity is added."""
+        await super().async_added_to_hass()
+        self._written_state = self._state_snapshot()
+
+    @property
+    def available(self) -> bool:
+        """Return if the coordinator data is recent enough to show."""
+        return self.coordinator.available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when the value or availability changed."""
+        snapshot = self._state_snapshot()
+        if snapshot == self._written_state or self._defer_write(snapshot):
+            self.coordinator.state_writes_skipped += 1
+            return
+
+        self._write_snapshot(snapshot)
+
+    @callback
+    def _write_snapshot(self, snapshot: tuple[Any, ...]) -> None:
+        """Write the state and remember what was written."""
+        self._written_state = snapshot
+        self.coordinator.state_writes += 1
+        self.async_write_ha_state()
+
+    def _state_snapshot(self) -> tuple[Any, ...]:
+        """Return the values that decide if the state must be written."""
+        return (self.available,)
+
+    def _defer_write(self, snapshot: tuple[Any, ...]) -> bool:
+        """Return if a changed state should not be written yet."""
+        return False
@@ -0,0 +1,72 @@
+"""Extract the values of all sensors from coordinator data in one pass."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
+
+from homewizard_energy.models import CombinedModels
+
+if TYPE_CHECKING:
+    from .sensor import HomeWizardSensorEntityDescription
+
+type SensorSnapshot = tuple[Any, ...]
+
+
+class ExtractionPlan:
+    """Extraction plan compiled once from the sensors created at setup.
+
+    Each sensor gets a fixed offset into the snapshot the plan builds per
+    update. Measurement fields come first and are read with a single
+    ``attrgetter`` call; sensors without a field follow and use their
+    ``value_fn``.
+    """
+
+    def __init__(
+        self, descriptions: Iterable[HomeWizardSensorEntityDescription]
+    ) -> None:
+        """Compile the plan."""
+        names: list[str] = []
+        fields: list[HomeWizardSensorEntityDescription] = []
+        computed: list[HomeWizardSensorEntityDescription] = []
+        for description in descriptions:
+            if description.field is None:
+                computed.append(description)
+            else:
+                names.append(description.field)
+                fields.append(description)
+
+        self.offsets: dict[str, int] = {
+            description.key: offset
+            for offset, description in enumerate([*fields, *computed])
+        }
+        self._converters: tuple[tuple[int, Callable[[Any], Any]], ...] = tuple(
+            (offset, description.convert)
+            for offset, description in enumerate(fields)
+            if description.convert is not None
+        )
+        self._value_fns: tuple[Callable[[CombinedModels], Any], ...] = tuple(
+            description.value_fn for description in computed
+        )
+
+        self._read_fields: Callable[[Any], tuple[Any, ...]] | None = None
+        if len(names) == 1:
+            getter = attrgetter(names[0])
+            self._read_fields = lambda measurement: (getter(measurement),)
+        elif names:
+            self._read_fields = attrgetter(*names)
+
+    def extract(self, data: CombinedModels) -> SensorSnapshot:
+        """Return the snapshot of all sensor values for this update."""
+        values = (
+            list(self._read_fields(data.measurement))
+            if self._read_fields is not None
+            else []
+        )
+
+        for offset, convert in self._converters:
+            values[offset] = convert(values[offset])
+
+        values.extend(value_fn(data) for value_fn in self._value_fns)
+        return tuple(values)
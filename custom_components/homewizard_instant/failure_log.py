@@ -0,0 +1,90 @@
+"""Rate limited logging of poll failures."""
+
+from __future__ import annotations
+
+import logging
+import math
+
+from .const import FAILURE_LOG_INTERVAL
+
+
+def is_timeout(error: BaseException) -> bool:
+    """Return if an error was caused by a timeout."""
+    cause: BaseException | None = error
+    while cause is not None:
+        if isinstance(cause, TimeoutError):
+            return True
+        cause = cause.__cause__
+
+    return False
+
+
+class FailureLog:
+    """Log poll failures without flooding the log.
+
+    The first failure is logged right away. Further failures within
+    FAILURE_LOG_INTERVAL are counted and logged as one summary per interval,
+    so a flapping connection writes at most a few lines a minute. Once a
+    failure was reported, the recovery is logged right away as well.
+    """
+
+    failing: bool = False
+
+    _reported: bool = False
+    _logged_at: float = -math.inf
+    _failures: int = 0
+    _timeouts: int = 0
+    _last_error: BaseException | None = None
+
+    def __init__(self, logger: logging.Logger, name: str) -> None:
+        """Initialize the failure log."""
+        self._logger = logger
+        self._name = name
+
+    def failure(self, now: float, error: BaseException) -> None:
+        """Record a failed poll."""
+        self.failing = True
+        interval_passed = now - self._logged_at >= FAILURE_LOG_INTERVAL.total_seconds()
+
+        if interval_passed and not self._failures:
+            self._logger.error("Error fetching %s data: %s", self._name, error)
+            self._logged_at = now
+            self._reported = True
+            return
+
+        self._failures += 1
+        self._timeouts += is_timeout(error)
+        self._last_error = error
+
+        if interval_passed:
+            self._log_summary(now)
+
+    def success(self, now: float) -> None:
+        """Record a successful poll."""
+        if not self.failing:
+            return
+
+        self.failing = False
+        if not self._reported:
+            return
+
+        if self._failures:
+            self._log_summary(now)
+        self._logger.info("Fetching %s data recovered", self._name)
+        self._reported = False
+
+    def _log_summary(self, now: float) -> None:
+        """Log the failures counted since the last message."""
+        self._logger.warning(
+            "%d failed polls of %s data in the last %d s (%d timeouts), last error: %s",
+            self._failures,
+            self._name,
+            round(now - self._logged_at),
+            self._timeouts,
+            self._last_error,
+        )
+        self._logged_at = now
+        self._reported = True
+        self._failures = 0
+        self._timeouts = 0
+        self._last_error = None
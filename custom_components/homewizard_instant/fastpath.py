@@ -0,0 +1,194 @@
+"""Fast path for reading measurements from the API v1 data endpoint."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import fields
+from datetime import datetime
+from http import HTTPStatus
+from typing import Any, Final
+
+from aiohttp import ClientError, ClientSession
+from homewizard_energy.errors import DisabledError, RequestError
+from homewizard_energy.models import ExternalDevice, Measurement
+
+from homeassistant.util.json import json_loads
+
+from .connection import DEVICE_TIMEOUT
+
+# API v1 keys that map onto a Measurement field, with the field type
+V1_FIELDS: Final[dict[str, tuple[str, Callable[[Any], Any]]]] = {
+    "wifi_ssid": ("wifi_ssid", str),
+    "wifi_strength": ("wifi_strength", int),
+    "smr_version": ("protocol_version", int),
+    "meter_model": ("meter_model", str),
+    "active_tariff": ("tariff", int),
+    "total_power_import_kwh": ("energy_import_kwh", float),
+    "total_power_import_t1_kwh": ("energy_import_t1_kwh", float),
+    "total_power_import_t2_kwh": ("energy_import_t2_kwh", float),
+    "total_power_import_t3_kwh": ("energy_import_t3_kwh", float),
+    "total_power_import_t4_kwh": ("energy_import_t4_kwh", float),
+    "total_power_export_kwh": ("energy_export_kwh", float),
+    "total_power_export_t1_kwh": ("energy_export_t1_kwh", float),
+    "total_power_export_t2_kwh": ("energy_export_t2_kwh", float),
+    "total_power_export_t3_kwh": ("energy_export_t3_kwh", float),
+    "total_power_export_t4_kwh": ("energy_export_t4_kwh", float),
+    "active_power_w": ("power_w", float),
+    "active_power_l1_w": ("power_l1_w", float),
+    "active_power_l2_w": ("power_l2_w", float),
+    "active_power_l3_w": ("power_l3_w", float),
+    "active_voltage_v": ("voltage_v", float),
+    "active_voltage_l1_v": ("voltage_l1_v", float),
+    "active_voltage_l2_v": ("voltage_l2_v", float),
+    "active_voltage_l3_v": ("voltage_l3_v", float),
+    "active_current_a": ("current_a", float),
+    "active_current_l1_a": ("current_l1_a", float),
+    "active_current_l2_a": ("current_l2_a", float),
+    "active_current_l3_a": ("current_l3_a", float),
+    "active_apparent_power_va": ("apparent_power_va", float),
+    "active_apparent_power_l1_va": ("apparent_power_l1_va", float),
+    "active_apparent_power_l2_va": ("apparent_power_l2_va", float),
+    "active_apparent_power_l3_va": ("apparent_power_l3_va", float),
+    "active_reactive_power_var": ("reactive_power_var", float),
+    "active_reactive_power_l1_var": ("reactive_power_l1_var", float),
+    "active_reactive_power_l2_var": ("reactive_power_l2_var", float),
+    "active_reactive_power_l3_var": ("reactive_power_l3_var", float),
+    "active_power_factor": ("power_factor", float),
+    "active_power_factor_l1": ("power_factor_l1", float),
+    "active_power_factor_l2": ("power_factor_l2", float),
+    "active_power_factor_l3": ("power_factor_l3", float),
+    "active_frequency_hz": ("frequency_hz", float),
+    "voltage_sag_l1_count": ("voltage_sag_l1_count", int),
+    "voltage_sag_l2_count": ("voltage_sag_l2_count", int),
+    "voltage_sag_l3_count": ("voltage_sag_l3_count", int),
+    "voltage_swell_l1_count": ("voltage_swell_l1_count", int),
+    "voltage_swell_l2_count": ("voltage_swell_l2_count", int),
+    "voltage_swell_l3_count": ("voltage_swell_l3_count", int),
+    "any_power_fail_count": ("any_power_fail_count", int),
+    "long_power_fail_count": ("long_power_fail_count", int),
+    "active_power_average_w": ("average_power_15m_w", float),
+    "montly_power_peak_w": ("monthly_power_peak_w", float),
+}
+
+_EXTERNAL_KEYS: Final = frozenset({"unique_id", "type", "timestamp", "value", "unit"})
+
+
+def _to_datetime(value: int | str) -> datetime:
+    """Parse a DSMR YYMMDDhhmmss timestamp without strptime."""
+    if not isinstance(value, int) or not 10**11 <= value < 10**12:
+        return Measurement.to_datetime(value)
+
+    digits = str(value)
+    return datetime(
+        2000 + int(digits[0:2]),
+        int(digits[2:4]),
+        int(digits[4:6]),
+        int(digits[6:8]),
+        int(digits[8:10]),
+        int(digits[10:12]),
+    )
+
+
+def _to_external_devices(devices: list[dict[str, Any]]) -> dict[str, ExternalDevice]:
+    """Convert external devices, leaving incomplete ones to the library."""
+    converted: dict[str, ExternalDevice] = {}
+    for item in devices:
+        if item.keys() != _EXTERNAL_KEYS or None in item.values():
+            converted |= Measurement.array_to_external_device_list([item])
+            continue
+
+        device = ExternalDevice.__new__(ExternalDevice)
+        device.__dict__ = {
+            "unique_id": Measurement.hex_to_readable(item["unique_id"]),
+            "type": ExternalDevice.DeviceType.__members__.get(item["type"].upper()),
+            "value": float(item["value"]),
+            "unit": str(item["unit"]),
+            "timestamp": _to_datetime(item["timestamp"]),
+        }
+        converted[f"{device.type}_{device.unique_id}"] = device
+
+    return converted
+
+
+# API v1 keys that need the library's own conversion
+V1_CONVERTED: Final[dict[str, tuple[str, Callable[[Any], Any]]]] = {
+    "unique_id": ("unique_id", Measurement.hex_to_readable),
+    "montly_power_peak_timestamp": ("monthly_power_peak_timestamp", _to_datetime),
+    "external": ("external_devices", _to_external_devices),
+}
+
+# API v1 keys that the library does not map onto a Measurement
+V1_IGNORED: Final = frozenset({"total_gas_m3", "gas_timestamp", "gas_unique_id"})
+
+_MAPPING: Final = V1_FIELDS | V1_CONVERTED
+_KNOWN: Final = frozenset(_MAPPING) | V1_IGNORED
+_DEFAULTS: Final = {field.name: field.default for field in fields(Measurement)}
+
+
+def decode_measurement(payload: bytes | str) -> Measurement:
+    """Decode an API v1 data response into a Measurement.
+
+    Known P1 payloads are mapped straight onto the model; anything else is
+    handed to the library so unknown fields keep its behaviour.
+    """
+    data = json_loads(payload)
+    if not isinstance(data, dict):
+        raise TypeError("Unexpected measurement payload")
+
+    if "wifi_ssid" not in data or not data.keys() <= _KNOWN:
+        return Measurement.from_dict(data)
+
+    values = _DEFAULTS.copy()
+    for key, value in data.items():
+        if (mapping := _MAPPING.get(key)) is not None:
+            field, convert = mapping
+            values[field] = None if value is None else convert(value)
+
+    # Meters without a total report tariff 1 as the total, like the library
+    if "total_power_import_kwh" not in data:
+        values["energy_import_kwh"] = values["energy_import_t1_kwh"]
+    if "total_power_export_kwh" not in data:
+        values["energy_export_kwh"] = values["energy_export_t1_kwh"]
+
+    if values["tariff"] not in (1, 2, 3, 4):
+        values["tariff"] = None
+
+    # Skip the generated __init__, every field is set from the defaults
+    measurement = Measurement.__new__(Measurement)
+    measurement.__dict__ = values
+    return measurement
+
+
+class MeasurementReader:
+    """Read measurements from /api/v1/data with the fast decode path."""
+
+    def __init__(self, session: ClientSession, host: str) -> None:
+        """Initialize the reader."""
+        self._session = session
+        self._url = f"http://{host}/api/v1/data"
+
+    async def async_read(self) -> Measurement:
+        """Fetch and decode the latest measurement."""
+        try:
+            async with self._session.get(self._url, timeout=DEVICE_TIMEOUT) as resp:
+                status = resp.status
+                body = await resp.read()
+        except (ClientError, TimeoutError) as ex:
+            raise RequestError(
+                f"Error occurred while communicating with {self._url}"
+            ) from ex
+
+        match status:
+            case HTTPStatus.OK:
+                pass
+            case HTTPStatus.FORBIDDEN:
+                raise DisabledError(
+                    "API disabled. API must be enabled in HomeWizard Energy app"
+                )
+            case _:
+                raise RequestError(f"API request error ({status})")
+
+        try:
+            return decode_measurement(body)
+        except (TypeError, ValueError) as ex:
+            raise RequestError(f"Invalid response from {self._url}") from ex
@@ -0,0 +1,225 @@
+"""Recent power samples kept on disk, and backfill of long-term statistics."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator
+from datetime import timedelta
+from functools import partial
+from pathlib import Path
+import struct
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_import_statistics,
+    statistics_during_period,
+)
+from homeassistant.const import UnitOfPower
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.recorder import get_instance
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, HISTORY_BUFFER_SIZE, HISTORY_MAX_GAP, LOGGER
+
+# Magic, size and the position after the last sample
+_HEADER = struct.Struct("<4sIQ")
+_MAGIC = b"HWS1"
+_HOUR = 3600
+
+
+def history_path(hass: HomeAssistant, entry_id: str) -> str:
+    """Return the file that keeps the power samples of a config entry."""
+    return hass.config.path(STORAGE_DIR, f"{DOMAIN}.{entry_id}.samples")
+
+
+async def async_remove_history(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove the power samples of a config entry."""
+    await hass.async_add_executor_job(
+        partial(Path(history_path(hass, entry_id)).unlink, missing_ok=True)
+    )
+
+
+class SampleHistory:
+    """Keep recent power samples in a ring buffer mirrored to a file.
+
+    The file holds a header followed by the timestamps and the values, each
+    laid out like the ring buffer. A flush only writes the slots added since
+    the previous flush, and the header last.
+    """
+
+    _end: int = 0
+    _flushed: int = 0
+    # The file is missing or unusable until loaded
+    _rewrite: bool = True
+
+    def __init__(self, path: str, size: int = HISTORY_BUFFER_SIZE) -> None:
+        """Initialize the history."""
+        self._path = path
+        self._size = size
+        self._times = array("d", bytes(8 * size))
+        self._values = array("f", bytes(4 * size))
+
+    def __len__(self) -> int:
+        """Return the number of samples held."""
+        return min(self._end, self._size)
+
+    def __iter__(self) -> Iterator[tuple[float, float]]:
+        """Return the samples from old to new."""
+        for position in range(max(0, self._end - self._size), self._end):
+            index = position % self._size
+            yield self._times[index], self._values[index]
+
+    def add(self, now: float, value: float) -> None:
+        """Add a sample."""
+        index = self._end % self._size
+        self._times[index] = now
+        self._values[index] = value
+        self._end += 1
+
+    def load(self) -> None:
+        """Load the samples from the file, in the executor."""
+        try:
+            data = Path(self._path).read_bytes()
+        except FileNotFoundError:
+            return
+        except OSError as err:
+            LOGGER.warning("Could not read power samples from %s: %s", self._path, err)
+            return
+
+        if len(data) != _HEADER.size + 12 * self._size or _HEADER.unpack_from(data)[
+            :2
+        ] != (_MAGIC, self._size):
+            LOGGER.debug("Ignoring power samples in an unknown format")
+            return
+
+        values_offset = _HEADER.size + 8 * self._size
+        self._times = array("d", data[_HEADER.size : values_offset])
+        self._values = array("f", data[values_offset:])
+        self._end = self._flushed = _HEADER.unpack_from(data)[2]
+        self._rewrite = False
+
+    async def async_flush(self, hass: HomeAssistant) -> None:
+        """Write the samples added since the last flush."""
+        end = self._end
+        if end == self._flushed:
+            return
+
+        # Copy the pending slots in the event loop, in at most two runs
+        size = self._size
+        chunks: list[tuple[int, bytes, bytes]] = []
+        position = max(self._flushed if not self._rewrite else 0, end - size)
+        while position < end:
+            index = position % size
+            count = min(end - position, size - index)
+            chunks.append(
+                (
+                    index,
+                    self._times[index : index + count].tobytes(),
+                    self._values[index : index + count].tobytes(),
+                )
+            )
+            position += count
+
+        create, self._rewrite, self._flushed = self._rewrite, False, end
+        try:
+            await hass.async_add_executor_job(self._write, end, chunks, create)
+        except OSError as err:
+            LOGGER.warning("Could not write power samples to %s: %s", self._path, err)
+            self._rewrite = True
+
+    def _write(
+        self, end: int, chunks: list[tuple[int, bytes, bytes]], create: bool
+    ) -> None:
+        """Write slots and the header to the file, in the executor."""
+        size = self._size
+        with open(self._path, "wb" if create else "r+b") as file:
+            if create:
+                file.truncate(_HEADER.size + 12 * size)
+            for index, times, values in chunks:
+                file.seek(_HEADER.size + 8 * index)
+                file.write(times)
+                file.seek(_HEADER.size + 8 * size + 4 * index)
+                file.write(values)
+            file.seek(0)
+            file.write(_HEADER.pack(_MAGIC, size, end))
+
+
+def hourly_statistics(
+    samples: Iterable[tuple[float, float]], before: float
+) -> list[StatisticData]:
+    """Return the mean, minimum and maximum per hour that ended before a time.
+
+    Hours the samples do not cover from start to end are left out, as their
+    statistics would only describe part of the hour.
+    """
+    hours: dict[float, list[float]] = {}
+    partial_hours: set[float] = set()
+    for time, value in samples:
+        start = time - time % _HOUR
+        if start + _HOUR > before:
+            continue
+        if (hour := hours.get(start)) is None:
+            hours[start] = [value, 1, value, value, time]
+            if time - start > HISTORY_MAX_GAP:
+                partial_hours.add(start)
+            continue
+        if time - hour[4] > HISTORY_MAX_GAP:
+            partial_hours.add(start)
+        hour[0] += value
+        hour[1] += 1
+        hour[2] = min(hour[2], value)
+        hour[3] = max(hour[3], value)
+        hour[4] = time
+
+    return [
+        StatisticData(
+            start=dt_util.utc_from_timestamp(start),
+            mean=total / count,
+            min=minimum,
+            max=maximum,
+        )
+        for start, (total, count, minimum, maximum, last) in sorted(hours.items())
+        if start not in partial_hours and start + _HOUR - last <= HISTORY_MAX_GAP
+    ]
+
+
+async def async_backfill_statistics(
+    hass: HomeAssistant, entity_id: str, history: SampleHistory
+) -> None:
+    """Import hourly power statistics the recorder does not have."""
+    # Statistics the recorder compiles for the hours it missed are queued at
+    # its start, let those win over the samples
+    await get_instance(hass).async_block_till_done()
+
+    now = dt_util.utcnow().timestamp()
+    if not (rows := hourly_statistics(history, now - now % _HOUR)):
+        return
+
+    recorded = await get_instance(hass).async_add_executor_job(
+        statistics_during_period,
+        hass,
+        rows[0]["start"],
+        rows[-1]["start"] + timedelta(hours=1),
+        {entity_id},
+        "hour",
+        None,
+        {"mean"},
+    )
+    known = {row["start"] for row in recorded.get(entity_id, ())}
+    if not (missing := [row for row in rows if row["start"].timestamp() not in known]):
+        return
+
+    LOGGER.debug("Backfilling %d hours of statistics for %s", len(missing), entity_id)
+    async_import_statistics(
+        hass,
+        StatisticMetaData(
+            has_mean=True,
+            has_sum=False,
+            name=None,
+            source="recorder",
+            statistic_id=entity_id,
+            unit_of_measurement=UnitOfPower.WATT,
+        ),
+        missing,
+    )
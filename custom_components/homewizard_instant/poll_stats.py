@@ -0,0 +1,137 @@
+"""Latency and throughput statistics for the poll loop."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import deque
+import math
+from typing import Any, Final
+
+# Upper bounds of the latency buckets in ms, ten per decade from 1 ms to 10 s
+LATENCY_BUCKETS: Final = tuple(round(10 ** (i / 10), 2) for i in range(41))
+_BUCKET_LABELS: Final = (*map(str, LATENCY_BUCKETS), "inf")
+
+_MINUTE = 60.0
+# Latency percentiles cover the polls of the current and the previous window
+_LATENCY_WINDOW = 600.0
+
+
+class PollStatistics:
+    """Record recent poll latency in fixed-size histograms, and poll outcomes.
+
+    Latency is counted in a histogram per ten-minute window. Only the current
+    and the previous window are kept, so percentiles follow changes in
+    latency instead of averaging over the whole uptime.
+    """
+
+    polls: int = 0
+    failures: int = 0
+    timeouts: int = 0
+
+    _window_end: float = -math.inf
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        # One bucket per bound plus one for slower polls
+        self._histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+        self._previous = [0] * (len(LATENCY_BUCKETS) + 1)
+        self._recent: deque[tuple[float, bool]] = deque()
+
+    def record(
+        self, now: float, latency: float, *, success: bool, timeout: bool = False
+    ) -> None:
+        """Record a finished poll and how long it took in seconds."""
+        self.polls += 1
+        if not success:
+            self.failures += 1
+        if timeout:
+            self.timeouts += 1
+
+        self._rotate(now)
+        self._histogram[bisect_left(LATENCY_BUCKETS, latency * 1000)] += 1
+        self._recent.append((now, success))
+        self._prune(now)
+
+    def latency_histogram(self, now: float) -> list[int]:
+        """Return the number of recent polls per latency bucket."""
+        self._rotate(now)
+        return [
+            previous + current
+            for previous, current in zip(self._previous, self._histogram, strict=True)
+        ]
+
+    def latency_percentile(self, now: float, quantile: float) -> float | None:
+        """Return the latency in ms below which the quantile of recent polls ended."""
+        histogram = self.latency_histogram(now)
+        if not (total := sum(histogram)):
+            return None
+
+        rank = quantile * total
+        seen = 0
+        for index, count in enumerate(histogram):
+            if not count or seen + count < rank:
+                seen += count
+                continue
+
+            if index == len(LATENCY_BUCKETS):
+                return LATENCY_BUCKETS[-1]
+
+            # Interpolate within the bucket
+            lower = LATENCY_BUCKETS[index - 1] if index else 0.0
+            upper = LATENCY_BUCKETS[index]
+            return round(lower + (upper - lower) * (rank - seen) / count, 1)
+
+        return LATENCY_BUCKETS[-1]  # pragma: no cover - rank never exceeds polls
+
+    def polls_per_minute(self, now: float) -> int:
+        """Return the number of polls finished in the last minute."""
+        self._prune(now)
+        return len(self._recent)
+
+    def error_rate(self, now: float) -> float | None:
+        """Return the percentage of polls in the last minute that failed."""
+        self._prune(now)
+        if not self._recent:
+            return None
+
+        failed = sum(1 for _, success in self._recent if not success)
+        return round(100 * failed / len(self._recent), 1)
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        """Return the statistics for diagnostics."""
+        return {
+            "polls": self.polls,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "latency_p50_ms": self.latency_percentile(now, 0.5),
+            "latency_p95_ms": self.latency_percentile(now, 0.95),
+            "latency_p99_ms": self.latency_percentile(now, 0.99),
+            "polls_per_minute": self.polls_per_minute(now),
+            "error_rate": self.error_rate(now),
+            "latency_histogram_ms": {
+                label: count
+                for label, count in zip(
+                    _BUCKET_LABELS, self.latency_histogram(now), strict=True
+                )
+                if count
+            },
+        }
+
+    def _rotate(self, now: float) -> None:
+        """Start a new latency window once the current one has ended."""
+        if now < self._window_end:
+            return
+
+        # The current window becomes the previous one, unless it ended
+        # longer than a window ago
+        if now < self._window_end + _LATENCY_WINDOW:
+            self._previous = self._histogram
+        else:
+            self._previous = [0] * len(self._histogram)
+        self._histogram = [0] * len(self._histogram)
+        self._window_end = now + _LATENCY_WINDOW
+
+    def _prune(self, now: float) -> None:
+        """Forget polls that finished more than a minute ago."""
+        while self._recent and self._recent[0][0] <= now - _MINUTE:
+            self._recent.popleft()
@@ -0,0 +1,279 @@
+"""Poll scheduling helpers for the HomeWizard coordinator."""
+
+from __future__ import annotations
+
+import math
+from random import uniform
+from typing import Any
+
+from homewizard_energy.models import Measurement
+
+from .const import (
+    ADAPTIVE_BACKOFF_FACTOR,
+    ADAPTIVE_CADENCE_SMOOTHING,
+    ADAPTIVE_TELEGRAM_MARGIN,
+    ADAPTIVE_VOLATILE_POWER_W,
+    CIRCUIT_BACKOFF_JITTER,
+    CIRCUIT_BACKOFF_MAX,
+    CIRCUIT_BACKOFF_MIN,
+    CIRCUIT_CLOSED,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+)
+
+
+def telegram_changed(previous: Measurement | None, current: Measurement) -> bool:
+    """Return if the measurement comes from a different meter telegram."""
+    if previous is None:
+        return True
+
+    if current.timestamp is not None:
+        return current.timestamp != previous.timestamp
+
+    return current != previous
+
+
+class AdaptivePollInterval:
+    """Pick the next poll interval from telegram cadence and power volatility.
+
+    Meters that publish slower than the minimum interval are polled just
+    after their next telegram is due, so skipped polls do not delay readings.
+    Faster meters are polled at the minimum interval while active power moves
+    and back off gradually up to the maximum while it is stable.
+    """
+
+    cadence: float | None = None
+    interval: float
+
+    _measurement: Measurement | None = None
+    _last_change: float | None = None
+
+    def __init__(self, minimum: float, maximum: float) -> None:
+        """Initialize the adaptive interval."""
+        self.minimum = minimum
+        self.maximum = max(minimum, maximum)
+        self.interval = minimum
+        self._backoff = minimum
+
+    def update(self, now: float, measurement: Measurement) -> float:
+        """Record a poll result and return the seconds until the next poll."""
+        previous = self._measurement
+        self._measurement = measurement
+
+        if changed := telegram_changed(previous, measurement):
+            self._learn_cadence(now, previous, measurement)
+            self._last_change = now
+
+            if previous is None or _is_volatile(previous, measurement):
+                self._backoff = self.minimum
+            else:
+                self._backoff *= ADAPTIVE_BACKOFF_FACTOR
+        else:
+            self._backoff *= ADAPTIVE_BACKOFF_FACTOR
+
+        self._backoff = min(self.maximum, self._backoff)
+
+        self.interval = self._next_interval(now, changed)
+        return self.interval
+
+    def _learn_cadence(
+        self, now: float, previous: Measurement | None, current: Measurement
+    ) -> None:
+        """Update the telegram cadence estimate."""
+        if previous is None or self._last_change is None:
+            return
+
+        if current.timestamp is not None and previous.timestamp is not None:
+            observed = (current.timestamp - previous.timestamp).total_seconds()
+        elif self.interval <= self.minimum:
+            # Only polls at the fastest rate tell us how often telegrams arrive
+            observed = now - self._last_change
+        else:
+            return
+
+        if observed <= 0:
+            return
+
+        if self.cadence is None:
+            self.cadence = observed
+        else:
+            self.cadence += ADAPTIVE_CADENCE_SMOOTHING * (observed - self.cadence)
+
+    def _next_interval(self, now: float, changed: bool) -> float:
+        """Return the interval until the next poll."""
+        if (
+            self.cadence is not None
+            and self._last_change is not None
+            and self.cadence > self.minimum * 1.5
+        ):
+            # Slow meter: check once at the fastest rate that no newer telegram
+            # follows, which corrects a cadence learned from identical readings
+            if changed:
+                return self.minimum
+
+            # Then poll right after the next telegram is due
+            wait = self._last_change + self.cadence + ADAPTIVE_TELEGRAM_MARGIN - now
+            return self.minimum if wait <= 0 else max(self.minimum, wait)
+
+        return self._backoff
+
+
+def _is_volatile(previous: Measurement, current: Measurement) -> bool:
+    """Return if active power moved more than the volatility threshold."""
+    if previous.power_w is None or current.power_w is None:
+        return previous.power_w is not current.power_w
+
+    return abs(current.power_w - previous.power_w) > ADAPTIVE_VOLATILE_POWER_W
+
+
+class AlignedTicker:
+    """Place poll ticks on whole wall-clock seconds plus an offset.
+
+    Ticks follow a fixed grid instead of the end of the previous poll, so the
+    poll rate does not drift under load. The poll scheduler gives each meter
+    its own offset within the second. Ticks that pass while a poll is still
+    running are skipped and counted rather than queued.
+    """
+
+    offset: float = 0.0
+    ticks: int = 0
+    missed_ticks: int = 0
+    jitter_last: float | None = None
+    jitter_max: float = 0.0
+    slot_waits: int = 0
+    slot_wait_max: float = 0.0
+
+    _tick: float | None = None
+    _jitter_total: float = 0.0
+
+    def next_tick(self, now: float, interval: float) -> float:
+        """Return the wall-clock time of the next tick."""
+        step = max(1, math.ceil(round(interval, 3)))
+        if self._tick is not None and self._tick > now:
+            # The clock stepped back, start a new grid from the current time.
+            # A pending tick is at most one step plus the offset ahead.
+            if self._tick - now > step + 1:
+                self._tick = None
+            # Keep a pending tick that has not fired yet
+            else:
+                return self._tick
+
+        # A changed offset applies from the next tick
+        second = math.floor(now if self._tick is None else self._tick)
+        tick = second + self.offset + step
+
+        if tick <= now:
+            missed = math.floor((now - tick) / step) + 1
+            self.missed_ticks += missed
+            tick += missed * step
+
+        self._tick = tick
+        return tick
+
+    def record_tick(self, now: float) -> None:
+        """Record how far a tick fired from its wall-clock second."""
+        if self._tick is None:
+            return
+
+        jitter = abs(now - self._tick)
+        self.ticks += 1
+        self.jitter_last = jitter
+        self.jitter_max = max(self.jitter_max, jitter)
+        self._jitter_total += jitter
+
+    def record_skipped(self) -> None:
+        """Record a tick skipped because a poll was still running."""
+        self.missed_ticks += 1
+
+    def record_wait(self, seconds: float) -> None:
+        """Record how long a poll waited for a free slot."""
+        self.slot_waits += 1
+        self.slot_wait_max = max(self.slot_wait_max, seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the tick statistics for diagnostics."""
+        return {
+            "offset_ms": _ms(self.offset),
+            "ticks": self.ticks,
+            "missed_ticks": self.missed_ticks,
+            "jitter_last_ms": _ms(self.jitter_last),
+            "jitter_mean_ms": _ms(self._jitter_total / self.ticks)
+            if self.ticks
+            else None,
+            "jitter_max_ms": _ms(self.jitter_max),
+            "slot_waits": self.slot_waits,
+            "slot_wait_max_ms": _ms(self.slot_wait_max),
+        }
+
+
+class CircuitBreaker:
+    """Back off from a device that stopped answering.
+
+    After CIRCUIT_FAILURE_THRESHOLD consecutive failures the circuit opens
+    and the next poll is delayed. The first poll after the delay is a probe
+    (half open). It starts with the small device info request, so a failure
+    costs a single request and doubles the delay up to CIRCUIT_BACKOFF_MAX.
+    Any successful poll closes the circuit again.
+    """
+
+    state: str = CIRCUIT_CLOSED
+    consecutive_failures: int = 0
+    opened: int = 0
+    probes: int = 0
+    failed_probes: int = 0
+    backoff: float | None = None
+
+    _exponent: int = 0
+
+    def before_poll(self) -> None:
+        """Turn the poll after an open period into a probe."""
+        if self.state == CIRCUIT_OPEN:
+            self.state = CIRCUIT_HALF_OPEN
+            self.probes += 1
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        self.state = CIRCUIT_CLOSED
+        self.consecutive_failures = 0
+        self.backoff = None
+        self._exponent = 0
+
+    def record_failure(self) -> float | None:
+        """Record a failed poll and return the backoff when the circuit opens."""
+        self.consecutive_failures += 1
+
+        if self.state == CIRCUIT_HALF_OPEN:
+            self.failed_probes += 1
+            self._exponent += 1
+        elif self.consecutive_failures >= CIRCUIT_FAILURE_THRESHOLD:
+            self.opened += 1
+        else:
+            return None
+
+        self.state = CIRCUIT_OPEN
+        delay = min(
+            CIRCUIT_BACKOFF_MAX.total_seconds(),
+            CIRCUIT_BACKOFF_MIN.total_seconds() * 2**self._exponent,
+        )
+        # Spread the probes of meters that dropped off at the same time
+        self.backoff = delay * uniform(
+            1 - CIRCUIT_BACKOFF_JITTER, 1 + CIRCUIT_BACKOFF_JITTER
+        )
+        return self.backoff
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the circuit state for diagnostics."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "opened": self.opened,
+            "probes": self.probes,
+            "failed_probes": self.failed_probes,
+            "backoff_s": None if self.backoff is None else round(self.backoff, 1),
+        }
+
+
+def _ms(seconds: float | None) -> float | None:
+    """Return seconds as milliseconds rounded for display."""
+    return None if seconds is None else round(seconds * 1000, 1)
@@ -0,0 +1,134 @@
+"""WebSocket push client for HomeWizard API v2 devices."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import ssl
+from typing import Any
+
+from aiohttp import ClientError, ClientSession, ClientWebSocketResponse, WSMsgType
+from homewizard_energy.errors import UnauthorizedError
+from homewizard_energy.models import Measurement
+from homewizard_energy.v2.cacert import CACERT
+
+from homeassistant.core import HomeAssistant
+
+from .const import LOGGER, PUSH_HEARTBEAT, PUSH_RECONNECT_INTERVAL
+
+
+def _build_ssl_context() -> ssl.SSLContext:
+    """Build an SSL context that trusts the HomeWizard device CA."""
+    context = ssl.create_default_context(cadata=CACERT)
+    context.verify_flags = ssl.VERIFY_X509_PARTIAL_CHAIN
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_REQUIRED
+    return context
+
+
+async def async_create_ssl_context(hass: HomeAssistant) -> ssl.SSLContext:
+    """Create the device SSL context without blocking the event loop."""
+    return await hass.async_add_executor_job(_build_ssl_context)
+
+
+class HomeWizardPushClient:
+    """Keep a WebSocket open to an API v2 device and forward measurements."""
+
+    connected: bool = False
+
+    def __init__(
+        self,
+        session: ClientSession,
+        url: str,
+        token: str,
+        *,
+        ssl_context: ssl.SSLContext | bool,
+        on_connect: Callable[[], None],
+        on_measurement: Callable[[Measurement], None],
+        on_disconnect: Callable[[], None],
+    ) -> None:
+        """Initialize the push client."""
+        self._session = session
+        self._url = url
+        self._token = token
+        self._ssl_context = ssl_context
+        self._on_connect = on_connect
+        self._on_measurement = on_measurement
+        self._on_disconnect = on_disconnect
+
+    async def run(self) -> None:
+        """Stay connected until cancelled or the token is rejected."""
+        try:
+            while True:
+                try:
+                    await self._listen()
+                except UnauthorizedError as ex:
+                    LOGGER.warning(
+                        "Push updates from %s rejected the stored token, "
+                        "falling back to polling: %s",
+                        self._url,
+                        ex,
+                    )
+                    return
+                except (ClientError, TimeoutError, ValueError) as ex:
+                    LOGGER.debug("Push connection to %s lost: %s", self._url, ex)
+
+                self._set_disconnected()
+                await asyncio.sleep(PUSH_RECONNECT_INTERVAL.total_seconds())
+        finally:
+            # Fall back to polling however the task ends
+            self._set_disconnected()
+
+    async def _listen(self) -> None:
+        """Authorize, subscribe and forward messages until the socket closes."""
+        async with self._session.ws_connect(
+            self._url,
+            ssl=self._ssl_context,
+            heartbeat=PUSH_HEARTBEAT.total_seconds(),
+        ) as websocket:
+            async for message in websocket:
+                if message.type is not WSMsgType.TEXT:
+                    break
+
+                await self._handle_message(websocket, message.json())
+
+    async def _handle_message(
+        self, websocket: ClientWebSocketResponse, message: Any
+    ) -> None:
+        """Handle a single message from the device."""
+        if not isinstance(message, dict):
+            LOGGER.debug("Skipping malformed message from %s: %r", self._url, message)
+            return
+
+        match message.get("type"):
+            case "authorization_requested":
+                await websocket.send_json({"type": "authorization", "data": self._token})
+            case "authorized":
+                await websocket.send_json({"type": "subscribe", "data": "measurement"})
+                self.connected = True
+                self._on_connect()
+            case "measurement":
+                try:
+                    measurement = Measurement.from_dict(message["data"])
+                except (LookupError, TypeError, ValueError) as ex:
+                    LOGGER.debug(
+                        "Skipping malformed measurement from %s: %r", self._url, ex
+                    )
+                    return
+                self._on_measurement(measurement)
+            case "error":
+                if not isinstance(data := message.get("data", {}), dict):
+                    LOGGER.debug(
+                        "Skipping malformed error from %s: %r", self._url, message
+                    )
+                    return
+                error = data.get("message", "unknown error")
+                if "unauthorized" in error:
+                    raise UnauthorizedError(error)
+                LOGGER.debug("Push error from %s: %s", self._url, error)
+
+    def _set_disconnected(self) -> None:
+        """Notify the owner once when an established connection drops."""
+        if self.connected:
+            self.connected = False
+            self._on_disconnect()
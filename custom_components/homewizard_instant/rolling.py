@@ -0,0 +1,144 @@
+"""Rolling window statistics over recent samples."""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from collections.abc import Iterable
+
+from .const import ROLLING_BUFFER_SIZE, ROLLING_WINDOWS
+
+
+class RollingSamples:
+    """Keep recent samples of a metric in a fixed-size ring buffer."""
+
+    _end: int = 0
+
+    def __init__(
+        self,
+        windows: Iterable[float] = ROLLING_WINDOWS,
+        size: int = ROLLING_BUFFER_SIZE,
+    ) -> None:
+        """Initialize the buffer and its windows."""
+        self._size = size
+        self._values = array("d", bytes(8 * size))
+        self._times = array("d", bytes(8 * size))
+        self.windows = {seconds: RollingWindow(self, seconds) for seconds in windows}
+
+    def __len__(self) -> int:
+        """Return the number of samples held."""
+        return min(self._end, self._size)
+
+    def value(self, position: int) -> float:
+        """Return the sample at a position."""
+        return self._values[position % self._size]
+
+    def time(self, position: int) -> float:
+        """Return when the sample at a position was taken."""
+        return self._times[position % self._size]
+
+    def add(self, now: float, value: float) -> None:
+        """Add a sample and update the windows."""
+        position = self._end
+        oldest = position + 1 - self._size
+
+        # Evict the sample in the slot that is about to be overwritten
+        for window in self.windows.values():
+            window.evict(oldest, now)
+
+        index = position % self._size
+        self._values[index] = value
+        self._times[index] = now
+        self._end = position + 1
+
+        for window in self.windows.values():
+            window.add(position, value)
+
+    def expire(self, now: float) -> bool:
+        """Drop samples older than their window, return if any were dropped."""
+        expired = False
+        for window in self.windows.values():
+            count = window.count
+            window.evict(self._end - self._size, now)
+            expired |= window.count != count
+
+        return expired
+
+
+class RollingWindow:
+    """Mean, minimum and maximum of the samples within a time window.
+
+    Every sample enters and leaves the window once. The sum is kept running,
+    and the candidates for minimum and maximum are kept in monotonic queues
+    of buffer positions, so each sample costs amortized O(1).
+    """
+
+    _start: int = 0
+    _end: int = 0
+    _sum: float = 0.0
+
+    def __init__(self, samples: RollingSamples, seconds: float) -> None:
+        """Initialize the window."""
+        self.seconds = seconds
+        self._samples = samples
+        self._minima: deque[int] = deque()
+        self._maxima: deque[int] = deque()
+
+    @property
+    def count(self) -> int:
+        """Return the number of samples in the window."""
+        return self._end - self._start
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of the samples in the window."""
+        if not (count := self._end - self._start):
+            return None
+
+        return self._sum / count
+
+    @property
+    def min(self) -> float | None:
+        """Return the smallest sample in the window."""
+        return self._samples.value(self._minima[0]) if self._minima else None
+
+    @property
+    def max(self) -> float | None:
+        """Return the largest sample in the window."""
+        return self._samples.value(self._maxima[0]) if self._maxima else None
+
+    def add(self, position: int, value: float) -> None:
+        """Add the sample at a buffer position."""
+        value_at = self._samples.value
+        self._end = position + 1
+        self._sum += value
+
+        minima = self._minima
+        while minima and value_at(minima[-1]) >= value:
+            minima.pop()
+        minima.append(position)
+
+        maxima = self._maxima
+        while maxima and value_at(maxima[-1]) <= value:
+            maxima.pop()
+        maxima.append(position)
+
+        self.evict(position + 1 - len(self._samples), self._samples.time(position))
+
+    def evict(self, oldest: int, now: float) -> None:
+        """Drop samples before a buffer position or older than the window."""
+        samples = self._samples
+        cutoff = now - self.seconds
+        start = self._start
+        while start < self._end and (start < oldest or samples.time(start) <= cutoff):
+            self._sum -= samples.value(start)
+            if self._minima[0] == start:
+                self._minima.popleft()
+            if self._maxima[0] == start:
+                self._maxima.popleft()
+            start += 1
+        self._start = start
+
+        if start == self._end:
+            # Do not carry rounding errors over to the next samples
+            self._sum = 0.0
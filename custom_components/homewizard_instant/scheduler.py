@@ -0,0 +1,162 @@
+"""Shared poll scheduler for all HomeWizard meters."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from functools import partial
+from heapq import heappop, heappush
+from itertools import count
+from time import get_clock_info, monotonic
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN, SCHEDULER_MAX_CONCURRENT_POLLS
+from .polling import AlignedTicker
+
+DATA_SCHEDULER: HassKey[PollScheduler] = HassKey(f"{DOMAIN}_scheduler")
+
+# The event loop runs timers up to its clock resolution early
+_CLOCK_RESOLUTION = get_clock_info("monotonic").resolution
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> PollScheduler:
+    """Return the poll scheduler shared by all config entries."""
+    if (scheduler := hass.data.get(DATA_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_SCHEDULER] = PollScheduler(hass.loop)
+
+    return scheduler
+
+
+class PollScheduler:
+    """Run the poll ticks of all meters from one timer.
+
+    Each meter gets its own offset within the second, spread evenly over all
+    meters, so a dozen meters polled every second do not fire in the same
+    loop iteration. At most max_polls fetches run at the same time, later
+    ones wait for a free slot. Offsets are reassigned when meters are added
+    or removed and take effect from their next tick.
+    """
+
+    active: int = 0
+    active_max: int = 0
+
+    _timer: asyncio.TimerHandle | None = None
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        max_polls: int = SCHEDULER_MAX_CONCURRENT_POLLS,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.max_polls = max_polls
+        self._loop = loop
+        self._slots = asyncio.Semaphore(max_polls)
+        self._meters: dict[AlignedTicker, str] = {}
+        # Heap of (loop time, key, action), cancelled keys are dropped lazily
+        self._queue: list[tuple[float, int, Callable[[], None]]] = []
+        self._pending: set[int] = set()
+        self._keys = count()
+
+    @callback
+    def async_add(self, name: str, ticker: AlignedTicker) -> None:
+        """Add a meter and spread the offsets of all meters again."""
+        self._meters[ticker] = name
+        self._async_spread()
+
+    @callback
+    def async_remove(self, ticker: AlignedTicker) -> None:
+        """Remove a meter and spread the offsets of the others again."""
+        if self._meters.pop(ticker, None) is not None:
+            self._async_spread()
+
+    @callback
+    def _async_spread(self) -> None:
+        """Give each meter an evenly spaced offset within the second."""
+        meters = len(self._meters)
+        for slot, ticker in enumerate(self._meters):
+            ticker.offset = slot / meters
+
+    @callback
+    def async_schedule(self, when: float, action: Callable[[], None]) -> CALLBACK_TYPE:
+        """Run an action at a loop time and return a callback to cancel it."""
+        key = next(self._keys)
+        heappush(self._queue, (when, key, action))
+        self._pending.add(key)
+        self._async_arm()
+        return partial(self._async_cancel, key)
+
+    @callback
+    def _async_cancel(self, key: int) -> None:
+        """Cancel a scheduled action."""
+        self._pending.discard(key)
+        self._async_arm()
+
+    @callback
+    def _async_arm(self) -> None:
+        """Set the timer to the earliest pending action."""
+        queue = self._queue
+        while queue and queue[0][1] not in self._pending:
+            heappop(queue)
+
+        if self._timer is not None:
+            if queue and self._timer.when() == queue[0][0]:
+                return
+            self._timer.cancel()
+            self._timer = None
+
+        if queue:
+            self._timer = self._loop.call_at(queue[0][0], self._async_run)
+
+    @callback
+    def _async_run(self) -> None:
+        """Run the actions that are due."""
+        self._timer = None
+        now = self._loop.time() + _CLOCK_RESOLUTION
+        queue = self._queue
+        while queue and queue[0][0] <= now:
+            _, key, action = heappop(queue)
+            if key in self._pending:
+                self._pending.discard(key)
+                action()
+
+        self._async_arm()
+
+    @asynccontextmanager
+    async def slot(self, ticker: AlignedTicker) -> AsyncIterator[None]:
+        """Hold one of the concurrent poll slots."""
+        waited = self._slots.locked()
+        start = monotonic()
+        async with self._slots:
+            if waited:
+                ticker.record_wait(monotonic() - start)
+
+            self.active += 1
+            self.active_max = max(self.active_max, self.active)
+            try:
+                yield
+            finally:
+                self.active -= 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the health of the schedule of all meters for diagnostics."""
+        meters = [
+            {"name": name, **ticker.as_dict()} for ticker, name in self._meters.items()
+        ]
+        return {
+            "meters": len(meters),
+            "max_concurrent_polls": self.max_polls,
+            "active_polls": self.active,
+            "active_polls_max": self.active_max,
+            "ticks": sum(meter["ticks"] for meter in meters),
+            "missed_ticks": sum(meter["missed_ticks"] for meter in meters),
+            "jitter_max_ms": max(
+                (meter["jitter_max_ms"] for meter in meters), default=None
+            ),
+            "slot_waits": sum(meter["slot_waits"] for meter in meters),
+            "per_meter": meters,
+        }
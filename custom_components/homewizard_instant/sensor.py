@@ -5,12 +5,16 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Final, TYPE_CHECKING, cast
+from decimal import Decimal
+from operator import attrgetter
+from time import monotonic
+from typing import Any, Final, TYPE_CHECKING, cast
 
 from homewizard_energy.models import CombinedModels, ExternalDevice
 
 from homeassistant.components import sensor as sensor_platform
 from homeassistant.components.sensor import (
+    RestoreSensor,
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
@@ -28,11 +32,14 @@ from homeassistant.const import (
     UnitOfFrequency,
     UnitOfPower,
     UnitOfReactivePower,
+    UnitOfTime,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from homeassistant.helpers.typing import StateType
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util.dt import utcnow
 from homeassistant.util.variance import ignore_variance
 
@@ -48,9 +55,24 @@ else:
             AddEntitiesCallback as AddConfigEntryEntitiesCallback,
         )
 
-from .const import DOMAIN
+from .aggregate import AggregateCoordinator, HomeWizardAggregateConfigEntry
+from .const import (
+    CONF_METERS,
+    DOMAIN,
+    ENERGY_METRICS,
+    LOGGER,
+    POLL_STATISTICS_INTERVAL,
+    ROLLING_METRICS,
+    ROLLING_WINDOWS,
+    WRITE_SETTLE_DELAY,
+)
 from .coordinator import HomeWizardConfigEntry, HWEnergyDeviceUpdateCoordinator
+from .demand import QuarterHourDemand
+from .energy import EnergyCounter
 from .entity import HomeWizardEntity
+from .extraction import ExtractionPlan
+from .poll_stats import PollStatistics
+from .write_limits import WriteLimits
 
 SENSOR_DEVICE_CLASS_UNITS = cast(
     "dict[SensorDeviceClass, set[str]]",
@@ -59,12 +81,32 @@ SENSOR_DEVICE_CLASS_UNITS = cast(
 
 PARALLEL_UPDATES = 1
 
+# Sensor group whose write limits apply to each device class
+SENSOR_GROUP_DEVICE_CLASSES: Final[dict[SensorDeviceClass, str]] = {
+    SensorDeviceClass.POWER: "power",
+    SensorDeviceClass.APPARENT_POWER: "power",
+    SensorDeviceClass.REACTIVE_POWER: "power",
+    SensorDeviceClass.VOLTAGE: "voltage",
+    SensorDeviceClass.CURRENT: "current",
+    SensorDeviceClass.FREQUENCY: "frequency",
+    SensorDeviceClass.POWER_FACTOR: "power_factor",
+    SensorDeviceClass.ENERGY: "totals",
+    SensorDeviceClass.GAS: "totals",
+    SensorDeviceClass.WATER: "totals",
+}
+
 
 @dataclass(frozen=True, kw_only=True)
 class HomeWizardSensorEntityDescription(SensorEntityDescription):
-    """Class describing HomeWizard sensor entities."""
+    """Class describing HomeWizard sensor entities.
+
+    Sensors that show a measurement field also set ``field`` and optionally
+    ``convert``, see ``measurement_description``.
+    """
 
     enabled_fn: Callable[[CombinedModels], bool] = lambda x: True
+    field: str | None = None
+    convert: Callable[[Any], StateType] | None = None
     has_fn: Callable[[CombinedModels], bool]
     value_fn: Callable[[CombinedModels], StateType | datetime]
 
@@ -77,6 +119,50 @@ class HomeWizardExternalSensorEntityDescription(SensorEntityDescription):
     device_name: str
 
 
+@dataclass(frozen=True, kw_only=True)
+class HomeWizardPollSensorEntityDescription(SensorEntityDescription):
+    """Class describing HomeWizard poll statistics sensor entities."""
+
+    value_fn: Callable[[PollStatistics, float], StateType]
+
+
+@dataclass(frozen=True, kw_only=True)
+class HomeWizardRollingSensorEntityDescription(SensorEntityDescription):
+    """Class describing HomeWizard rolling window sensor entities."""
+
+    metric: str
+    window: int
+    statistic: str
+
+
+@dataclass(frozen=True, kw_only=True)
+class HomeWizardDemandSensorEntityDescription(SensorEntityDescription):
+    """Class describing HomeWizard local demand sensor entities."""
+
+    value_fn: Callable[[QuarterHourDemand], StateType | datetime]
+
+
+@dataclass(frozen=True, kw_only=True)
+class HomeWizardEnergySensorEntityDescription(SensorEntityDescription):
+    """Class describing HomeWizard locally integrated energy sensor entities."""
+
+    metric: str
+    value_fn: Callable[[EnergyCounter], float]
+    restore_fn: Callable[[EnergyCounter, float], None]
+
+
+@dataclass(frozen=True, kw_only=True)
+class HomeWizardAggregateSensorEntityDescription(SensorEntityDescription):
+    """Class describing HomeWizard aggregate meter sensor entities."""
+
+    metric: str
+
+
+def none_if_zero(value: float | None) -> float | None:
+    """Treat a zero meter total as not reported."""
+    return value or None
+
+
 def to_percentage(value: float | None) -> float | None:
     """Convert 0..1 value to percentage when value is not None."""
     return value * 100 if value is not None else None
@@ -89,27 +175,44 @@ def uptime_to_datetime(value: int) -> datetime:
 
 uptime_to_stable_datetime = ignore_variance(uptime_to_datetime, timedelta(minutes=5))
 
+
+def measurement_description(
+    *,
+    field: str,
+    convert: Callable[[Any], StateType] | None = None,
+    has_fn: Callable[[CombinedModels], bool] | None = None,
+    **kwargs: Any,
+) -> HomeWizardSensorEntityDescription:
+    """Describe a sensor that shows a measurement field."""
+    getter = attrgetter(field)
+    value = convert or (lambda value: value)
+    return HomeWizardSensorEntityDescription(
+        field=field,
+        convert=convert,
+        has_fn=has_fn or (lambda data: getter(data.measurement) is not None),
+        value_fn=lambda data: value(getter(data.measurement)),
+        **kwargs,
+    )
+
+
 SENSORS: Final[tuple[HomeWizardSensorEntityDescription, ...]] = (
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="smr_version",
         translation_key="dsmr_version",
         entity_category=EntityCategory.DIAGNOSTIC,
-        has_fn=lambda data: data.measurement.protocol_version is not None,
-        value_fn=lambda data: data.measurement.protocol_version,
+        field="protocol_version",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="meter_model",
         translation_key="meter_model",
         entity_category=EntityCategory.DIAGNOSTIC,
-        has_fn=lambda data: data.measurement.meter_model is not None,
-        value_fn=lambda data: data.measurement.meter_model,
+        field="meter_model",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="unique_meter_id",
         translation_key="unique_meter_id",
         entity_category=EntityCategory.DIAGNOSTIC,
-        has_fn=lambda data: data.measurement.unique_id is not None,
-        value_fn=lambda data: data.measurement.unique_id,
+        field="unique_id",
     ),
     HomeWizardSensorEntityDescription(
         key="wifi_ssid",
@@ -127,9 +230,11 @@ SENSORS: Final[tuple[HomeWizardSensorEntityDescription, ...]] = (
         translation_key="active_tariff",
         has_fn=lambda data: data.measurement.tariff is not None,
         value_fn=(
-            lambda data: None
-            if data.measurement.tariff is None
-            else str(data.measurement.tariff)
+            lambda data: (
+                None
+                if data.measurement.tariff is None
+                else str(data.measurement.tariff)
+            )
         ),
         device_class=SensorDeviceClass.ENUM,
         options=["1", "2", "3", "4"],
@@ -142,13 +247,14 @@ SENSORS: Final[tuple[HomeWizardSensorEntityDescription, ...]] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
         has_fn=(
-            lambda data: data.system is not None
-            and data.system.wifi_strength_pct is not None
+            lambda data: (
+                data.system is not None and data.system.wifi_strength_pct is not None
+            )
         ),
         value_fn=(
-            lambda data: data.system.wifi_strength_pct
-            if data.system is not None
-            else None
+            lambda data: (
+                data.system.wifi_strength_pct if data.system is not None else None
+            )
         ),
     ),
     HomeWizardSensorEntityDescription(
@@ -159,23 +265,24 @@ SENSORS: Final[tuple[HomeWizardSensorEntityDescription, ...]] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
         has_fn=(
-            lambda data: data.system is not None
-            and data.system.wifi_rssi_db is not None
+            lambda data: (
+                data.system is not None and data.system.wifi_rssi_db is not None
+            )
         ),
         value_fn=(
             lambda data: data.system.wifi_rssi_db if data.system is not None else None
         ),
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="total_power_import_kwh",
         translation_key="total_energy_import_kwh",
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        has_fn=lambda data: data.measurement.energy_import_kwh is not None,
-        value_fn=lambda data: data.measurement.energy_import_kwh or None,
+        field="energy_import_kwh",
+        convert=none_if_zero,
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="total_power_import_t1_kwh",
         translation_key="total_energy_import_tariff_kwh",
         translation_placeholders={"tariff": "1"},
@@ -187,49 +294,50 @@ SENSORS: Final[tuple[HomeWizardSensorEntityDescription, ...]] = (
             data.measurement.energy_import_t1_kwh is not None
             and data.measurement.energy_import_t2_kwh is not None
         ),
-        value_fn=lambda data: data.measurement.energy_import_t1_kwh or None,
+        field="energy_import_t1_kwh",
+        convert=none_if_zero,
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="total_power_import_t2_kwh",
         translation_key="total_energy_import_tariff_kwh",
         translation_placeholders={"tariff": "2"},
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        has_fn=lambda data: data.measurement.energy_import_t2_kwh is not None,
-        value_fn=lambda data: data.measurement.energy_import_t2_kwh or None,
+        field="energy_import_t2_kwh",
+        convert=none_if_zero,
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="total_power_import_t3_kwh",
         translation_key="total_energy_import_tariff_kwh",
         translation_placeholders={"tariff": "3"},
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        has_fn=lambda data: data.measurement.energy_import_t3_kwh is not None,
-        value_fn=lambda data: data.measurement.energy_import_t3_kwh or None,
+        field="energy_import_t3_kwh",
+        convert=none_if_zero,
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="total_power_import_t4_kwh",
         translation_key="total_energy_import_tariff_kwh",
         translation_placeholders={"tariff": "4"},
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        has_fn=lambda data: data.measurement.energy_import_t4_kwh is not None,
-        value_fn=lambda data: data.measurement.energy_import_t4_kwh or None,
+        field="energy_import_t4_kwh",
+        convert=none_if_zero,
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="total_power_export_kwh",
         translation_key="total_energy_export_kwh",
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        has_fn=lambda data: data.measurement.energy_export_kwh is not None,
+        field="energy_export_kwh",
         enabled_fn=lambda data: data.measurement.energy_export_kwh != 0,
-        value_fn=lambda data: data.measurement.energy_export_kwh or None,
+        convert=none_if_zero,
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="total_power_export_t1_kwh",
         translation_key="total_energy_export_tariff_kwh",
         translation_placeholders={"tariff": "1"},
@@ -242,51 +350,51 @@ SENSORS: Final[tuple[HomeWizardSensorEntityDescription, ...]] = (
             and data.measurement.energy_export_t2_kwh is not None
         ),
         enabled_fn=lambda data: data.measurement.energy_export_t1_kwh != 0,
-        value_fn=lambda data: data.measurement.energy_export_t1_kwh or None,
+        field="energy_export_t1_kwh",
+        convert=none_if_zero,
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="total_power_export_t2_kwh",
         translation_key="total_energy_export_tariff_kwh",
         translation_placeholders={"tariff": "2"},
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        has_fn=lambda data: data.measurement.energy_export_t2_kwh is not None,
+        field="energy_export_t2_kwh",
         enabled_fn=lambda data: data.measurement.energy_export_t2_kwh != 0,
-        value_fn=lambda data: data.measurement.energy_export_t2_kwh or None,
+        convert=none_if_zero,
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="total_power_export_t3_kwh",
         translation_key="total_energy_export_tariff_kwh",
         translation_placeholders={"tariff": "3"},
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        has_fn=lambda data: data.measurement.energy_export_t3_kwh is not None,
+        field="energy_export_t3_kwh",
         enabled_fn=lambda data: data.measurement.energy_export_t3_kwh != 0,
-        value_fn=lambda data: data.measurement.energy_export_t3_kwh or None,
+        convert=none_if_zero,
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="total_power_export_t4_kwh",
         translation_key="total_energy_export_tariff_kwh",
         translation_placeholders={"tariff": "4"},
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        has_fn=lambda data: data.measurement.energy_export_t4_kwh is not None,
+        field="energy_export_t4_kwh",
         enabled_fn=lambda data: data.measurement.energy_export_t4_kwh != 0,
-        value_fn=lambda data: data.measurement.energy_export_t4_kwh or None,
+        convert=none_if_zero,
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="active_power_w",
         native_unit_of_measurement=UnitOfPower.WATT,
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=0,
-        has_fn=lambda data: data.measurement.power_w is not None,
-        value_fn=lambda data: data.measurement.power_w,
+        field="power_w",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="active_power_l1_w",
         translation_key="active_power_phase_w",
         translation_placeholders={"phase": "1"},
@@ -294,10 +402,9 @@ SENSORS: Final[tuple[HomeWizardSensorEntityDescription, ...]] = (
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=0,
-        has_fn=lambda data: data.measurement.power_l1_w is not None,
-        value_fn=lambda data: data.measurement.power_l1_w,
+        field="power_l1_w",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="active_power_l2_w",
         translation_key="active_power_phase_w",
         translation_placeholders={"phase": "2"},
@@ -305,10 +412,9 @@ SENSORS: Final[tuple[HomeWizardSensorEntityDescription, ...]] = (
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=0,
-        has_fn=lambda data: data.measurement.power_l2_w is not None,
-        value_fn=lambda data: data.measurement.power_l2_w,
+        field="power_l2_w",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="active_power_l3_w",
         translation_key="active_power_phase_w",
         translation_placeholders={"phase": "3"},
@@ -316,19 +422,17 @@ SENSORS: Final[tuple[HomeWizardSensorEntityDescription, ...]] = (
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
         suggested_display_precision=0,
-        has_fn=lambda data: data.measurement.power_l3_w is not None,
-        value_fn=lambda data: data.measurement.power_l3_w,
+        field="power_l3_w",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="active_voltage_v",
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        has_fn=lambda data: data.measurement.voltage_v is not None,
-        value_fn=lambda data: data.measurement.voltage_v,
+        field="voltage_v",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="active_voltage_l1_v",
         translation_key="active_voltage_phase_v",
         translation_placeholders={"phase": "1"},
@@ -336,10 +440,9 @@ SENSORS: Final[tuple[HomeWizardSensorEntityDescription, ...]] = (
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        has_fn=lambda data: data.measurement.voltage_l1_v is not None,
-        value_fn=lambda data: data.measurement.voltage_l1_v,
+        field="voltage_l1_v",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="active_voltage_l2_v",
         translation_key="active_voltage_phase_v",
         translation_placeholders={"phase": "2"},
@@ -347,10 +450,9 @@ SENSORS: Final[tuple[HomeWizardSensorEntityDescription, ...]] = (
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        has_fn=lambda data: data.measurement.voltage_l2_v is not None,
-        value_fn=lambda data: data.measurement.voltage_l2_v,
+        field="voltage_l2_v",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="active_voltage_l3_v",
         translation_key="active_voltage_phase_v",
         translation_placeholders={"phase": "3"},
@@ -358,19 +460,17 @@ SENSORS: Final[tuple[HomeWizardSensorEntityDescription, ...]] = (
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        has_fn=lambda data: data.measurement.voltage_l3_v is not None,
-        value_fn=lambda data: data.measurement.voltage_l3_v,
+        field="voltage_l3_v",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="active_current_a",
         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        has_fn=lambda data: data.measurement.current_a is not None,
-        value_fn=lambda data: data.measurement.current_a,
+        field="current_a",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="active_current_l1_a",
         translation_key="active_current_phase_a",
         translation_placeholders={"phase": "1"},
@@ -378,10 +478,9 @@ SENSORS: Final[tuple[HomeWizardSensorEntityDescription, ...]] = (
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        has_fn=lambda data: data.measurement.current_l1_a is not None,
-        value_fn=lambda data: data.measurement.current_l1_a,
+        field="current_l1_a",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="active_current_l2_a",
         translation_key="active_current_phase_a",
         translation_placeholders={"phase": "2"},
@@ -389,10 +488,9 @@ SENSORS: Final[tuple[HomeWizardSensorEntityDescription, ...]] = (
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        has_fn=lambda data: data.measurement.current_l2_a is not None,
-        value_fn=lambda data: data.measurement.current_l2_a,
+        field="current_l2_a",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="active_current_l3_a",
         translation_key="active_current_phase_a",
         translation_placeholders={"phase": "3"},
@@ -400,28 +498,25 @@ SENSORS: Final[tuple[HomeWizardSensorEntityDescription, ...]] = (
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        has_fn=lambda data: data.measurement.current_l3_a is not None,
-        value_fn=lambda data: data.measurement.current_l3_a,
+        field="current_l3_a",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="active_frequency_hz",
         native_unit_of_measurement=UnitOfFrequency.HERTZ,
         device_class=SensorDeviceClass.FREQUENCY,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        has_fn=lambda data: data.measurement.frequency_hz is not None,
-        value_fn=lambda data: data.measurement.frequency_hz,
+        field="frequency_hz",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="active_apparent_power_va",
         native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
         device_class=SensorDeviceClass.APPARENT_POWER,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        has_fn=lambda data: data.measurement.apparent_power_va is not None,
-        value_fn=lambda data: data.measurement.apparent_power_va,
+        field="apparent_power_va",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="active_apparent_power_l1_va",
         translation_key="active_apparent_power_phase_va",
         translation_placeholders={"phase": "1"},
@@ -429,10 +524,9 @@ SENSORS: Final[tuple[HomeWizardSensorEntityDescription, ...]] = (
         device_class=SensorDeviceClass.APPARENT_POWER,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        has_fn=lambda data: data.measurement.apparent_power_l1_va is not None,
-        value_fn=lambda data: data.measurement.apparent_power_l1_va,
+        field="apparent_power_l1_va",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="active_apparent_power_l2_va",
         translation_key="active_apparent_power_phase_va",
         translation_placeholders={"phase": "2"},
@@ -440,10 +534,9 @@ SENSORS: Final[tuple[HomeWizardSensorEntityDescription, ...]] = (
         device_class=SensorDeviceClass.APPARENT_POWER,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        has_fn=lambda data: data.measurement.apparent_power_l2_va is not None,
-        value_fn=lambda data: data.measurement.apparent_power_l2_va,
+        field="apparent_power_l2_va",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="active_apparent_power_l3_va",
         translation_key="active_apparent_power_phase_va",
         translation_placeholders={"phase": "3"},
@@ -451,19 +544,17 @@ SENSORS: Final[tuple[HomeWizardSensorEntityDescription, ...]] = (
         device_class=SensorDeviceClass.APPARENT_POWER,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        has_fn=lambda data: data.measurement.apparent_power_l3_va is not None,
-        value_fn=lambda data: data.measurement.apparent_power_l3_va,
+        field="apparent_power_l3_va",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="active_reactive_power_var",
         native_unit_of_measurement=UnitOfReactivePower.VOLT_AMPERE_REACTIVE,
         device_class=SensorDeviceClass.REACTIVE_POWER,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        has_fn=lambda data: data.measurement.reactive_power_var is not None,
-        value_fn=lambda data: data.measurement.reactive_power_var,
+        field="reactive_power_var",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="active_reactive_power_l1_var",
         translation_key="active_reactive_power_phase_var",
         translation_placeholders={"phase": "1"},
@@ -471,10 +562,9 @@ SENSORS: Final[tuple[HomeWizardSensorEntityDescription, ...]] = (
         device_class=SensorDeviceClass.REACTIVE_POWER,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        has_fn=lambda data: data.measurement.reactive_power_l1_var is not None,
-        value_fn=lambda data: data.measurement.reactive_power_l1_var,
+        field="reactive_power_l1_var",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="active_reactive_power_l2_var",
         translation_key="active_reactive_power_phase_var",
         translation_placeholders={"phase": "2"},
@@ -482,10 +572,9 @@ SENSORS: Final[tuple[HomeWizardSensorEntityDescription, ...]] = (
         device_class=SensorDeviceClass.REACTIVE_POWER,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        has_fn=lambda data: data.measurement.reactive_power_l2_var is not None,
-        value_fn=lambda data: data.measurement.reactive_power_l2_var,
+        field="reactive_power_l2_var",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="active_reactive_power_l3_var",
         translation_key="active_reactive_power_phase_var",
         translation_placeholders={"phase": "3"},
@@ -493,19 +582,18 @@ SENSORS: Final[tuple[HomeWizardSensorEntityDescription, ...]] = (
         device_class=SensorDeviceClass.REACTIVE_POWER,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        has_fn=lambda data: data.measurement.reactive_power_l3_var is not None,
-        value_fn=lambda data: data.measurement.reactive_power_l3_var,
+        field="reactive_power_l3_var",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="active_power_factor",
         native_unit_of_measurement=PERCENTAGE,
         device_class=SensorDeviceClass.POWER_FACTOR,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        has_fn=lambda data: data.measurement.power_factor is not None,
-        value_fn=lambda data: to_percentage(data.measurement.power_factor),
+        field="power_factor",
+        convert=to_percentage,
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="active_power_factor_l1",
         translation_key="active_power_factor_phase",
         translation_placeholders={"phase": "1"},
@@ -513,10 +601,10 @@ SENSORS: Final[tuple[HomeWizardSensorEntityDescription, ...]] = (
         device_class=SensorDeviceClass.POWER_FACTOR,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        has_fn=lambda data: data.measurement.power_factor_l1 is not None,
-        value_fn=lambda data: to_percentage(data.measurement.power_factor_l1),
+        field="power_factor_l1",
+        convert=to_percentage,
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="active_power_factor_l2",
         translation_key="active_power_factor_phase",
         translation_placeholders={"phase": "2"},
@@ -524,10 +612,10 @@ SENSORS: Final[tuple[HomeWizardSensorEntityDescription, ...]] = (
         device_class=SensorDeviceClass.POWER_FACTOR,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        has_fn=lambda data: data.measurement.power_factor_l2 is not None,
-        value_fn=lambda data: to_percentage(data.measurement.power_factor_l2),
+        field="power_factor_l2",
+        convert=to_percentage,
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="active_power_factor_l3",
         translation_key="active_power_factor_phase",
         translation_placeholders={"phase": "3"},
@@ -535,86 +623,76 @@ SENSORS: Final[tuple[HomeWizardSensorEntityDescription, ...]] = (
         device_class=SensorDeviceClass.POWER_FACTOR,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        has_fn=lambda data: data.measurement.power_factor_l3 is not None,
-        value_fn=lambda data: to_percentage(data.measurement.power_factor_l3),
+        field="power_factor_l3",
+        convert=to_percentage,
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="voltage_sag_l1_count",
         translation_key="voltage_sag_phase_count",
         translation_placeholders={"phase": "1"},
         entity_category=EntityCategory.DIAGNOSTIC,
-        has_fn=lambda data: data.measurement.voltage_sag_l1_count is not None,
-        value_fn=lambda data: data.measurement.voltage_sag_l1_count,
+        field="voltage_sag_l1_count",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="voltage_sag_l2_count",
         translation_key="voltage_sag_phase_count",
         translation_placeholders={"phase": "2"},
         entity_category=EntityCategory.DIAGNOSTIC,
-        has_fn=lambda data: data.measurement.voltage_sag_l2_count is not None,
-        value_fn=lambda data: data.measurement.voltage_sag_l2_count,
+        field="voltage_sag_l2_count",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="voltage_sag_l3_count",
         translation_key="voltage_sag_phase_count",
         translation_placeholders={"phase": "3"},
         entity_category=EntityCategory.DIAGNOSTIC,
-        has_fn=lambda data: data.measurement.voltage_sag_l3_count is not None,
-        value_fn=lambda data: data.measurement.voltage_sag_l3_count,
+        field="voltage_sag_l3_count",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="voltage_swell_l1_count",
         translation_key="voltage_swell_phase_count",
         translation_placeholders={"phase": "1"},
         entity_category=EntityCategory.DIAGNOSTIC,
-        has_fn=lambda data: data.measurement.voltage_swell_l1_count is not None,
-        value_fn=lambda data: data.measurement.voltage_swell_l1_count,
+        field="voltage_swell_l1_count",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="voltage_swell_l2_count",
         translation_key="voltage_swell_phase_count",
         translation_placeholders={"phase": "2"},
         entity_category=EntityCategory.DIAGNOSTIC,
-        has_fn=lambda data: data.measurement.voltage_swell_l2_count is not None,
-        value_fn=lambda data: data.measurement.voltage_swell_l2_count,
+        field="voltage_swell_l2_count",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="voltage_swell_l3_count",
         translation_key="voltage_swell_phase_count",
         translation_placeholders={"phase": "3"},
         entity_category=EntityCategory.DIAGNOSTIC,
-        has_fn=lambda data: data.measurement.voltage_swell_l3_count is not None,
-        value_fn=lambda data: data.measurement.voltage_swell_l3_count,
+        field="voltage_swell_l3_count",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="any_power_fail_count",
         translation_key="any_power_fail_count",
         entity_category=EntityCategory.DIAGNOSTIC,
-        has_fn=lambda data: data.measurement.any_power_fail_count is not None,
-        value_fn=lambda data: data.measurement.any_power_fail_count,
+        field="any_power_fail_count",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="long_power_fail_count",
         translation_key="long_power_fail_count",
         entity_category=EntityCategory.DIAGNOSTIC,
-        has_fn=lambda data: data.measurement.long_power_fail_count is not None,
-        value_fn=lambda data: data.measurement.long_power_fail_count,
+        field="long_power_fail_count",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="active_power_average_w",
         translation_key="active_power_average_w",
         native_unit_of_measurement=UnitOfPower.WATT,
         device_class=SensorDeviceClass.POWER,
-        has_fn=lambda data: data.measurement.average_power_15m_w is not None,
-        value_fn=lambda data: data.measurement.average_power_15m_w,
+        field="average_power_15m_w",
     ),
-    HomeWizardSensorEntityDescription(
+    measurement_description(
         key="monthly_power_peak_w",
         translation_key="monthly_power_peak_w",
         native_unit_of_measurement=UnitOfPower.WATT,
         device_class=SensorDeviceClass.POWER,
-        has_fn=lambda data: data.measurement.monthly_power_peak_w is not None,
-        value_fn=lambda data: data.measurement.monthly_power_peak_w,
+        field="monthly_power_peak_w",
     ),
     HomeWizardSensorEntityDescription(
         key="uptime",
@@ -675,19 +753,262 @@ EXTERNAL_SENSORS = {
 }
 
 
+POLL_SENSORS: Final[tuple[HomeWizardPollSensorEntityDescription, ...]] = (
+    HomeWizardPollSensorEntityDescription(
+        key="poll_latency_p50",
+        translation_key="poll_latency",
+        translation_placeholders={"percentile": "50"},
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda stats, now: stats.latency_percentile(now, 0.5),
+    ),
+    HomeWizardPollSensorEntityDescription(
+        key="poll_latency_p95",
+        translation_key="poll_latency",
+        translation_placeholders={"percentile": "95"},
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda stats, now: stats.latency_percentile(now, 0.95),
+    ),
+    HomeWizardPollSensorEntityDescription(
+        key="poll_latency_p99",
+        translation_key="poll_latency",
+        translation_placeholders={"percentile": "99"},
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda stats, now: stats.latency_percentile(now, 0.99),
+    ),
+    HomeWizardPollSensorEntityDescription(
+        key="polls_per_minute",
+        translation_key="polls_per_minute",
+        native_unit_of_measurement="polls/min",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda stats, now: stats.polls_per_minute(now),
+    ),
+    HomeWizardPollSensorEntityDescription(
+        key="poll_error_rate",
+        translation_key="poll_error_rate",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda stats, now: stats.error_rate(now),
+    ),
+)
+
+# Rolling mean, minimum and maximum of power and current per phase
+ROLLING_SENSORS: Final[tuple[HomeWizardRollingSensorEntityDescription, ...]] = tuple(
+    HomeWizardRollingSensorEntityDescription(
+        key=f"{key}_{statistic}_{window // 60}m",
+        translation_key=f"{translation_key}_{statistic}",
+        translation_placeholders={**placeholders, "window": str(window // 60)},
+        native_unit_of_measurement=unit,
+        device_class=device_class,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=precision,
+        entity_registry_enabled_default=metric == "power_w" and statistic == "mean",
+        metric=metric,
+        window=window,
+        statistic=statistic,
+    )
+    for metric, key, translation_key, placeholders, unit, device_class, precision in (
+        (
+            "power_w",
+            "active_power_w",
+            "active_power",
+            {},
+            UnitOfPower.WATT,
+            SensorDeviceClass.POWER,
+            0,
+        ),
+        *(
+            (
+                f"current_l{phase}_a",
+                f"active_current_l{phase}_a",
+                "active_current_phase",
+                {"phase": str(phase)},
+                UnitOfElectricCurrent.AMPERE,
+                SensorDeviceClass.CURRENT,
+                2,
+            )
+            for phase in (1, 2, 3)
+        ),
+    )
+    for window in ROLLING_WINDOWS
+    for statistic in ("mean", "min", "max")
+)
+
+DEMAND_SENSORS: Final[tuple[HomeWizardDemandSensorEntityDescription, ...]] = (
+    HomeWizardDemandSensorEntityDescription(
+        key="local_average_demand_w",
+        translation_key="local_average_demand_w",
+        native_unit_of_measurement=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda demand: demand.average,
+    ),
+    HomeWizardDemandSensorEntityDescription(
+        key="local_average_demand_forecast_w",
+        translation_key="local_average_demand_forecast_w",
+        native_unit_of_measurement=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        value_fn=lambda demand: demand.forecast,
+    ),
+    HomeWizardDemandSensorEntityDescription(
+        key="local_monthly_power_peak_w",
+        translation_key="local_monthly_power_peak_w",
+        native_unit_of_measurement=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.POWER,
+        suggested_display_precision=0,
+        value_fn=lambda demand: demand.peak,
+    ),
+    HomeWizardDemandSensorEntityDescription(
+        key="local_monthly_power_peak_timestamp",
+        translation_key="local_monthly_power_peak_timestamp",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda demand: demand.peak_at,
+    ),
+)
+
+# Energy integrated from total power, and from power per phase
+ENERGY_SENSORS: Final[tuple[HomeWizardEnergySensorEntityDescription, ...]] = (
+    HomeWizardEnergySensorEntityDescription(
+        key="local_energy_import_kwh",
+        translation_key="local_energy_import_kwh",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        suggested_display_precision=4,
+        metric="power_w",
+        value_fn=lambda counter: counter.imported / 1000,
+        restore_fn=lambda counter, value: counter.restore(imported=value * 1000),
+    ),
+    HomeWizardEnergySensorEntityDescription(
+        key="local_energy_export_kwh",
+        translation_key="local_energy_export_kwh",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        suggested_display_precision=4,
+        metric="power_w",
+        value_fn=lambda counter: counter.exported / 1000,
+        restore_fn=lambda counter, value: counter.restore(exported=value * 1000),
+    ),
+    *(
+        HomeWizardEnergySensorEntityDescription(
+            key=f"local_energy_{direction}_l{phase}_kwh",
+            translation_key=f"local_energy_{direction}_phase_kwh",
+            translation_placeholders={"phase": str(phase)},
+            native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+            device_class=SensorDeviceClass.ENERGY,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            suggested_display_precision=4,
+            entity_registry_enabled_default=False,
+            metric=f"power_l{phase}_w",
+            value_fn=value_fn,
+            restore_fn=restore_fn,
+        )
+        for phase in (1, 2, 3)
+        for direction, value_fn, restore_fn in (
+            (
+                "import",
+                lambda counter: counter.imported / 1000,
+                lambda counter, value: counter.restore(imported=value * 1000),
+            ),
+            (
+                "export",
+                lambda counter: counter.exported / 1000,
+                lambda counter, value: counter.restore(exported=value * 1000),
+            ),
+        )
+    ),
+)
+
+
+# Sums of the meters of an aggregate entry
+AGGREGATE_SENSORS: Final[tuple[HomeWizardAggregateSensorEntityDescription, ...]] = (
+    HomeWizardAggregateSensorEntityDescription(
+        key="active_power_w",
+        native_unit_of_measurement=UnitOfPower.WATT,
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        metric="power_w",
+    ),
+    *(
+        HomeWizardAggregateSensorEntityDescription(
+            key=f"active_power_l{phase}_w",
+            translation_key="active_power_phase_w",
+            translation_placeholders={"phase": str(phase)},
+            native_unit_of_measurement=UnitOfPower.WATT,
+            device_class=SensorDeviceClass.POWER,
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=0,
+            entity_registry_enabled_default=False,
+            metric=f"power_l{phase}_w",
+        )
+        for phase in (1, 2, 3)
+    ),
+    HomeWizardAggregateSensorEntityDescription(
+        key="total_power_import_kwh",
+        translation_key="total_energy_import_kwh",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        suggested_display_precision=3,
+        metric="energy_import_kwh",
+    ),
+    HomeWizardAggregateSensorEntityDescription(
+        key="total_power_export_kwh",
+        translation_key="total_energy_export_kwh",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        suggested_display_precision=3,
+        metric="energy_export_kwh",
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: HomeWizardConfigEntry,
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Initialize sensors."""
+    if CONF_METERS in entry.data:
+        aggregate = cast(HomeWizardAggregateConfigEntry, entry).runtime_data
+        async_add_entities(
+            HomeWizardAggregateSensorEntity(aggregate, description)
+            for description in AGGREGATE_SENSORS
+        )
+        return
 
-    # Initialize default sensors
-    entities: list[SensorEntity] = [
-        HomeWizardSensorEntity(entry.runtime_data, description)
+    # Initialize default sensors, extracting their values in one pass per update
+    descriptions = [
+        description
         for description in SENSORS
         if description.has_fn(entry.runtime_data.data)
     ]
+    entry.runtime_data.async_set_extraction(ExtractionPlan(descriptions))
+    entities: list[SensorEntity] = [
+        HomeWizardSensorEntity(entry.runtime_data, description)
+        for description in descriptions
+    ]
 
     # Initialize external devices (gas meters, water meters connected to P1)
     measurement = entry.runtime_data.data.measurement
@@ -703,10 +1024,172 @@ async def async_setup_entry(
                     )
                 )
 
+    # Initialize rolling window sensors for the metrics the device reports
+    entities.extend(
+        HomeWizardRollingSensorEntity(entry.runtime_data, description)
+        for description in ROLLING_SENSORS
+        if getattr(measurement, description.metric) is not None
+    )
+
+    # Initialize locally integrated energy sensors for the power reported
+    entities.extend(
+        HomeWizardEnergySensorEntity(entry.runtime_data, description)
+        for description in ENERGY_SENSORS
+        if getattr(measurement, description.metric) is not None
+    )
+
+    # Initialize local demand sensors when the device reports power
+    if measurement.power_w is not None:
+        entities.extend(
+            HomeWizardDemandSensorEntity(entry.runtime_data, description)
+            for description in DEMAND_SENSORS
+        )
+
+    # Initialize poll statistics sensors
+    entities.extend(
+        HomeWizardPollSensorEntity(entry.runtime_data, description)
+        for description in POLL_SENSORS
+    )
+
     async_add_entities(entities)
 
+    # Reload when the device reports other fields than the cached snapshot
+    coordinator = entry.runtime_data
+    if coordinator.from_cache:
+        layout = _sensor_layout(coordinator.data)
+
+        @callback
+        def _async_check_layout() -> None:
+            """Compare the first data from the device with the snapshot."""
+            if coordinator.from_cache:
+                return
+
+            remove_listener()
+            if _sensor_layout(coordinator.data) != layout:
+                LOGGER.debug("Sensors of %s changed, reloading", entry.title)
+                hass.config_entries.async_schedule_reload(entry.entry_id)
+
+        remove_listener = coordinator.async_add_listener(_async_check_layout)
+        entry.async_on_unload(remove_listener)
 
-class HomeWizardSensorEntity(HomeWizardEntity, SensorEntity):
+
+def _sensor_layout(data: CombinedModels) -> set[str]:
+    """Return the fields and devices that decide which sensors are created."""
+    measurement = data.measurement
+    return {
+        *(description.key for description in SENSORS if description.has_fn(data)),
+        *(
+            unique_id
+            for unique_id, device in (measurement.external_devices or {}).items()
+            if device.type in EXTERNAL_SENSORS
+        ),
+        *(
+            metric
+            for metric in (*ROLLING_METRICS, *ENERGY_METRICS)
+            if getattr(measurement, metric) is not None
+        ),
+    }
+
+
+class HomeWizardWriteLimitedSensorEntity(HomeWizardEntity, SensorEntity):
+    """Base for sensors that apply the write limits of their sensor group."""
+
+    _write_limits: WriteLimits | None = None
+    _written_at: float = 0.0
+    _settle_at: float = 0.0
+    _cancel_settle: CALLBACK_TYPE | None = None
+
+    def __init__(
+        self,
+        coordinator: HWEnergyDeviceUpdateCoordinator,
+        description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor and look up its write limits."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.config_entry.unique_id}_{description.key}"
+        if (device_class := description.device_class) is not None and (
+            group := SENSOR_GROUP_DEVICE_CLASSES.get(device_class)
+        ) is not None:
+            self._write_limits = coordinator.write_limits.get(group)
+
+    async def async_added_to_hass(self) -> None:
+        """Start the write interval when the entity is added."""
+        await super().async_added_to_hass()
+        self._written_at = monotonic()
+        self.async_on_remove(self._async_cancel_settle)
+
+    @property
+    def available(self) -> bool:
+        """Return availability of meter."""
+        return super().available and self.native_value is not None
+
+    def _state_snapshot(self) -> tuple[Any, ...]:
+        """Return the value and availability to compare between updates."""
+        return (self.available, self.native_value)
+
+    def _defer_write(self, snapshot: tuple[Any, ...]) -> bool:
+        """Hold back numeric changes within the deadband or write interval."""
+        if (limits := self._write_limits) is None or self._written_state is None:
+            return False
+
+        available, value, *other = snapshot
+        written_available, written_value, *written_other = self._written_state
+        if (
+            available is not written_available
+            or other != written_other
+            or not isinstance(value, (int, float))
+            or not isinstance(written_value, (int, float))
+        ):
+            return False
+
+        wait = self._written_at + limits.min_interval - monotonic()
+        if not limits.exceeds_deadband(written_value, value):
+            # Publish where it moved to after a while, even if it keeps moving
+            self._async_schedule_settle(max(WRITE_SETTLE_DELAY.total_seconds(), wait))
+            return True
+
+        if wait > 0:
+            self._async_schedule_settle(wait)
+            return True
+
+        return False
+
+    @callback
+    def _write_snapshot(self, snapshot: tuple[Any, ...]) -> None:
+        """Write the state and restart the write interval."""
+        self._async_cancel_settle()
+        self._written_at = monotonic()
+        super()._write_snapshot(snapshot)
+
+    @callback
+    def _async_schedule_settle(self, delay: float) -> None:
+        """Write the latest value after the delay, unless a write is due sooner."""
+        settle_at = monotonic() + delay
+        # Later changes do not push back a pending write
+        if self._cancel_settle is not None and self._settle_at <= settle_at:
+            return
+
+        self._async_cancel_settle()
+        self._settle_at = settle_at
+        self._cancel_settle = async_call_later(self.hass, delay, self._async_settle)
+
+    @callback
+    def _async_cancel_settle(self) -> None:
+        """Cancel a pending settle write."""
+        if self._cancel_settle is not None:
+            self._cancel_settle()
+            self._cancel_settle = None
+
+    @callback
+    def _async_settle(self, _now: datetime) -> None:
+        """Write the value a held back change settled on."""
+        self._cancel_settle = None
+        if (snapshot := self._state_snapshot()) != self._written_state:
+            self._write_snapshot(snapshot)
+
+
+class HomeWizardSensorEntity(HomeWizardWriteLimitedSensorEntity):
     """Representation of a HomeWizard Sensor."""
 
     entity_description: HomeWizardSensorEntityDescription
@@ -717,24 +1200,84 @@ class HomeWizardSensorEntity(HomeWizardEntity, SensorEntity):
         description: HomeWizardSensorEntityDescription,
     ) -> None:
         """Initialize Sensor Domain."""
-        super().__init__(coordinator)
-        self.entity_description = description
-        self._attr_unique_id = f"{coordinator.config_entry.unique_id}_{description.key}"
+        super().__init__(coordinator, description)
         if not description.enabled_fn(self.coordinator.data):
             self._attr_entity_registry_enabled_default = False
+        self._offset = coordinator.extraction.offsets[description.key]
 
     @property
     def native_value(self) -> StateType | datetime | None:
-        """Return the sensor value."""
-        return self.entity_description.value_fn(self.coordinator.data)
+        """Return the sensor value from the coordinator snapshot."""
+        return self.coordinator.snapshot[self._offset]  # type: ignore[no-any-return]
+
+
+class HomeWizardRollingSensorEntity(HomeWizardWriteLimitedSensorEntity):
+    """Representation of a rolling window statistic of a HomeWizard Sensor."""
+
+    entity_description: HomeWizardRollingSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: HWEnergyDeviceUpdateCoordinator,
+        description: HomeWizardRollingSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, description)
+        self._window = coordinator.rolling[description.metric].windows[
+            description.window
+        ]
+        self._statistic = attrgetter(description.statistic)
 
     @property
-    def available(self) -> bool:
-        """Return availability of meter."""
-        return super().available and self.native_value is not None
+    def native_value(self) -> float | None:
+        """Return the statistic over the window."""
+        return self._statistic(self._window)  # type: ignore[no-any-return]
+
+
+class HomeWizardDemandSensorEntity(HomeWizardWriteLimitedSensorEntity):
+    """Representation of a locally computed HomeWizard demand sensor."""
+
+    entity_description: HomeWizardDemandSensorEntityDescription
+
+    @property
+    def native_value(self) -> StateType | datetime:
+        """Return the demand value."""
+        return self.entity_description.value_fn(self.coordinator.demand)
+
+
+class HomeWizardEnergySensorEntity(HomeWizardWriteLimitedSensorEntity, RestoreSensor):
+    """Representation of a locally integrated HomeWizard energy sensor.
 
+    The counters continue from their last state after a restart, so they do
+    not look like a meter reset to long-term statistics.
+    """
 
-class HomeWizardExternalSensorEntity(HomeWizardEntity, SensorEntity):
+    entity_description: HomeWizardEnergySensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: HWEnergyDeviceUpdateCoordinator,
+        description: HomeWizardEnergySensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, description)
+        self._counter = coordinator.energy[description.metric]
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the counter from the last state."""
+        await super().async_added_to_hass()
+        if (last := await self.async_get_last_sensor_data()) is not None and isinstance(
+            last.native_value, int | float | Decimal
+        ):
+            self.entity_description.restore_fn(self._counter, float(last.native_value))
+
+    @property
+    def native_value(self) -> float:
+        """Return the energy in kWh."""
+        return self.entity_description.value_fn(self._counter)
+
+
+class HomeWizardExternalSensorEntity(HomeWizardWriteLimitedSensorEntity):
     """Representation of externally connected HomeWizard Sensor."""
 
     def __init__(
@@ -744,10 +1287,13 @@ class HomeWizardExternalSensorEntity(HomeWizardEntity, SensorEntity):
         device_unique_id: str,
     ) -> None:
         """Initialize Externally connected HomeWizard Sensors."""
-        super().__init__(coordinator)
-        self.entity_description = description
+        super().__init__(coordinator, description)
         self._device_id = device_unique_id
         self._suggested_device_class = description.suggested_device_class
+        if (
+            group := SENSOR_GROUP_DEVICE_CLASSES.get(description.suggested_device_class)
+        ) is not None:
+            self._write_limits = coordinator.write_limits.get(group)
         self._attr_unique_id = f"{DOMAIN}_{device_unique_id}"
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, f"{DOMAIN}_{device_unique_id}")},
@@ -779,7 +1325,8 @@ class HomeWizardExternalSensorEntity(HomeWizardEntity, SensorEntity):
     @property
     def available(self) -> bool:
         """Return availability of meter."""
-        return super().available and self.device is not None
+        # A meter without a value is shown as unknown, not unavailable
+        return self.coordinator.available and self.device is not None
 
     @property
     def native_unit_of_measurement(self) -> str | None:
@@ -803,3 +1350,95 @@ class HomeWizardExternalSensorEntity(HomeWizardEntity, SensorEntity):
             return None
 
         return self._suggested_device_class
+
+    def _state_snapshot(self) -> tuple[Any, ...]:
+        """Return the value, unit and availability to compare between updates."""
+        return (self.available, self.native_value, self.native_unit_of_measurement)
+
+
+class HomeWizardPollSensorEntity(HomeWizardEntity, SensorEntity):
+    """Representation of a HomeWizard poll statistics sensor."""
+
+    entity_description: HomeWizardPollSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: HWEnergyDeviceUpdateCoordinator,
+        description: HomeWizardPollSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.config_entry.unique_id}_{description.key}"
+
+    async def async_added_to_hass(self) -> None:
+        """Write the statistics on their own interval."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass, self._async_write_statistics, POLL_STATISTICS_INTERVAL
+            )
+        )
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the statistic."""
+        return self.entity_description.value_fn(
+            self.coordinator.poll_stats, monotonic()
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return True, the statistics also cover failed polls."""
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Ignore polls, the statistics are written on their own interval."""
+
+    @callback
+    def _async_write_statistics(self, _now: datetime) -> None:
+        """Write the statistics when they changed."""
+        super()._handle_coordinator_update()
+
+    def _state_snapshot(self) -> tuple[Any, ...]:
+        """Return the statistic to compare between writes."""
+        return (self.native_value,)
+
+
+class HomeWizardAggregateSensorEntity(
+    CoordinatorEntity[AggregateCoordinator], SensorEntity
+):
+    """Representation of a sum over the meters of an aggregate entry."""
+
+    _attr_has_entity_name = True
+
+    entity_description: HomeWizardAggregateSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: AggregateCoordinator,
+        description: HomeWizardAggregateSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        entry = coordinator.config_entry
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=entry.title,
+            manufacturer="HomeWizard",
+            model="Aggregate meter (Instant)",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the sum over the meters."""
+        return self.coordinator.data[self.entity_description.metric]
+
+    @property
+    def available(self) -> bool:
+        """Return if all meters reported the sum recently."""
+        return super().available and self.native_value is not None
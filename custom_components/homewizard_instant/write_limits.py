@@ -0,0 +1,50 @@
+"""Per sensor group limits on how often entity states are written."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from .const import (
+    CONF_DEADBAND,
+    CONF_DEADBAND_TYPE,
+    CONF_MIN_WRITE_INTERVAL,
+    DEADBAND_RELATIVE,
+    SENSOR_GROUPS,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class WriteLimits:
+    """Deadband and minimum interval between writes of a sensor group."""
+
+    deadband: float = 0.0
+    relative: bool = False
+    min_interval: float = 0.0
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> WriteLimits:
+        """Create limits from a sensor group options section."""
+        return cls(
+            deadband=float(options.get(CONF_DEADBAND, 0)),
+            relative=options.get(CONF_DEADBAND_TYPE) == DEADBAND_RELATIVE,
+            min_interval=float(options.get(CONF_MIN_WRITE_INTERVAL, 0)),
+        )
+
+    def exceeds_deadband(self, written: float, value: float) -> bool:
+        """Return if a value moved far enough from the written value."""
+        threshold = (
+            self.deadband * abs(written) / 100 if self.relative else self.deadband
+        )
+        return abs(value - written) > threshold
+
+
+def write_limits_from_options(options: Mapping[str, Any]) -> dict[str, WriteLimits]:
+    """Return the configured limits of each sensor group that has any."""
+    return {
+        group: limits
+        for group in SENSOR_GROUPS
+        if (limits := WriteLimits.from_options(options.get(group, {}))).deadband
+        or limits.min_interval
+    }
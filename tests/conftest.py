@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any
@@ -55,6 +56,9 @@ class FakeExternalDevice:
 class FakeMeasurement:
     """Minimal measurement model."""
 
+    wifi_ssid: str | None = None
+    wifi_strength: int | None = None
+    timestamp: datetime | None = None
     protocol_version: str | None = None
     meter_model: str | None = None
     unique_id: str | None = None
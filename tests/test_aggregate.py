@@ -0,0 +1,149 @@
+"""Tests for the aggregate meter."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import ANY, AsyncMock, patch
+
+import pytest
+
+from homeassistant.const import STATE_UNAVAILABLE, Platform
+from homeassistant.helpers import entity_registry as er
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.homewizard_instant.aggregate import (
+    SIGNAL_MEASUREMENT,
+    AlignedSamples,
+    combine,
+)
+from custom_components.homewizard_instant.const import CONF_METERS, DOMAIN
+from custom_components.homewizard_instant.coordinator import (
+    HWEnergyDeviceUpdateCoordinator,
+)
+
+
+def _measurement(power_w: float | None, **values: float | None) -> SimpleNamespace:
+    """Return a measurement with the metrics an aggregate meter reads."""
+    metrics = {
+        "power_l1_w": None,
+        "power_l2_w": None,
+        "power_l3_w": None,
+        "energy_import_kwh": None,
+        "energy_export_kwh": None,
+        **values,
+    }
+    return SimpleNamespace(power_w=power_w, **metrics)
+
+
+def test_aligned_samples_interpolate_and_hold() -> None:
+    """Test samples are interpolated between and held after a sample."""
+    samples = AlignedSamples()
+    assert samples.values_at(1000) is None
+
+    samples.add(1000.0, _measurement(100, energy_import_kwh=1.0))
+    samples.add(1001.0, _measurement(200, energy_import_kwh=1.002))
+
+    # Before the first sample nothing is known
+    assert samples.values_at(999.5) is None
+    assert samples.values_at(1000.25) == pytest.approx(
+        (125.0, None, None, None, 1.0005, None)
+    )
+    # The last value is held until it is too old
+    assert samples.values_at(1030.0)[0] == 200
+    assert samples.values_at(1031.5) is None
+
+    # A zero total means the meter does not know it
+    samples.add(1002.0, _measurement(300, energy_export_kwh=0))
+    assert samples.values_at(1002.0)[-1] is None
+
+    # Values are held, not interpolated, across a gap
+    samples.add(1040.0, _measurement(400))
+    assert samples.values_at(1010.0)[0] == 300
+
+
+def test_combine() -> None:
+    """Test power is summed per phase and totals need every meter."""
+    three_phase = (300.0, 100.0, 100.0, 100.0, 10.0, 1.0)
+    single_phase = (50.0, 50.0, None, None, 5.0, None)
+
+    assert combine([three_phase, single_phase]) == {
+        "power_w": 350.0,
+        "power_l1_w": 150.0,
+        "power_l2_w": 100.0,
+        "power_l3_w": 100.0,
+        "energy_import_kwh": 15.0,
+        "energy_export_kwh": None,
+    }
+    # A meter without recent samples makes the whole sum unknown
+    assert set(combine([three_phase, None]).values()) == {None}
+
+
+async def test_aggregate_entry_sums_meters(hass) -> None:
+    """Test the aggregate sensors sum the meters at a common moment."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={CONF_METERS: ["meter_a", "meter_b"]}, title="Site"
+    )
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.homewizard_instant.aggregate.time", return_value=1000.0
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        registry = er.async_get(hass)
+        power = registry.async_get_entity_id(
+            Platform.SENSOR, DOMAIN, f"{entry.entry_id}_active_power_w"
+        )
+        energy = registry.async_get_entity_id(
+            Platform.SENSOR, DOMAIN, f"{entry.entry_id}_total_power_import_kwh"
+        )
+        assert hass.states.get(power).state == STATE_UNAVAILABLE
+
+        # The meters are polled at different offsets within the second
+        for entry_id, sampled, power_w, energy_kwh in (
+            ("meter_a", 998.2, 100, 1.0),
+            ("meter_a", 999.2, 200, 1.001),
+            ("meter_b", 998.7, 50, 2.0),
+            ("meter_b", 999.7, 150, 2.002),
+        ):
+            async_dispatcher_send(
+                hass,
+                SIGNAL_MEASUREMENT.format(entry_id),
+                sampled,
+                _measurement(power_w, energy_import_kwh=energy_kwh),
+            )
+
+        await entry.runtime_data.async_refresh()
+
+    # Both meters are read at 999.0
+    assert float(hass.states.get(power).state) == pytest.approx(180 + 80)
+    assert float(hass.states.get(energy).state) == pytest.approx(1.0008 + 2.0006)
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_coordinator_sends_measurements(
+    hass, mock_config_entry, mock_combined_data
+) -> None:
+    """Test meters send each new measurement to aggregate meters."""
+    mock_config_entry.add_to_hass(hass)
+    coordinator = HWEnergyDeviceUpdateCoordinator(
+        hass, mock_config_entry, api=AsyncMock()
+    )
+    received = []
+    async_dispatcher_connect(
+        hass,
+        SIGNAL_MEASUREMENT.format(mock_config_entry.entry_id),
+        callback(lambda *args: received.append(args)),
+    )
+
+    coordinator.async_set_updated_data(mock_combined_data)
+    coordinator.async_set_updated_data(mock_combined_data)
+
+    assert received == [(ANY, mock_combined_data.measurement)]
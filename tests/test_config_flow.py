@@ -8,20 +8,37 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 from homewizard_energy.const import Model
+from homewizard_energy.errors import DisabledError, RequestError
 
-from homeassistant.const import CONF_IP_ADDRESS
+from homeassistant.const import CONF_IP_ADDRESS, CONF_NAME, CONF_TOKEN
 from homeassistant.data_entry_flow import FlowResultType
 from homeassistant.components.dhcp import DhcpServiceInfo
 from homeassistant.components.zeroconf import ZeroconfServiceInfo
 
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.homewizard_instant.config_flow import RecoverableError, async_try_connect
+from custom_components.homewizard_instant.config_flow import (
+    RecoverableError,
+    async_request_token,
+    async_try_connect,
+)
 from custom_components.homewizard_instant.const import (
+    CONF_DEADBAND,
+    CONF_DEADBAND_TYPE,
+    CONF_ENABLE_PUSH,
+    CONF_GRACE_FAILURES,
+    CONF_GRACE_PERIOD,
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_METERS,
+    CONF_MIN_WRITE_INTERVAL,
     CONF_PRODUCT_NAME,
     CONF_PRODUCT_TYPE,
     CONF_SERIAL,
+    DEADBAND_ABSOLUTE,
+    DEADBAND_RELATIVE,
     DOMAIN,
+    PUSH_TOKEN_NAME,
+    SENSOR_GROUPS,
 )
 
 
@@ -416,9 +433,18 @@ async def test_reconfigure_flow_updates_entry(hass, mock_config_entry, mock_devi
         serial="SERIAL123",
     )
 
-    with patch(
-        "custom_components.homewizard_instant.config_flow.async_try_connect",
-        return_value=device_info,
+    with (
+        patch(
+            "custom_components.homewizard_instant.config_flow.async_try_connect",
+            return_value=device_info,
+        ),
+        patch(
+            "custom_components.homewizard_instant.config_flow.has_v2_api",
+            return_value=False,
+        ),
+        patch(
+            "custom_components.homewizard_instant.config_flow.async_get_clientsession",
+        ),
     ):
         result2 = await hass.config_entries.flow.async_configure(
             result["flow_id"], {CONF_IP_ADDRESS: "2.3.4.5"}
@@ -428,6 +454,140 @@ async def test_reconfigure_flow_updates_entry(hass, mock_config_entry, mock_devi
     assert result2["reason"] == "reconfigure_successful"
 
 
+async def _async_start_authorize_flow(hass, mock_config_entry) -> dict:
+    """Start a reconfigure flow that lands on the authorize step."""
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_reload = AsyncMock()
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": "reconfigure", "entry_id": mock_config_entry.entry_id},
+        data=None,
+    )
+
+    device_info = SimpleNamespace(
+        product_type="P1",
+        product_name="P1 Meter",
+        serial="SERIAL123",
+    )
+
+    with (
+        patch(
+            "custom_components.homewizard_instant.config_flow.async_try_connect",
+            return_value=device_info,
+        ),
+        patch(
+            "custom_components.homewizard_instant.config_flow.has_v2_api",
+            return_value=True,
+        ),
+        patch(
+            "custom_components.homewizard_instant.config_flow.async_get_clientsession",
+        ),
+    ):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {CONF_IP_ADDRESS: "2.3.4.5"}
+        )
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["step_id"] == "authorize"
+    return result
+
+
+async def test_reconfigure_flow_authorize_push(hass, mock_config_entry) -> None:
+    """Test reconfigure stores a token for API v2 devices."""
+    result = await _async_start_authorize_flow(hass, mock_config_entry)
+
+    with patch(
+        "custom_components.homewizard_instant.config_flow.async_request_token",
+        return_value="token",
+    ):
+        result2 = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {CONF_ENABLE_PUSH: True}
+        )
+
+    assert result2["type"] == FlowResultType.ABORT
+    assert result2["reason"] == "reconfigure_successful"
+    assert mock_config_entry.data == {
+        CONF_IP_ADDRESS: "2.3.4.5",
+        CONF_TOKEN: "token",
+    }
+
+
+async def test_reconfigure_flow_authorize_button_not_pressed(
+    hass, mock_config_entry
+) -> None:
+    """Test authorize step shows an error until the button is pressed."""
+    result = await _async_start_authorize_flow(hass, mock_config_entry)
+
+    with patch(
+        "custom_components.homewizard_instant.config_flow.async_request_token",
+        side_effect=RecoverableError("boom", "authorization_required"),
+    ):
+        result2 = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {CONF_ENABLE_PUSH: True}
+        )
+
+    assert result2["type"] == FlowResultType.FORM
+    assert result2["errors"] == {"base": "authorization_required"}
+
+
+async def test_reconfigure_flow_authorize_declined(hass, mock_config_entry) -> None:
+    """Test declining push removes a stored token."""
+    mock_config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_IP_ADDRESS: "1.2.3.4", CONF_TOKEN: "old"},
+        unique_id=mock_config_entry.unique_id,
+        title="P1 Meter",
+    )
+    result = await _async_start_authorize_flow(hass, mock_config_entry)
+
+    result2 = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_ENABLE_PUSH: False}
+    )
+
+    assert result2["type"] == FlowResultType.ABORT
+    assert mock_config_entry.data == {CONF_IP_ADDRESS: "2.3.4.5"}
+
+
+@pytest.mark.parametrize(
+    ("side_effect", "error_code"),
+    [
+        (DisabledError("disabled"), "authorization_required"),
+        (RequestError("boom"), "network_error"),
+    ],
+)
+async def test_async_request_token_errors(hass, side_effect, error_code) -> None:
+    """Test async_request_token maps library errors."""
+    mock_api = AsyncMock()
+    mock_api.get_token = AsyncMock(side_effect=side_effect)
+    mock_api.close = AsyncMock()
+
+    with patch(
+        "custom_components.homewizard_instant.config_flow.HomeWizardEnergyV2",
+        return_value=mock_api,
+    ):
+        with pytest.raises(RecoverableError) as err:
+            await async_request_token(hass, "1.2.3.4", clientsession=AsyncMock())
+
+    assert err.value.error_code == error_code
+    mock_api.close.assert_awaited_once()
+
+
+async def test_async_request_token_success(hass) -> None:
+    """Test async_request_token returns the token."""
+    mock_api = AsyncMock()
+    mock_api.get_token = AsyncMock(return_value="token")
+    mock_api.close = AsyncMock()
+
+    with patch(
+        "custom_components.homewizard_instant.config_flow.HomeWizardEnergyV2",
+        return_value=mock_api,
+    ):
+        assert await async_request_token(hass, "1.2.3.4", clientsession=AsyncMock()) == "token"
+
+    mock_api.get_token.assert_awaited_once_with(PUSH_TOKEN_NAME)
+
+
 async def test_reconfigure_flow_wrong_device(hass, mock_config_entry):
     """Test reconfigure flow aborts on wrong device."""
     mock_config_entry.add_to_hass(hass)
@@ -622,3 +782,158 @@ async def test_discovery_confirm_error(hass) -> None:
 
     assert result2["type"] == FlowResultType.FORM
     assert result2["errors"] == {"base": "network_error"}
+
+
+async def test_options_flow(hass, mock_config_entry) -> None:
+    """Test the options flow stores polling, availability and write limits."""
+    mock_config_entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(mock_config_entry.entry_id)
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["step_id"] == "init"
+
+    limits = {
+        CONF_DEADBAND: 0,
+        CONF_DEADBAND_TYPE: DEADBAND_ABSOLUTE,
+        CONF_MIN_WRITE_INTERVAL: 0,
+    }
+    voltage = {
+        CONF_DEADBAND: 0.5,
+        CONF_DEADBAND_TYPE: DEADBAND_RELATIVE,
+        CONF_MIN_WRITE_INTERVAL: 60,
+    }
+    user_input = {
+        CONF_MAX_UPDATE_INTERVAL: 10,
+        CONF_GRACE_FAILURES: 5,
+        CONF_GRACE_PERIOD: 120,
+        **{group: limits for group in SENSOR_GROUPS},
+        "voltage": voltage,
+    }
+
+    result2 = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input
+    )
+
+    assert result2["type"] == FlowResultType.CREATE_ENTRY
+    assert mock_config_entry.options[CONF_MAX_UPDATE_INTERVAL] == 10
+    assert mock_config_entry.options[CONF_GRACE_FAILURES] == 5
+    assert mock_config_entry.options[CONF_GRACE_PERIOD] == 120
+    assert mock_config_entry.options["voltage"] == voltage
+    assert mock_config_entry.options["power"] == limits
+
+
+def _add_meters(hass, count: int = 2) -> list[MockConfigEntry]:
+    """Add configured P1 meters."""
+    entries = [
+        MockConfigEntry(
+            domain=DOMAIN,
+            data={CONF_IP_ADDRESS: f"1.2.3.{index}"},
+            unique_id=f"{DOMAIN}_P1_SERIAL{index}",
+            title=f"P1 Meter {index}",
+        )
+        for index in range(count)
+    ]
+    for entry in entries:
+        entry.add_to_hass(hass)
+    return entries
+
+
+async def test_user_flow_menu_creates_aggregate(hass) -> None:
+    """Test the user flow offers an aggregate meter with several meters."""
+    meters = _add_meters(hass)
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": "user"}
+    )
+    assert result["type"] == FlowResultType.MENU
+    assert result["menu_options"] == ["meter", "aggregate"]
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"next_step_id": "aggregate"}
+    )
+    assert result["type"] == FlowResultType.FORM
+    assert result["step_id"] == "aggregate"
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_NAME: "Site", CONF_METERS: [meters[0].entry_id]}
+    )
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {CONF_METERS: "too_few_meters"}
+
+    with patch(
+        "custom_components.homewizard_instant.async_setup_entry",
+        new=AsyncMock(return_value=True),
+    ):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {CONF_NAME: "Site", CONF_METERS: [meters[1].entry_id, meters[0].entry_id]},
+        )
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert result["title"] == "Site"
+    assert result["data"] == {
+        CONF_METERS: sorted(meter.entry_id for meter in meters)
+    }
+    assert not hass.config_entries.async_get_entry(
+        result["result"].entry_id
+    ).supports_options
+
+
+async def test_user_flow_menu_adds_meter(hass, mock_device_info) -> None:
+    """Test the menu still leads to adding a P1 meter."""
+    _add_meters(hass)
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": "user"}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"next_step_id": "meter"}
+    )
+    assert result["type"] == FlowResultType.FORM
+    assert result["step_id"] == "meter"
+
+    with (
+        patch(
+            "custom_components.homewizard_instant.async_setup_entry",
+            new=AsyncMock(return_value=True),
+        ),
+        patch(
+            "custom_components.homewizard_instant.config_flow.async_try_connect",
+            return_value=mock_device_info,
+        ),
+    ):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {CONF_IP_ADDRESS: "1.2.3.9"}
+        )
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert result["data"] == {CONF_IP_ADDRESS: "1.2.3.9"}
+
+
+async def test_reconfigure_flow_aggregate(hass) -> None:
+    """Test reconfiguring the meters an aggregate meter sums."""
+    meters = _add_meters(hass, 3)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_METERS: [meters[0].entry_id, meters[1].entry_id]},
+        title="Site",
+    )
+    entry.add_to_hass(hass)
+    hass.config_entries.async_reload = AsyncMock()
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": "reconfigure", "entry_id": entry.entry_id}
+    )
+    assert result["type"] == FlowResultType.FORM
+    assert result["step_id"] == "reconfigure_aggregate"
+
+    selected = sorted(meter.entry_id for meter in meters)
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_METERS: selected}
+    )
+
+    assert result["type"] == FlowResultType.ABORT
+    assert result["reason"] == "reconfigure_successful"
+    assert entry.data == {CONF_METERS: selected}
+    assert entry.unique_id == f"{DOMAIN}_aggregate_{'_'.join(selected)}"
@@ -0,0 +1,69 @@
+"""Tests for the dedicated device connection."""
+
+from __future__ import annotations
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import pytest
+
+from custom_components.homewizard_instant.connection import (
+    ConnectionStats,
+    DeviceConnection,
+)
+from custom_components.homewizard_instant.const import KEEPALIVE_TIMEOUT
+
+
+def test_connection_stats() -> None:
+    """Test connections are counted and expire from the hourly window."""
+    stats = ConnectionStats()
+    assert stats.reuse_ratio is None
+
+    stats.record_created(0.0)
+    stats.record_created(1800.0)
+    for _ in range(6):
+        stats.record_reused()
+
+    assert stats.reuse_ratio == 0.75
+    assert stats.created_last_hour(1800.0) == 2
+    assert stats.created_last_hour(3600.0) == 1
+    assert stats.as_dict(5400.0) == {
+        "connections_created": 2,
+        "connections_reused": 6,
+        "connections_created_last_hour": 0,
+        "reuse_ratio": 0.75,
+    }
+
+
+async def test_connection_connector() -> None:
+    """Test the connector keeps a single connection alive per device."""
+    connection = DeviceConnection()
+    connector = connection.session.connector
+
+    assert connector is not None
+    assert connector.limit_per_host == 1
+    assert connector._keepalive_timeout == KEEPALIVE_TIMEOUT
+
+    await connection.async_close()
+    assert connection.session.closed
+
+
+@pytest.mark.usefixtures("socket_enabled")
+async def test_connection_reuses_kept_alive_connection() -> None:
+    """Test consecutive polls share one TCP connection."""
+
+    async def _handler(request: web.Request) -> web.Response:
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_get("/api/v1/data", _handler)
+
+    connection = DeviceConnection()
+    async with TestServer(app) as server:
+        for _ in range(5):
+            async with connection.session.get(server.make_url("/api/v1/data")) as resp:
+                await resp.read()
+
+        await connection.async_close()
+
+    assert connection.stats.connections_created == 1
+    assert connection.stats.connections_reused == 4
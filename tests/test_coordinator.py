@@ -2,26 +2,53 @@
 
 from __future__ import annotations
 
+import asyncio
+from dataclasses import replace
+import logging
+from datetime import timedelta
+from time import monotonic
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
-from homewizard_energy.errors import DisabledError, RequestError
+from homewizard_energy.errors import DisabledError, RequestError, UnsupportedError
 
 from homeassistant.helpers.issue_registry import IssueSeverity
 from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util.dt import utcnow
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
 from custom_components.homewizard_instant.coordinator import (
     HWEnergyDeviceUpdateCoordinator,
 )
-from custom_components.homewizard_instant.const import DOMAIN
+from custom_components.homewizard_instant.scheduler import PollScheduler
+from custom_components.homewizard_instant.const import (
+    CONF_GRACE_FAILURES,
+    CONF_GRACE_PERIOD,
+    CONF_MAX_UPDATE_INTERVAL,
+    DOMAIN,
+    PUSH_UPDATE_INTERVAL,
+    SYSTEM_UPDATE_INTERVAL,
+    UPDATE_INTERVAL,
+)
+
+
+def _mock_api(data) -> AsyncMock:
+    """Return an API mock serving each endpoint from combined data."""
+    api = AsyncMock()
+    api.device = AsyncMock(return_value=data.device)
+    api.measurement = AsyncMock(return_value=data.measurement)
+    api.system = AsyncMock(return_value=data.system)
+    return api
 
 
 async def test_coordinator_update_success(hass, mock_config_entry, mock_combined_data):
     """Test coordinator successfully updates data."""
     mock_config_entry.add_to_hass(hass)
 
-    api = AsyncMock()
-    api.combined = AsyncMock(return_value=mock_combined_data)
+    api = _mock_api(mock_combined_data)
 
     coordinator = HWEnergyDeviceUpdateCoordinator(hass, mock_config_entry, api)
 
@@ -30,18 +57,112 @@ async def test_coordinator_update_success(hass, mock_config_entry, mock_combined
     ) as delete_issue:
         data = await coordinator._async_update_data()
 
-    assert data == mock_combined_data
-    assert coordinator.data == mock_combined_data
+    assert data.device == mock_combined_data.device
+    assert data.measurement == mock_combined_data.measurement
+    assert data.system == mock_combined_data.system
+    assert coordinator.data is data
     assert coordinator.api_disabled is False
     delete_issue.assert_called_once_with(hass, DOMAIN, "local_api_disabled")
 
 
+async def test_coordinator_tiered_polling(hass, mock_config_entry, mock_combined_data):
+    """Test each endpoint is polled on its own schedule."""
+    mock_config_entry.add_to_hass(hass)
+
+    api = _mock_api(mock_combined_data)
+    coordinator = HWEnergyDeviceUpdateCoordinator(hass, mock_config_entry, api)
+
+    with patch(
+        "custom_components.homewizard_instant.coordinator.monotonic"
+    ) as monotonic:
+        for now in (100.0, 101.0, 102.0):
+            monotonic.return_value = now
+            await coordinator._async_update_data()
+
+        assert api.device.await_count == 1
+        assert api.measurement.await_count == 3
+        assert api.system.await_count == 1
+
+        monotonic.return_value = 100.0 + SYSTEM_UPDATE_INTERVAL.total_seconds()
+        await coordinator._async_update_data()
+        assert api.system.await_count == 2
+
+        # Device info is fetched again after the device was unreachable
+        api.measurement.side_effect = RequestError("boom")
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+        api.measurement.side_effect = None
+        await coordinator._async_update_data()
+
+    assert api.device.await_count == 2
+    api.device.assert_awaited_with(reset_cache=True)
+
+
+async def test_coordinator_unsupported_system(
+    hass, mock_config_entry, mock_combined_data
+):
+    """Test devices without a system endpoint are not asked every tick."""
+    mock_config_entry.add_to_hass(hass)
+
+    api = _mock_api(mock_combined_data)
+    api.system = AsyncMock(side_effect=UnsupportedError("unsupported"))
+    coordinator = HWEnergyDeviceUpdateCoordinator(hass, mock_config_entry, api)
+
+    await coordinator._async_update_data()
+    data = await coordinator._async_update_data()
+
+    assert api.system.await_count == 1
+    assert data.system is None
+
+
+async def test_coordinator_system_request_error(
+    hass, mock_config_entry, mock_combined_data
+):
+    """Test a failed system request keeps the measurement and last system info."""
+    mock_config_entry.add_to_hass(hass)
+
+    api = _mock_api(mock_combined_data)
+    coordinator = HWEnergyDeviceUpdateCoordinator(hass, mock_config_entry, api)
+    coordinator.data = await coordinator._async_update_data()
+
+    previous = coordinator.data
+    api.system.side_effect = RequestError("timeout")
+    with patch(
+        "custom_components.homewizard_instant.coordinator.monotonic",
+        return_value=monotonic() + SYSTEM_UPDATE_INTERVAL.total_seconds() + 1,
+    ):
+        data = await coordinator._async_update_data()
+
+    assert api.system.await_count == 2
+    assert data.system == mock_combined_data.system
+    assert data.measurement == mock_combined_data.measurement
+    # Without a new telegram or system info nothing changed
+    assert data is previous
+
+
+async def test_coordinator_skips_measurement_while_pushed(
+    hass, mock_config_entry, mock_combined_data
+):
+    """Test measurements are not polled while the push client is connected."""
+    mock_config_entry.add_to_hass(hass)
+
+    api = _mock_api(mock_combined_data)
+    coordinator = HWEnergyDeviceUpdateCoordinator(hass, mock_config_entry, api)
+    coordinator.data = mock_combined_data
+    coordinator.push = Mock(connected=True)
+
+    data = await coordinator._async_update_data()
+
+    api.measurement.assert_not_awaited()
+    assert data.measurement is mock_combined_data.measurement
+
+
 async def test_coordinator_request_error(hass, mock_config_entry):
     """Test coordinator handles RequestError."""
     mock_config_entry.add_to_hass(hass)
 
     api = AsyncMock()
-    api.combined = AsyncMock(side_effect=RequestError("boom"))
+    api.measurement = AsyncMock(side_effect=RequestError("boom"))
 
     coordinator = HWEnergyDeviceUpdateCoordinator(hass, mock_config_entry, api)
 
@@ -58,7 +179,7 @@ async def test_coordinator_disabled_error_triggers_reload(
     mock_config_entry.add_to_hass(hass)
 
     api = AsyncMock()
-    api.combined = AsyncMock(side_effect=DisabledError("disabled"))
+    api.measurement = AsyncMock(side_effect=DisabledError("disabled"))
 
     coordinator = HWEnergyDeviceUpdateCoordinator(hass, mock_config_entry, api)
     coordinator.data = mock_combined_data
@@ -79,3 +200,463 @@ async def test_coordinator_disabled_error_triggers_reload(
     hass.config_entries.async_schedule_reload.assert_called_once_with(
         mock_config_entry.entry_id
     )
+
+
+async def test_coordinator_start_push(hass, mock_config_entry):
+    """Test push client is started from a stored token without probing."""
+    mock_config_entry.add_to_hass(hass)
+
+    api = AsyncMock()
+    api.host = "1.2.3.4"
+    coordinator = HWEnergyDeviceUpdateCoordinator(hass, mock_config_entry, api)
+
+    with (
+        patch(
+            "custom_components.homewizard_instant.coordinator.async_create_ssl_context",
+            return_value=False,
+        ),
+        patch(
+            "custom_components.homewizard_instant.coordinator.HomeWizardPushClient.run",
+            new=AsyncMock(),
+        ) as run,
+    ):
+        await coordinator.async_start_push(AsyncMock(), "token")
+        await hass.async_block_till_done()
+
+    assert coordinator.push is not None
+    run.assert_awaited_once()
+
+
+async def test_coordinator_push_callbacks(hass, mock_config_entry, mock_combined_data):
+    """Test pushed measurements update data and polling slows down."""
+    mock_config_entry.add_to_hass(hass)
+
+    coordinator = HWEnergyDeviceUpdateCoordinator(hass, mock_config_entry, AsyncMock())
+    listener = Mock()
+    coordinator.async_add_listener(listener)
+
+    coordinator._async_push_connected()
+    assert coordinator.update_interval == PUSH_UPDATE_INTERVAL
+
+    # Measurements before the first refresh are ignored
+    measurement = replace(mock_combined_data.measurement, power_w=321.0)
+    coordinator._async_push_measurement(measurement)
+    listener.assert_not_called()
+
+    coordinator.data = mock_combined_data
+    coordinator.last_update_success = False
+    coordinator._async_push_measurement(measurement)
+
+    assert coordinator.data.measurement.power_w == 321.0
+    assert coordinator.data.device == mock_combined_data.device
+    assert coordinator.last_update_success is True
+    listener.assert_called_once()
+
+    coordinator._async_push_disconnected()
+    assert coordinator.update_interval == UPDATE_INTERVAL
+
+    await coordinator.async_shutdown()
+
+
+async def test_coordinator_adapts_update_interval(
+    hass, mock_config_entry, mock_combined_data
+):
+    """Test the poll interval follows the adaptive interval while polling."""
+    mock_config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=dict(mock_config_entry.data),
+        options={CONF_MAX_UPDATE_INTERVAL: 10},
+        unique_id=mock_config_entry.unique_id,
+    )
+    mock_config_entry.add_to_hass(hass)
+
+    api = _mock_api(mock_combined_data)
+    coordinator = HWEnergyDeviceUpdateCoordinator(hass, mock_config_entry, api)
+
+    with patch(
+        "custom_components.homewizard_instant.coordinator.monotonic"
+    ) as monotonic:
+        for now in range(10):
+            monotonic.return_value = float(now)
+            await coordinator._async_update_data()
+
+    assert coordinator.adaptive_interval.maximum == 10
+    assert UPDATE_INTERVAL < coordinator.update_interval <= timedelta(seconds=10)
+
+    # Pushed updates keep the slow push interval
+    coordinator._async_push_connected()
+    coordinator.push = Mock(connected=True)
+    await coordinator._async_update_data()
+    assert coordinator.update_interval == PUSH_UPDATE_INTERVAL
+
+
+async def test_coordinator_skips_unchanged_telegram(
+    hass, mock_config_entry, mock_combined_data
+):
+    """Test listeners are only notified when the meter sent a new telegram."""
+    mock_config_entry.add_to_hass(hass)
+
+    api = _mock_api(mock_combined_data)
+    coordinator = HWEnergyDeviceUpdateCoordinator(hass, mock_config_entry, api)
+    listener = Mock()
+    coordinator.async_add_listener(listener)
+
+    with patch(
+        "custom_components.homewizard_instant.coordinator.monotonic",
+        return_value=100.0,
+    ):
+        await coordinator.async_refresh()
+        first = coordinator.data
+        await coordinator.async_refresh()
+
+        assert coordinator.data is first
+        assert listener.call_count == 1
+
+        api.measurement.return_value = replace(
+            mock_combined_data.measurement, power_w=75.0
+        )
+        await coordinator.async_refresh()
+
+    assert coordinator.data.measurement.power_w == 75.0
+    assert listener.call_count == 2
+
+    await coordinator.async_shutdown()
+
+
+async def test_coordinator_uses_fast_path_reader(
+    hass, mock_config_entry, mock_combined_data
+):
+    """Test measurements are read with the fast path over the device connection."""
+    mock_config_entry.add_to_hass(hass)
+
+    api = _mock_api(mock_combined_data)
+    api.host = "1.2.3.4"
+    coordinator = HWEnergyDeviceUpdateCoordinator(
+        hass, mock_config_entry, api, connection=Mock()
+    )
+
+    with patch(
+        "custom_components.homewizard_instant.coordinator.MeasurementReader.async_read",
+        return_value=mock_combined_data.measurement,
+    ) as read:
+        data = await coordinator._async_update_data()
+
+    read.assert_awaited_once()
+    api.measurement.assert_not_awaited()
+    assert data.measurement is mock_combined_data.measurement
+
+
+async def test_coordinator_schedules_aligned_ticks(
+    hass, mock_config_entry, mock_combined_data
+):
+    """Test refreshes are scheduled on whole wall-clock seconds."""
+    mock_config_entry.add_to_hass(hass)
+
+    coordinator = HWEnergyDeviceUpdateCoordinator(
+        hass, mock_config_entry, _mock_api(mock_combined_data)
+    )
+
+    with (
+        patch("custom_components.homewizard_instant.coordinator.time") as time,
+        patch.object(hass.loop, "call_at") as call_at,
+    ):
+        time.return_value = 1000.25
+        coordinator._schedule_refresh()
+
+    when = call_at.call_args.args[0]
+    assert when == pytest.approx(hass.loop.time() + 0.75, abs=0.05)
+
+    # Scheduling stops once the interval is cleared
+    coordinator._async_unsub_refresh()
+    coordinator.update_interval = None
+    coordinator._schedule_refresh()
+    assert coordinator._unsub_refresh is None
+
+
+async def test_coordinator_no_tick_after_shutdown(
+    hass, mock_config_entry, mock_combined_data
+):
+    """Test a poll finishing after shutdown does not schedule another tick."""
+    mock_config_entry.add_to_hass(hass)
+
+    coordinator = HWEnergyDeviceUpdateCoordinator(
+        hass, mock_config_entry, _mock_api(mock_combined_data)
+    )
+    coordinator.async_add_listener(lambda: None)
+    assert coordinator._unsub_refresh is not None
+
+    await coordinator.async_shutdown()
+    await coordinator._async_refresh(log_failures=False, scheduled=True)
+    coordinator._schedule_refresh()
+
+    assert coordinator._unsub_refresh is None
+    assert coordinator.scheduler._timer is None
+
+
+async def test_coordinator_skips_tick_while_fetching(
+    hass, mock_config_entry, mock_combined_data
+):
+    """Test a tick that fires during a running poll is skipped."""
+    mock_config_entry.add_to_hass(hass)
+
+    api = _mock_api(mock_combined_data)
+    coordinator = HWEnergyDeviceUpdateCoordinator(hass, mock_config_entry, api)
+    coordinator._fetching = True
+
+    await coordinator._handle_refresh_interval()
+
+    api.measurement.assert_not_awaited()
+    assert coordinator.ticker.missed_ticks == 1
+
+    coordinator._fetching = False
+    with patch.object(coordinator, "_async_refresh") as refresh:
+        coordinator._async_handle_tick()
+        await hass.async_block_till_done()
+
+    refresh.assert_called_once_with(log_failures=False, scheduled=True)
+
+
+async def test_coordinator_records_poll_statistics(
+    hass, mock_config_entry, mock_combined_data
+):
+    """Test poll latency and outcomes are recorded."""
+    mock_config_entry.add_to_hass(hass)
+
+    api = _mock_api(mock_combined_data)
+    coordinator = HWEnergyDeviceUpdateCoordinator(hass, mock_config_entry, api)
+
+    await coordinator._async_update_data()
+
+    timeout = RequestError("timeout")
+    timeout.__cause__ = TimeoutError()
+    for error in (timeout, RequestError("refused"), DisabledError("disabled")):
+        api.measurement.side_effect = error
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+
+    stats = coordinator.poll_stats
+    assert stats.polls == 4
+    assert stats.failures == 3
+    assert stats.timeouts == 1
+    assert stats.latency_percentile(monotonic(), 0.5) is not None
+
+
+async def test_coordinator_poll_latency_excludes_slot_wait(
+    hass, mock_config_entry, mock_combined_data
+):
+    """Test waiting for a poll slot does not count as device latency."""
+    mock_config_entry.add_to_hass(hass)
+
+    api = _mock_api(mock_combined_data)
+    coordinator = HWEnergyDeviceUpdateCoordinator(hass, mock_config_entry, api)
+
+    # Another meter holds the only slot for 200 ms
+    coordinator.scheduler = PollScheduler(hass.loop, max_polls=1)
+    async with coordinator.scheduler.slot(coordinator.ticker):
+        poll = hass.async_create_task(coordinator._async_update_data())
+        await asyncio.sleep(0.2)
+    await poll
+
+    assert coordinator.poll_stats.latency_percentile(monotonic(), 1.0) < 100
+
+
+async def test_coordinator_touches_issue_registry_on_change_only(
+    hass, mock_config_entry, mock_combined_data
+):
+    """Test a day of 1 Hz polls only touches the issue registry on changes."""
+    mock_config_entry.add_to_hass(hass)
+
+    api = _mock_api(mock_combined_data)
+    coordinator = HWEnergyDeviceUpdateCoordinator(hass, mock_config_entry, api)
+    hass.config_entries.async_schedule_reload = Mock()
+
+    with (
+        patch(
+            "custom_components.homewizard_instant.coordinator.ir.async_create_issue"
+        ) as create_issue,
+        patch(
+            "custom_components.homewizard_instant.coordinator.ir.async_delete_issue"
+        ) as delete_issue,
+    ):
+        for second in range(86_400):
+            # The local API is disabled for ten minutes around noon
+            disabled = 43_200 <= second < 43_800
+            api.measurement.side_effect = (
+                DisabledError("disabled") if disabled else None
+            )
+            try:
+                await coordinator._async_update_data()
+            except UpdateFailed:
+                assert disabled
+
+    # Once at startup for an issue left by a previous setup, once on recovery
+    assert delete_issue.call_count == 2
+    create_issue.assert_called_once()
+
+
+async def test_coordinator_circuit_breaker(
+    hass, mock_config_entry, mock_combined_data
+):
+    """Test polling backs off from an unreachable device and probes it."""
+    mock_config_entry.add_to_hass(hass)
+
+    api = _mock_api(mock_combined_data)
+    coordinator = HWEnergyDeviceUpdateCoordinator(hass, mock_config_entry, api)
+    await coordinator._async_update_data()
+
+    api.measurement.side_effect = RequestError("unreachable")
+    for _ in range(3):
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+
+    assert coordinator.breaker.state == "open"
+    assert timedelta(seconds=1.6) <= coordinator.update_interval <= timedelta(
+        seconds=2.4
+    )
+
+    # The probe stops after the device info request fails
+    api.device.side_effect = RequestError("unreachable")
+    api.device.reset_mock()
+    api.measurement.reset_mock()
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+
+    api.device.assert_awaited_once()
+    api.measurement.assert_not_awaited()
+    assert coordinator.update_interval >= timedelta(seconds=3.2)
+
+    # The first answer returns to polling every second
+    api.device.side_effect = None
+    api.measurement.side_effect = None
+    await coordinator._async_update_data()
+
+    assert coordinator.breaker.state == "closed"
+    assert coordinator.update_interval == UPDATE_INTERVAL
+
+
+async def test_coordinator_grace_period(hass, mock_config_entry, mock_combined_data):
+    """Test entities stay available until the grace period ends."""
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        mock_config_entry, options={CONF_GRACE_FAILURES: 3, CONF_GRACE_PERIOD: 30}
+    )
+
+    api = _mock_api(mock_combined_data)
+    coordinator = HWEnergyDeviceUpdateCoordinator(hass, mock_config_entry, api)
+    coordinator.update_interval = None
+    listener = Mock()
+    coordinator.async_add_listener(listener)
+    await coordinator.async_refresh()
+    listener.reset_mock()
+
+    api.measurement.side_effect = RequestError("timeout")
+    with patch.object(coordinator, "_schedule_refresh"):
+        # A single failed poll keeps the last values, marked stale
+        await coordinator.async_refresh()
+        assert coordinator.available
+        assert coordinator.stale
+
+        await coordinator.async_refresh()
+        assert coordinator.available
+        listener.reset_mock()
+
+        # The third failure in a row ends the grace period
+        await coordinator.async_refresh()
+        assert not coordinator.available
+        assert not coordinator.stale
+        listener.assert_called_once()
+
+        api.measurement.side_effect = None
+        await coordinator.async_refresh()
+
+    assert coordinator.available
+    assert coordinator.consecutive_failures == 0
+
+    await coordinator.async_shutdown()
+
+
+async def test_coordinator_grace_period_expires_without_polls(
+    hass, mock_config_entry, mock_combined_data
+):
+    """Test stale data becomes unavailable while polls back off."""
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        mock_config_entry, options={CONF_GRACE_FAILURES: 10, CONF_GRACE_PERIOD: 30}
+    )
+
+    api = _mock_api(mock_combined_data)
+    coordinator = HWEnergyDeviceUpdateCoordinator(hass, mock_config_entry, api)
+    coordinator.update_interval = None
+    listener = Mock()
+    coordinator.async_add_listener(listener)
+    await coordinator.async_refresh()
+
+    api.measurement.side_effect = RequestError("timeout")
+    await coordinator.async_refresh()
+    assert coordinator.available
+    listener.reset_mock()
+
+    with patch(
+        "custom_components.homewizard_instant.coordinator.monotonic",
+        return_value=monotonic() + 31,
+    ):
+        async_fire_time_changed(hass, utcnow() + timedelta(seconds=31))
+        await hass.async_block_till_done()
+
+    assert not coordinator.available
+    listener.assert_called_once()
+
+    await coordinator.async_shutdown()
+
+
+async def test_coordinator_push_restores_availability(
+    hass, mock_config_entry, mock_combined_data
+):
+    """Test a pushed measurement ends an outage."""
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        mock_config_entry, options={CONF_GRACE_FAILURES: 0}
+    )
+
+    api = _mock_api(mock_combined_data)
+    coordinator = HWEnergyDeviceUpdateCoordinator(hass, mock_config_entry, api)
+    coordinator.update_interval = None
+    await coordinator.async_refresh()
+
+    api.measurement.side_effect = RequestError("timeout")
+    await coordinator.async_refresh()
+    assert not coordinator.available
+
+    coordinator._async_push_measurement(mock_combined_data.measurement)
+    assert coordinator.available
+
+    await coordinator.async_shutdown()
+
+
+async def test_coordinator_aggregates_failure_logs(
+    hass, mock_config_entry, mock_combined_data, caplog
+):
+    """Test a flapping connection does not log every failure and recovery."""
+    mock_config_entry.add_to_hass(hass)
+
+    api = _mock_api(mock_combined_data)
+    coordinator = HWEnergyDeviceUpdateCoordinator(hass, mock_config_entry, api)
+    coordinator.update_interval = None
+    await coordinator.async_refresh()
+
+    with caplog.at_level(logging.INFO, logger="custom_components.homewizard_instant"):
+        for poll in range(20):
+            api.measurement.side_effect = RequestError("reset") if poll % 2 else None
+            await coordinator.async_refresh()
+
+    messages = [
+        record.getMessage()
+        for record in caplog.records
+        if record.levelno >= logging.INFO
+    ]
+    assert messages == [
+        f"Error fetching {mock_config_entry.title} data: reset",
+        f"Fetching {mock_config_entry.title} data recovered",
+    ]
+
+    await coordinator.async_shutdown()
@@ -0,0 +1,136 @@
+"""Tests for the local quarter-hour demand."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from homeassistant.util.dt import utcnow
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.homewizard_instant import async_remove_entry
+from custom_components.homewizard_instant.const import DEMAND_SAVE_DELAY
+from custom_components.homewizard_instant.coordinator import (
+    HWEnergyDeviceUpdateCoordinator,
+)
+from custom_components.homewizard_instant.demand import QuarterHourDemand
+
+# Quarter-hour boundary, 2026-10-01 00:00 UTC
+QUARTER = datetime(2026, 10, 1, tzinfo=UTC).timestamp()
+
+
+@pytest.fixture(autouse=True)
+async def utc_time_zone(hass) -> None:
+    """Count months in UTC."""
+    await hass.config.async_set_time_zone("UTC")
+
+
+def test_demand_average_and_forecast() -> None:
+    """Test the quarter average and forecast follow every sample."""
+    demand = QuarterHourDemand()
+    assert demand.average is None
+    assert demand.forecast is None
+
+    demand.add(QUARTER, 1000.0)
+    assert demand.average is None
+    assert demand.forecast == 1000.0
+
+    # 1000 W for 5 minutes, then 4000 W
+    for second in range(10, 301, 10):
+        demand.add(QUARTER + second, 1000.0 if second < 300 else 4000.0)
+    assert demand.average == 1000.0
+    assert demand.forecast == 3000.0
+
+    # Exported power counts as no demand
+    for second in range(310, 601, 10):
+        demand.add(QUARTER + second, 4000.0 if second < 600 else -500.0)
+    assert demand.average == 2500.0
+    assert demand.forecast == pytest.approx(5000 / 3)
+
+    # A gap is not bridged
+    demand.add(QUARTER + 700, 0.0)
+    assert demand.average == 2500.0
+    assert demand.forecast == pytest.approx(5000 * 300 / 800)
+
+    # The clock jumping back starts over in the quarter it jumped to
+    demand.add(QUARTER - 60, 1200.0)
+    assert demand.average is None
+    assert demand.forecast == 1200.0
+    demand.add(QUARTER - 50, 1200.0)
+    assert demand.average == 1200.0
+
+
+def test_demand_monthly_peak() -> None:
+    """Test completed quarters update the peak of their month."""
+    demand = QuarterHourDemand()
+    for second in range(0, 1800, 10):
+        demand.add(QUARTER + second, 2000.0 if second < 900 else 1000.0)
+
+    assert demand.peak == 2000.0
+    assert demand.peak_at == datetime(2026, 10, 1, 0, 15, tzinfo=UTC)
+    assert demand.average == 1000.0
+
+    # A quarter that was mostly not observed does not count
+    demand.add(QUARTER + 2000, 9000.0)
+    assert not demand.add(QUARTER + 2700, 9000.0)
+    assert demand.peak == 2000.0
+
+    # A new month starts over, even with a lower peak
+    demand = QuarterHourDemand()
+    demand.restore(
+        {"month": "2026-09", "peak_w": 5000.0, "peak_at": "2026-09-30T12:15:00+00:00"}
+    )
+    assert demand.peak_at == datetime(2026, 9, 30, 12, 15, tzinfo=UTC)
+    changed = [demand.add(QUARTER + second, 100.0) for second in range(0, 901, 10)]
+    assert changed[-1]
+    assert not any(changed[:-1])
+    assert demand.as_dict() == {
+        "month": "2026-10",
+        "peak_w": 100.0,
+        "peak_at": "2026-10-01T00:15:00+00:00",
+    }
+
+
+async def test_demand_peak_persisted(
+    hass, hass_storage, mock_config_entry, mock_combined_data
+) -> None:
+    """Test the monthly peak is saved and restored for the config entry."""
+    mock_config_entry.add_to_hass(hass)
+    key = f"homewizard_instant.{mock_config_entry.entry_id}.demand"
+
+    coordinator = HWEnergyDeviceUpdateCoordinator(
+        hass, mock_config_entry, api=AsyncMock()
+    )
+    coordinator.data = mock_combined_data
+    coordinator.update_interval = None
+
+    with patch("custom_components.homewizard_instant.coordinator.time") as time:
+        for second in range(0, 901, 5):
+            time.return_value = QUARTER + second
+            coordinator.data = replace(
+                coordinator.data,
+                measurement=replace(coordinator.data.measurement, power_w=1500.0),
+            )
+            coordinator.async_update_listeners()
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=DEMAND_SAVE_DELAY))
+    await hass.async_block_till_done()
+    assert hass_storage[key]["data"] == {
+        "month": "2026-10",
+        "peak_w": 1500.0,
+        "peak_at": "2026-10-01T00:15:00+00:00",
+    }
+
+    restored = HWEnergyDeviceUpdateCoordinator(
+        hass, mock_config_entry, api=AsyncMock()
+    )
+    await restored.async_restore()
+    assert restored.demand.peak == 1500.0
+
+    await async_remove_entry(hass, mock_config_entry)
+    assert key not in hass_storage
+
+    await coordinator.async_shutdown()
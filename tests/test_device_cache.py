@@ -0,0 +1,144 @@
+"""Tests for the cached device snapshot."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+from homewizard_energy.errors import RequestError
+from homewizard_energy.models import CombinedModels, Device, Measurement, System
+
+from custom_components.homewizard_instant.coordinator import (
+    HWEnergyDeviceUpdateCoordinator,
+)
+from custom_components.homewizard_instant.device_cache import (
+    cache_from_data,
+    data_from_cache,
+)
+from custom_components.homewizard_instant.sensor import (
+    _sensor_layout,
+    async_setup_entry,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures" / "p1"
+
+
+def _device_data(fixture: str) -> CombinedModels:
+    """Return device data as parsed by the library."""
+    return CombinedModels(
+        device=Device.from_dict(
+            {
+                "product_type": "HWE-P1",
+                "product_name": "P1 meter",
+                "serial": "5c2fafabcdef",
+                "firmware_version": "4.19",
+                "api_version": "v1",
+            }
+        ),
+        measurement=Measurement.from_dict(
+            json.loads((FIXTURES / fixture).read_text())
+        ),
+        state=None,
+        system=System(wifi_rssi_db=-60),
+    )
+
+
+def test_cache_round_trip() -> None:
+    """Test the snapshot creates the same sensors as the device data."""
+    data = _device_data("dsmr5_three_phase.json")
+    cache = json.loads(json.dumps(cache_from_data(data)))
+
+    restored = data_from_cache(cache)
+
+    assert restored.device == data.device
+    assert restored.measurement.power_l3_w == data.measurement.power_l3_w
+    assert _sensor_layout(restored) == _sensor_layout(data)
+    assert {
+        unique_id: device.type
+        for unique_id, device in restored.measurement.external_devices.items()
+    } == {
+        unique_id: device.type
+        for unique_id, device in data.measurement.external_devices.items()
+    }
+
+
+async def test_coordinator_starts_from_cache(
+    hass, hass_storage, mock_config_entry, mock_combined_data
+) -> None:
+    """Test entities wait for the first poll when set up from the cache."""
+    mock_config_entry.add_to_hass(hass)
+    key = f"homewizard_instant.{mock_config_entry.entry_id}.device_cache"
+
+    api = AsyncMock()
+    api.device = AsyncMock(return_value=mock_combined_data.device)
+    api.measurement = AsyncMock(side_effect=RequestError("offline"))
+    api.system = AsyncMock(return_value=mock_combined_data.system)
+    coordinator = HWEnergyDeviceUpdateCoordinator(hass, mock_config_entry, api)
+    coordinator.update_interval = None
+    assert not await coordinator.async_load_device_cache()
+
+    hass_storage[key] = {
+        "version": 1,
+        "key": key,
+        "data": cache_from_data(_device_data("dsmr5_three_phase.json")),
+    }
+    assert await coordinator.async_load_device_cache()
+    assert coordinator.from_cache
+    assert not coordinator.available
+    assert coordinator.data.measurement.power_l1_w is not None
+
+    # A failed first poll keeps the cached values hidden
+    await coordinator.async_refresh()
+    assert not coordinator.available
+    assert coordinator.from_cache
+
+    api.measurement = AsyncMock(return_value=mock_combined_data.measurement)
+    with patch.object(coordinator._cache_store, "async_delay_save") as save:
+        await coordinator.async_refresh()
+        await coordinator.async_refresh()
+
+    assert coordinator.available
+    assert not coordinator.from_cache
+    save.assert_called_once()
+    assert save.call_args.args[0]()["measurement"]["power_w"] == 50.0
+
+    await coordinator.async_shutdown()
+
+
+async def test_sensors_reload_when_layout_changed(
+    hass, hass_storage, mock_config_entry, mock_combined_data
+) -> None:
+    """Test the entry reloads when the device reports other fields."""
+    mock_config_entry.add_to_hass(hass)
+    key = f"homewizard_instant.{mock_config_entry.entry_id}.device_cache"
+    hass_storage[key] = {
+        "version": 1,
+        "key": key,
+        "data": cache_from_data(_device_data("dsmr5_three_phase.json")),
+    }
+
+    coordinator = HWEnergyDeviceUpdateCoordinator(
+        hass, mock_config_entry, api=AsyncMock()
+    )
+    coordinator.update_interval = None
+    await coordinator.async_load_device_cache()
+    mock_config_entry.runtime_data = coordinator
+
+    await async_setup_entry(hass, mock_config_entry, Mock())
+    hass.config_entries.async_schedule_reload = Mock()
+
+    # Failed polls do not end the cached start
+    coordinator.async_update_listeners()
+    hass.config_entries.async_schedule_reload.assert_not_called()
+
+    # The single phase data has other sensors than the cached three phases
+    coordinator.last_update_success = True
+    coordinator._async_update_availability()
+    coordinator.async_set_updated_data(mock_combined_data)
+    coordinator.async_set_updated_data(mock_combined_data)
+    hass.config_entries.async_schedule_reload.assert_called_once_with(
+        mock_config_entry.entry_id
+    )
+
+    await coordinator.async_shutdown()
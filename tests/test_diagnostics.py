@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock, patch
 
 from homeassistant.const import CONF_IP_ADDRESS
 
+from custom_components.homewizard_instant.connection import ConnectionStats
 from custom_components.homewizard_instant.diagnostics import (
     _serialize_data,
     async_get_config_entry_diagnostics,
@@ -37,6 +38,99 @@ async def test_async_get_config_entry_diagnostics_redacts(
     assert diagnostics["entry"]["options"]["token"] == "**REDACTED**"
     assert diagnostics["entry"]["unique_id"] == "**REDACTED**"
     assert diagnostics["data"]["device"]["serial"] == "**REDACTED**"
+    assert diagnostics["statistics"] == {
+        "state_writes": 0,
+        "state_writes_skipped": 0,
+        "polls": {
+            "polls": 0,
+            "failures": 0,
+            "timeouts": 0,
+            "latency_p50_ms": None,
+            "latency_p95_ms": None,
+            "latency_p99_ms": None,
+            "polls_per_minute": 0,
+            "error_rate": None,
+            "latency_histogram_ms": {},
+        },
+        "scheduler": {
+            "offset_ms": 0.0,
+            "ticks": 0,
+            "missed_ticks": 0,
+            "jitter_last_ms": None,
+            "jitter_mean_ms": None,
+            "jitter_max_ms": 0.0,
+            "slot_waits": 0,
+            "slot_wait_max_ms": 0.0,
+        },
+        "poll_scheduler": {
+            "meters": 1,
+            "max_concurrent_polls": 4,
+            "active_polls": 0,
+            "active_polls_max": 0,
+            "ticks": 0,
+            "missed_ticks": 0,
+            "jitter_max_ms": 0.0,
+            "slot_waits": 0,
+            "per_meter": [
+                {
+                    "name": "P1 Meter",
+                    "offset_ms": 0.0,
+                    "ticks": 0,
+                    "missed_ticks": 0,
+                    "jitter_last_ms": None,
+                    "jitter_mean_ms": None,
+                    "jitter_max_ms": 0.0,
+                    "slot_waits": 0,
+                    "slot_wait_max_ms": 0.0,
+                }
+            ],
+        },
+        "circuit_breaker": {
+            "state": "closed",
+            "consecutive_failures": 0,
+            "opened": 0,
+            "probes": 0,
+            "failed_probes": 0,
+            "backoff_s": None,
+        },
+        "availability": {
+            "available": True,
+            "stale": False,
+            "consecutive_failures": 0,
+        },
+        "connection": None,
+    }
+
+
+async def test_diagnostics_connection_statistics(
+    hass, mock_config_entry, mock_combined_data
+):
+    """Test diagnostics include the device connection statistics."""
+    mock_config_entry.add_to_hass(hass)
+
+    connection = Mock()
+    connection.stats = ConnectionStats()
+    connection.stats.record_created(0.0)
+    connection.stats.record_reused()
+
+    coordinator = HWEnergyDeviceUpdateCoordinator(
+        hass, mock_config_entry, api=AsyncMock(), connection=connection
+    )
+    coordinator.data = mock_combined_data
+    mock_config_entry.runtime_data = coordinator
+
+    with patch(
+        "custom_components.homewizard_instant.diagnostics.monotonic",
+        return_value=60.0,
+    ):
+        diagnostics = await async_get_config_entry_diagnostics(hass, mock_config_entry)
+
+    assert diagnostics["statistics"]["connection"] == {
+        "connections_created": 1,
+        "connections_reused": 1,
+        "connections_created_last_hour": 1,
+        "reuse_ratio": 0.5,
+    }
 
 
 def test_serialize_data_model_dump() -> None:
@@ -0,0 +1,81 @@
+"""Tests for the locally integrated energy."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.homewizard_instant.energy import EnergyCounter
+
+
+def test_energy_counter_integrates_power() -> None:
+    """Test power is integrated into import and export with sub-Wh resolution."""
+    counter = EnergyCounter()
+
+    counter.add(0.0, 360.0)
+    counter.add(1.0, -720.0)
+    assert counter.imported == pytest.approx(0.1)
+    assert counter.exported == 0.0
+
+    counter.add(3.0, 0.0)
+    assert counter.exported == pytest.approx(0.4)
+
+    # A gap is not bridged
+    counter.add(3.0, 3600.0)
+    counter.add(100.0, 0.0)
+    assert counter.imported == pytest.approx(0.1)
+
+
+def test_energy_counter_anchor() -> None:
+    """Test the counters integrate freely and follow the meter totals."""
+    counter = EnergyCounter()
+
+    # The first anchor starts the counters at the meter totals
+    counter.anchor(1.2345, 0.5, 10)
+    assert counter.imported == pytest.approx(1234.5)
+    assert counter.exported == pytest.approx(500.0)
+
+    # A DSMR 4 total lags up to 10 s, the counter keeps integrating
+    counter.add(0.0, 3600.0)
+    for second in range(1, 9):
+        counter.add(float(second), 3600.0)
+        counter.anchor(1.2345, 0.5, 10)
+    assert counter.imported == pytest.approx(1242.5)
+
+    # The meter caught up and counted more
+    counter.anchor(1.245, 0.5, 10)
+    assert counter.imported == pytest.approx(1245.0)
+
+    # A counter far ahead of the meter pauses until the meter catches up
+    counter.anchor(1.245, 0.5, 1)
+    counter.add(20.0, 3600.0)
+    assert counter.imported == pytest.approx(1245.0 + 1 + 2)
+    counter.anchor(1.250, 0.5, 1)
+    counter.add(21.0, 3600.0)
+    assert counter.imported == pytest.approx(1251.0)
+
+    # A meter that went backwards was reset or replaced
+    counter.anchor(0.010, 0.5, 1)
+    assert counter.imported == pytest.approx(10.0)
+
+    # Totals the meter does not keep are ignored
+    counter.add(22.0, -3600.0)
+    counter.add(23.0, 0.0)
+    counter.anchor(None, 0, 1)
+    assert counter.imported == pytest.approx(11.0)
+    assert counter.exported == pytest.approx(501.0)
+
+
+def test_energy_counter_restore() -> None:
+    """Test restored counters continue, within the lead over the meter."""
+    counter = EnergyCounter()
+    counter.restore(imported=1500.0)
+    assert counter.imported == 1500.0
+    assert counter.exported == 0.0
+
+    # The meter was replaced while Home Assistant was stopped
+    counter.anchor(0.2, 0.1, 10)
+    assert counter.imported == pytest.approx(200.0)
+
+    # A restore after the first anchor stays within the meter lead
+    counter.restore(exported=150.0)
+    assert counter.exported == pytest.approx(101.0)
@@ -0,0 +1,65 @@
+"""Tests for the sensor value extraction plan."""
+
+from __future__ import annotations
+
+from homewizard_energy.models import CombinedModels, Device, Measurement, System
+
+from custom_components.homewizard_instant.extraction import ExtractionPlan
+from custom_components.homewizard_instant.sensor import SENSORS
+
+
+def _combined(measurement: Measurement) -> CombinedModels:
+    """Return combined models around a measurement."""
+    return CombinedModels(
+        device=Device(
+            product_type="HWE-P1",
+            product_name="P1 meter",
+            serial="5c2fafabcdef",
+            api_version="v1",
+            firmware_version="6.00",
+        ),
+        measurement=measurement,
+        state=None,
+        system=System(wifi_rssi_db=-60, uptime_s=100),
+    )
+
+
+def test_extraction_matches_value_fns() -> None:
+    """Test the plan returns what each description's value_fn returns."""
+    data = _combined(
+        Measurement(
+            protocol_version=50,
+            tariff=2,
+            energy_import_kwh=0,
+            energy_import_t1_kwh=10.5,
+            power_w=-123.0,
+            voltage_l1_v=230.1,
+            power_factor=0.95,
+            wifi_strength=80,
+        )
+    )
+    descriptions = [description for description in SENSORS if description.has_fn(data)]
+
+    plan = ExtractionPlan(descriptions)
+    snapshot = plan.extract(data)
+    values = {key: snapshot[offset] for key, offset in plan.offsets.items()}
+
+    assert len(snapshot) == len(descriptions)
+    assert values == {
+        description.key: description.value_fn(data) for description in descriptions
+    }
+    assert values["total_power_import_kwh"] is None
+    assert values["active_power_factor"] == 95
+    assert values["active_tariff"] == "2"
+
+
+def test_extraction_single_field() -> None:
+    """Test a plan with a single measurement field."""
+    power = next(
+        description for description in SENSORS if description.key == "active_power_w"
+    )
+    plan = ExtractionPlan([power])
+
+    assert plan.offsets == {"active_power_w": 0}
+    assert plan.extract(_combined(Measurement(power_w=5.0))) == (5.0,)
+    assert ExtractionPlan([]).extract(_combined(Measurement())) == ()
@@ -0,0 +1,78 @@
+"""Tests for the rate limited failure log."""
+
+from __future__ import annotations
+
+import logging
+
+from homewizard_energy.errors import RequestError
+import pytest
+
+from custom_components.homewizard_instant.failure_log import FailureLog, is_timeout
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _timeout() -> RequestError:
+    """Return a request error caused by a timeout."""
+    error = RequestError("timed out")
+    error.__cause__ = TimeoutError()
+    return error
+
+
+def test_is_timeout() -> None:
+    """Test timeouts are found anywhere in the cause chain."""
+    wrapped = RuntimeError("update failed")
+    wrapped.__cause__ = _timeout()
+
+    assert is_timeout(wrapped)
+    assert is_timeout(TimeoutError())
+    assert not is_timeout(RequestError("refused"))
+
+
+def test_failure_log_outage(caplog: pytest.LogCaptureFixture) -> None:
+    """Test an outage logs the first failure, summaries and the recovery."""
+    log = FailureLog(LOGGER, "P1 meter")
+
+    with caplog.at_level(logging.INFO):
+        for now in range(90):
+            log.failure(float(now), _timeout() if now % 2 else RequestError("down"))
+        log.success(90.0)
+
+    assert [record.getMessage() for record in caplog.records] == [
+        "Error fetching P1 meter data: down",
+        "60 failed polls of P1 meter data in the last 60 s (30 timeouts), "
+        "last error: down",
+        "29 failed polls of P1 meter data in the last 30 s (15 timeouts), "
+        "last error: timed out",
+        "Fetching P1 meter data recovered",
+    ]
+
+
+def test_failure_log_flapping(caplog: pytest.LogCaptureFixture) -> None:
+    """Test a flapping connection is summarized once per interval."""
+    log = FailureLog(LOGGER, "P1 meter")
+
+    with caplog.at_level(logging.INFO):
+        for now in range(0, 120, 2):
+            log.failure(float(now), RequestError("reset"))
+            log.success(now + 1.0)
+
+    assert [record.levelno for record in caplog.records] == [
+        logging.ERROR,
+        logging.INFO,
+        logging.WARNING,
+        logging.INFO,
+    ]
+    assert caplog.records[2].getMessage().startswith("30 failed polls")
+
+
+def test_failure_log_success_without_failure(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test successful polls are not logged."""
+    log = FailureLog(LOGGER, "P1 meter")
+
+    with caplog.at_level(logging.INFO):
+        log.success(0.0)
+
+    assert not caplog.records
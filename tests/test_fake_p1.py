@@ -0,0 +1,94 @@
+"""Tests for the poll loop against a fake P1 meter over HTTP."""
+
+from __future__ import annotations
+
+from argparse import Namespace
+from collections.abc import AsyncIterator
+from time import monotonic, time
+
+import pytest
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_IP_ADDRESS, Platform
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from benchmarks.fake_p1 import FakeP1Meter, published_at
+from benchmarks.load import run
+from custom_components.homewizard_instant.const import DOMAIN
+
+
+@pytest.fixture
+async def fake_meter(socket_enabled: None) -> AsyncIterator[tuple[FakeP1Meter, str]]:
+    """Return a fake P1 meter and its address."""
+    meter = FakeP1Meter("5c2fafab0001", seed=1)
+    host = await meter.start()
+    yield meter, host
+    await meter.stop()
+
+
+async def test_poll_fake_meter(hass, fake_meter) -> None:
+    """Test the integration reads a fake meter over HTTP."""
+    meter, host = fake_meter
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="P1 Meter",
+        unique_id=f"{DOMAIN}_HWE-P1_5c2fafab0001",
+        data={CONF_IP_ADDRESS: host},
+    )
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data
+    measurement = coordinator.data.measurement
+    assert 0 <= time() - published_at(measurement.energy_import_kwh, 1.0) < 2
+
+    power = er.async_get(hass).async_get_entity_id(
+        Platform.SENSOR, DOMAIN, f"{entry.unique_id}_active_power_w"
+    )
+    assert float(hass.states.get(power).state) == measurement.power_w
+
+    # Slow responses show in the poll latency
+    meter.latency = 0.05
+    await coordinator.async_refresh()
+    assert coordinator.poll_stats.latency_percentile(monotonic(), 1.0) >= 50
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    assert meter.requests >= 3
+    assert meter.errors == 0
+
+
+async def test_fake_meter_errors(hass, fake_meter) -> None:
+    """Test failed requests of a fake meter keep the entry from loading."""
+    meter, host = fake_meter
+    meter.error_rate = 1.0
+    entry = MockConfigEntry(
+        domain=DOMAIN, title="P1 Meter", data={CONF_IP_ADDRESS: host}
+    )
+    entry.add_to_hass(hass)
+
+    assert not await hass.config_entries.async_setup(entry.entry_id)
+
+    assert entry.state is ConfigEntryState.SETUP_RETRY
+    assert meter.errors == meter.requests > 0
+
+
+@pytest.mark.usefixtures("socket_enabled")
+async def test_load_harness_with_errors(hass, capsys) -> None:
+    """Test the load harness sets up meters whose first requests fail."""
+    # The first request to the first meter fails with this seed
+    meters = [
+        FakeP1Meter(f"5c2fafab{index:04x}", error_rate=0.5, seed=4 + index)
+        for index in range(3)
+    ]
+    hosts = [await meter.start() for meter in meters]
+    try:
+        await run(hass, Namespace(warmup=0.0, duration=0.5, cadence=1.0), hosts)
+    finally:
+        for meter in meters:
+            await meter.stop()
+
+    assert meters[0].errors
+    assert "3 of 3 meters" in capsys.readouterr().out
@@ -0,0 +1,135 @@
+"""Tests for the API v1 measurement fast path."""
+
+from __future__ import annotations
+
+from dataclasses import fields
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from aiohttp import ClientSession, TCPConnector, ThreadedResolver, web
+from aiohttp.test_utils import TestServer
+from homewizard_energy.errors import DisabledError, RequestError
+from homewizard_energy.models import Measurement
+import pytest
+
+from custom_components.homewizard_instant.fastpath import (
+    MeasurementReader,
+    decode_measurement,
+)
+
+FIXTURES = sorted((Path(__file__).parent / "fixtures" / "p1").glob("*.json"))
+
+
+@pytest.mark.parametrize("fixture", FIXTURES, ids=lambda path: path.stem)
+def test_decode_matches_library(fixture: Path) -> None:
+    """Test the fast path decodes P1 responses exactly like the library."""
+    payload = fixture.read_bytes()
+
+    with patch.object(Measurement, "from_dict", wraps=Measurement.from_dict) as slow:
+        measurement = decode_measurement(payload)
+
+    slow.assert_not_called()
+    expected = Measurement.from_json(payload.decode())
+    for field in fields(Measurement):
+        value = getattr(measurement, field.name)
+        assert value == getattr(expected, field.name), field.name
+        assert type(value) is type(getattr(expected, field.name)), field.name
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"wifi_ssid": "My Wi-Fi", "active_power_w": 1, "new_field": 2},
+        {"power_w": 1, "timestamp": "2026-01-01T12:00:00"},
+    ],
+    ids=["unknown_key", "api_v2"],
+)
+def test_decode_falls_back_to_library(payload: dict) -> None:
+    """Test unknown payloads are decoded by the library."""
+    with patch.object(Measurement, "from_dict", wraps=Measurement.from_dict) as slow:
+        measurement = decode_measurement(json.dumps(payload))
+
+    slow.assert_called_once()
+    assert measurement.power_w == 1.0
+
+
+def test_decode_incomplete_external_device() -> None:
+    """Test incomplete external devices are converted by the library."""
+    payload = json.dumps(
+        {
+            "wifi_ssid": "My Wi-Fi",
+            "external": [
+                {"unique_id": "4730", "type": "gas_meter", "value": 1, "unit": "m3"},
+                {
+                    "unique_id": "5730",
+                    "type": "water_meter",
+                    "timestamp": 230125220957,
+                    "value": 2,
+                    "unit": "m3",
+                },
+            ],
+        }
+    )
+
+    measurement = decode_measurement(payload)
+
+    assert measurement == Measurement.from_json(payload)
+    assert list(measurement.external_devices) == ["water_meter_W0"]
+
+
+def _make_session() -> ClientSession:
+    """Return a client session that does not start a DNS resolver thread."""
+    return ClientSession(connector=TCPConnector(resolver=ThreadedResolver()))
+
+
+@pytest.mark.usefixtures("socket_enabled")
+async def test_reader_reads_measurement() -> None:
+    """Test the reader fetches and decodes the data endpoint."""
+    payload = FIXTURES[0].read_bytes()
+
+    async def _handler(request: web.Request) -> web.Response:
+        return web.Response(body=payload, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/api/v1/data", _handler)
+
+    async with TestServer(app) as server, _make_session() as session:
+        reader = MeasurementReader(session, f"{server.host}:{server.port}")
+        measurement = await reader.async_read()
+
+    assert measurement == Measurement.from_json(payload.decode())
+
+
+@pytest.mark.usefixtures("socket_enabled")
+@pytest.mark.parametrize(
+    ("status", "body", "error"),
+    [
+        (403, b"", DisabledError),
+        (500, b"", RequestError),
+        (200, b"not json", RequestError),
+        (200, b"[]", RequestError),
+    ],
+)
+async def test_reader_errors(status: int, body: bytes, error: type[Exception]) -> None:
+    """Test HTTP errors map onto the library errors."""
+
+    async def _handler(request: web.Request) -> web.Response:
+        return web.Response(status=status, body=body)
+
+    app = web.Application()
+    app.router.add_get("/api/v1/data", _handler)
+
+    async with TestServer(app) as server, _make_session() as session:
+        reader = MeasurementReader(session, f"{server.host}:{server.port}")
+        with pytest.raises(error):
+            await reader.async_read()
+
+
+@pytest.mark.usefixtures("socket_enabled")
+async def test_reader_connection_error() -> None:
+    """Test connection errors raise a RequestError."""
+    async with _make_session() as session:
+        reader = MeasurementReader(session, "127.0.0.1:1")
+        with pytest.raises(RequestError):
+            await reader.async_read()
@@ -0,0 +1,138 @@
+"""Tests for the power sample history and the statistics backfill."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_import_statistics,
+    statistics_during_period,
+)
+from homeassistant.helpers.recorder import get_instance
+from pytest_homeassistant_custom_component.components.recorder.common import (
+    async_wait_recording_done,
+)
+
+from custom_components.homewizard_instant.history import (
+    SampleHistory,
+    async_backfill_statistics,
+    hourly_statistics,
+)
+
+HOUR = datetime(2026, 10, 1, 10, tzinfo=UTC)
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(async_setup_recorder_instance) -> None:
+    """Set up the recorder before Home Assistant."""
+
+
+async def test_history_ring_file(hass, tmp_path) -> None:
+    """Test samples survive a restart and only new slots are written."""
+    path = str(tmp_path / "samples")
+    history = SampleHistory(path, size=4)
+    await history.async_flush(hass)
+    assert not (tmp_path / "samples").exists()
+
+    for now in range(6):
+        history.add(float(now), now * 10.0)
+    await history.async_flush(hass)
+
+    restored = SampleHistory(path, size=4)
+    await hass.async_add_executor_job(restored.load)
+    assert list(restored) == [(2.0, 20.0), (3.0, 30.0), (4.0, 40.0), (5.0, 50.0)]
+
+    # Wraps around the end of the file
+    restored.add(6.0, 60.0)
+    restored.add(7.0, 70.0)
+    restored.add(8.0, 80.0)
+    with patch.object(restored, "_write", wraps=restored._write) as write:
+        await restored.async_flush(hass)
+    _end, chunks, create = write.call_args.args
+    assert not create
+    assert [index for index, _times, _values in chunks] == [2, 0]
+
+    again = SampleHistory(path, size=4)
+    await hass.async_add_executor_job(again.load)
+    assert len(again) == 4
+    assert list(again)[-1] == (8.0, 80.0)
+
+    # A file of another size is ignored and rewritten on the next flush
+    other = SampleHistory(path, size=8)
+    await hass.async_add_executor_job(other.load)
+    assert len(other) == 0
+    other.add(9.0, 90.0)
+    await other.async_flush(hass)
+    await hass.async_add_executor_job(other.load)
+    assert list(other) == [(9.0, 90.0)]
+
+
+def test_hourly_statistics() -> None:
+    """Test samples are aggregated per completed hour they cover."""
+    start = HOUR.timestamp()
+    samples = [(start + minute * 60, 100.0 + minute) for minute in range(60)]
+    # A gap in the second hour, the third hour is only sampled after its start
+    samples += [(start + 3600 + minute * 60, 50.0) for minute in range(30)]
+    samples += [(start + 7200 + minute * 60, 50.0) for minute in range(31, 60)]
+    samples += [(start + 10800 + minute * 60, 50.0) for minute in range(10)]
+    samples += [(start + 11400, 999.0)]
+
+    assert hourly_statistics(samples, start + 10800) == [
+        StatisticData(start=HOUR, mean=129.5, min=100.0, max=159.0),
+    ]
+    assert hourly_statistics(samples, start + 14400) == [
+        StatisticData(start=HOUR, mean=129.5, min=100.0, max=159.0),
+    ]
+
+
+async def test_backfill_statistics(recorder_mock, hass, tmp_path) -> None:
+    """Test only the hours the recorder does not have are imported."""
+    entity_id = "sensor.p1_meter_power"
+    history = SampleHistory(str(tmp_path / "samples"), size=256)
+    for hour in range(3):
+        for minute in range(60):
+            history.add(
+                (HOUR + timedelta(hours=hour, minutes=minute)).timestamp(),
+                100.0 * (hour + 1) + minute,
+            )
+
+    metadata = StatisticMetaData(
+        has_mean=True,
+        has_sum=False,
+        name=None,
+        source="recorder",
+        statistic_id=entity_id,
+        unit_of_measurement="W",
+    )
+    async_import_statistics(
+        hass,
+        metadata,
+        [StatisticData(start=HOUR, mean=1.0, min=1.0, max=1.0)],
+    )
+    await async_wait_recording_done(hass)
+
+    # The last hour has not ended yet
+    with patch(
+        "custom_components.homewizard_instant.history.dt_util.utcnow",
+        return_value=HOUR + timedelta(hours=2, minutes=45),
+    ):
+        await async_backfill_statistics(hass, entity_id, history)
+    await async_wait_recording_done(hass)
+
+    statistics = await get_instance(hass).async_add_executor_job(
+        statistics_during_period,
+        hass,
+        HOUR,
+        None,
+        {entity_id},
+        "hour",
+        None,
+        {"mean", "min", "max"},
+    )
+    assert [
+        (row["mean"], row["min"], row["max"]) for row in statistics[entity_id]
+    ] == [(1.0, 1.0, 1.0), (229.5, 200.0, 259.0)]
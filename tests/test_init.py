@@ -6,10 +6,16 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from homeassistant.const import CONF_IP_ADDRESS, CONF_TOKEN
 from homeassistant.exceptions import ConfigEntryNotReady
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.homewizard_instant import async_setup_entry, async_unload_entry
-from custom_components.homewizard_instant.const import PLATFORMS
+from custom_components.homewizard_instant import (
+    async_reload_entry,
+    async_setup_entry,
+    async_unload_entry,
+)
+from custom_components.homewizard_instant.const import DOMAIN, PLATFORMS
 
 
 async def test_async_setup_entry_success(hass, mock_config_entry) -> None:
@@ -25,9 +31,9 @@ async def test_async_setup_entry_success(hass, mock_config_entry) -> None:
             return_value=mock_api,
         ),
         patch(
-            "custom_components.homewizard_instant.async_get_clientsession",
+            "custom_components.homewizard_instant.DeviceConnection",
             return_value=AsyncMock(),
-        ),
+        ) as device_connection,
         patch(
             "custom_components.homewizard_instant.HWEnergyDeviceUpdateCoordinator.async_config_entry_first_refresh",
             new=AsyncMock(),
@@ -41,8 +47,57 @@ async def test_async_setup_entry_success(hass, mock_config_entry) -> None:
         assert await async_setup_entry(hass, mock_config_entry)
 
     assert mock_config_entry.runtime_data is not None
+    assert (
+        mock_config_entry.runtime_data.connection is device_connection.return_value
+    )
     forward_setups.assert_called_once_with(mock_config_entry, PLATFORMS)
 
+    await mock_config_entry._async_process_on_unload(hass)
+
+
+async def test_async_setup_entry_starts_push_with_token(hass) -> None:
+    """Test setup starts push updates when a token is stored."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_IP_ADDRESS: "1.2.3.4", CONF_TOKEN: "token"},
+        unique_id=f"{DOMAIN}_P1_SERIAL123",
+        title="P1 Meter",
+    )
+    entry.add_to_hass(hass)
+
+    mock_api = AsyncMock()
+    mock_api.close = AsyncMock()
+    session = AsyncMock()
+
+    with (
+        patch(
+            "custom_components.homewizard_instant.HomeWizardEnergyV1",
+            return_value=mock_api,
+        ),
+        patch(
+            "custom_components.homewizard_instant.DeviceConnection",
+            return_value=AsyncMock(),
+        ),
+        patch(
+            "custom_components.homewizard_instant.async_get_clientsession",
+            return_value=session,
+        ),
+        patch(
+            "custom_components.homewizard_instant.HWEnergyDeviceUpdateCoordinator.async_config_entry_first_refresh",
+            new=AsyncMock(),
+        ),
+        patch(
+            "custom_components.homewizard_instant.HWEnergyDeviceUpdateCoordinator.async_start_push",
+            new=AsyncMock(),
+        ) as start_push,
+        patch.object(hass.config_entries, "async_forward_entry_setups"),
+    ):
+        assert await async_setup_entry(hass, entry)
+
+    start_push.assert_awaited_once_with(session, "token")
+
+    await entry._async_process_on_unload(hass)
+
 
 async def test_async_setup_entry_not_ready_triggers_reauth(hass, mock_config_entry):
     """Test ConfigEntryNotReady with API disabled triggers reauth."""
@@ -57,9 +112,9 @@ async def test_async_setup_entry_not_ready_triggers_reauth(hass, mock_config_ent
             return_value=mock_api,
         ),
         patch(
-            "custom_components.homewizard_instant.async_get_clientsession",
+            "custom_components.homewizard_instant.DeviceConnection",
             return_value=AsyncMock(),
-        ),
+        ) as device_connection,
         patch(
             "custom_components.homewizard_instant.HWEnergyDeviceUpdateCoordinator.async_config_entry_first_refresh",
             new=AsyncMock(side_effect=ConfigEntryNotReady),
@@ -74,6 +129,70 @@ async def test_async_setup_entry_not_ready_triggers_reauth(hass, mock_config_ent
             await async_setup_entry(hass, mock_config_entry)
 
     start_reauth.assert_called_once_with(hass)
+    device_connection.return_value.async_close.assert_awaited_once()
+
+
+async def test_async_setup_entry_error_closes_connection(
+    hass, mock_config_entry
+) -> None:
+    """Test the device connection is closed when setup fails unexpectedly."""
+    mock_config_entry.add_to_hass(hass)
+
+    mock_api = AsyncMock()
+    with (
+        patch(
+            "custom_components.homewizard_instant.HomeWizardEnergyV1",
+            return_value=mock_api,
+        ),
+        patch(
+            "custom_components.homewizard_instant.DeviceConnection",
+            return_value=AsyncMock(),
+        ) as device_connection,
+        patch(
+            "custom_components.homewizard_instant.HWEnergyDeviceUpdateCoordinator.async_restore",
+            new=AsyncMock(side_effect=OSError("disk full")),
+        ),
+        pytest.raises(OSError),
+    ):
+        await async_setup_entry(hass, mock_config_entry)
+
+    mock_api.close.assert_awaited()
+    device_connection.return_value.async_close.assert_awaited()
+
+
+async def test_async_setup_entry_from_cache(hass, mock_config_entry) -> None:
+    """Test setup does not wait for the device when a snapshot is cached."""
+    mock_config_entry.add_to_hass(hass)
+
+    with (
+        patch(
+            "custom_components.homewizard_instant.HomeWizardEnergyV1",
+            return_value=AsyncMock(),
+        ),
+        patch(
+            "custom_components.homewizard_instant.DeviceConnection",
+            return_value=AsyncMock(),
+        ),
+        patch(
+            "custom_components.homewizard_instant.HWEnergyDeviceUpdateCoordinator.async_load_device_cache",
+            new=AsyncMock(return_value=True),
+        ),
+        patch(
+            "custom_components.homewizard_instant.HWEnergyDeviceUpdateCoordinator.async_config_entry_first_refresh",
+            new=AsyncMock(side_effect=ConfigEntryNotReady),
+        ) as first_refresh,
+        patch.object(
+            hass.config_entries,
+            "async_forward_entry_setups",
+            return_value=True,
+        ) as forward_setups,
+    ):
+        assert await async_setup_entry(hass, mock_config_entry)
+
+    first_refresh.assert_not_awaited()
+    forward_setups.assert_called_once_with(mock_config_entry, PLATFORMS)
+
+    await mock_config_entry._async_process_on_unload(hass)
 
 
 async def test_async_unload_entry(hass, mock_config_entry) -> None:
@@ -86,3 +205,13 @@ async def test_async_unload_entry(hass, mock_config_entry) -> None:
         assert await async_unload_entry(hass, mock_config_entry)
 
     unload_platforms.assert_called_once_with(mock_config_entry, PLATFORMS)
+
+
+async def test_async_reload_entry(hass, mock_config_entry) -> None:
+    """Test changed options reload the config entry."""
+    mock_config_entry.add_to_hass(hass)
+
+    with patch.object(hass.config_entries, "async_reload") as reload:
+        await async_reload_entry(hass, mock_config_entry)
+
+    reload.assert_called_once_with(mock_config_entry.entry_id)
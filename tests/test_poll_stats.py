@@ -0,0 +1,66 @@
+"""Tests for the poll statistics."""
+
+from __future__ import annotations
+
+from custom_components.homewizard_instant.poll_stats import PollStatistics
+
+
+def test_poll_statistics_percentiles() -> None:
+    """Test latency percentiles are read from the histogram."""
+    stats = PollStatistics()
+    assert stats.latency_percentile(0.0, 0.5) is None
+
+    for now in range(100):
+        # 90 fast polls around 20 ms and 10 slow ones around 400 ms
+        stats.record(float(now), 0.4 if now % 10 == 0 else 0.02, success=True)
+
+    # Each value is reported within its bucket
+    assert 19.95 < stats.latency_percentile(100.0, 0.5) <= 25.12
+    assert 398.1 < stats.latency_percentile(100.0, 0.95) <= 501.19
+    assert 398.1 < stats.latency_percentile(100.0, 0.99) <= 501.19
+
+    # Polls slower than the largest bucket report its bound
+    stats.record(100.0, 60.0, success=True)
+    assert stats.latency_percentile(100.0, 1.0) == 10000.0
+
+
+def test_poll_statistics_latency_window() -> None:
+    """Test latency percentiles forget polls older than two windows."""
+    stats = PollStatistics()
+    for now in range(10):
+        stats.record(float(now), 0.4, success=True)
+
+    # The previous window still counts once latency drops
+    for now in range(600, 610):
+        stats.record(float(now), 0.02, success=True)
+    assert 398.1 < stats.latency_percentile(610.0, 0.95) <= 501.19
+
+    for now in range(1200, 1210):
+        stats.record(float(now), 0.02, success=True)
+    assert stats.latency_percentile(1210.0, 1.0) <= 25.12
+
+    # Without polls for two windows there is no latency to report
+    assert stats.latency_percentile(2500.0, 0.5) is None
+    assert stats.polls == 30
+
+
+def test_poll_statistics_rates() -> None:
+    """Test polls per minute and error rate cover the last minute."""
+    stats = PollStatistics()
+    assert stats.error_rate(0.0) is None
+
+    for now in range(60):
+        stats.record(float(now), 0.05, success=now % 4 != 0, timeout=now % 8 == 0)
+
+    assert stats.polls_per_minute(59.5) == 60
+    assert stats.error_rate(59.5) == 25.0
+    assert stats.polls_per_minute(90.0) == 29
+
+    diagnostics = stats.as_dict(200.0)
+    assert diagnostics["polls"] == 60
+    assert diagnostics["failures"] == 15
+    assert diagnostics["timeouts"] == 8
+    assert diagnostics["polls_per_minute"] == 0
+    assert diagnostics["error_rate"] is None
+    assert diagnostics["latency_histogram_ms"] == {"50.12": 60}
+    assert diagnostics["latency_p50_ms"] is not None
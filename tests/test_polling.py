@@ -0,0 +1,200 @@
+"""Tests for the poll scheduling helpers."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from unittest.mock import patch
+
+from homewizard_energy.models import Measurement
+
+from custom_components.homewizard_instant.polling import (
+    AdaptivePollInterval,
+    AlignedTicker,
+    CircuitBreaker,
+    telegram_changed,
+)
+
+START = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def test_telegram_changed() -> None:
+    """Test telegrams are compared by timestamp when the meter reports one."""
+    first = Measurement(power_w=100.0, timestamp=START)
+
+    assert telegram_changed(None, first)
+    assert not telegram_changed(first, Measurement(power_w=200.0, timestamp=START))
+    assert telegram_changed(
+        first, Measurement(power_w=100.0, timestamp=START + timedelta(seconds=1))
+    )
+    assert not telegram_changed(Measurement(power_w=1.0), Measurement(power_w=1.0))
+    assert telegram_changed(Measurement(power_w=1.0), Measurement(power_w=2.0))
+
+
+def test_adaptive_interval_backs_off_while_stable() -> None:
+    """Test stable power backs off to the maximum and volatile power resets it."""
+    interval = AdaptivePollInterval(1, 5)
+
+    intervals = [
+        interval.update(float(now), Measurement(power_w=100.0 + now % 2))
+        for now in range(10)
+    ]
+
+    assert intervals[0] == 1
+    assert intervals == sorted(intervals)
+    assert intervals[-1] == 5
+
+    assert interval.update(10.0, Measurement(power_w=2000.0)) == 1
+
+
+def test_adaptive_interval_default_maximum_keeps_minimum() -> None:
+    """Test a maximum equal to the minimum never slows polling down."""
+    interval = AdaptivePollInterval(1, 1)
+
+    for now in range(5):
+        assert interval.update(float(now), Measurement(power_w=100.0)) == 1
+
+
+def test_adaptive_interval_aligns_to_slow_meter() -> None:
+    """Test slow meters are polled right after their next telegram is due."""
+    interval = AdaptivePollInterval(1, 1)
+
+    for tick in range(4):
+        telegram = Measurement(
+            power_w=100.0, timestamp=START + timedelta(seconds=10 * tick)
+        )
+        # Probe once at the fastest rate after each new telegram
+        assert interval.update(10.0 * tick, telegram) == 1
+        if tick:
+            assert interval.update(10.0 * tick + 1, telegram) > 8
+
+    assert interval.cadence == 10
+
+
+def test_adaptive_interval_learns_cadence_without_timestamps() -> None:
+    """Test the cadence is learned from polls when telegrams have no timestamp."""
+    interval = AdaptivePollInterval(1, 1)
+
+    for now in range(13):
+        interval.update(float(now), Measurement(power_w=float(now // 4)))
+
+    assert interval.cadence == 4
+    # Last telegram changed at 12, the next is due after 16
+    assert interval.update(13.0, Measurement(power_w=3.0)) > 2
+
+
+def test_aligned_ticker_follows_wall_clock_seconds() -> None:
+    """Test ticks land on whole seconds regardless of poll duration."""
+    ticker = AlignedTicker()
+
+    assert ticker.next_tick(1000.3, 1) == 1001
+    # A pending tick is kept when the refresh is rescheduled early
+    assert ticker.next_tick(1000.6, 1) == 1001
+
+    ticker.record_tick(1001.02)
+    assert ticker.next_tick(1001.4, 1) == 1002
+    ticker.record_tick(1001.98)
+    # Slower intervals are rounded up to whole seconds
+    assert ticker.next_tick(1002.1, 1.5) == 1004
+
+    assert ticker.missed_ticks == 0
+    assert ticker.as_dict() == {
+        "offset_ms": 0.0,
+        "ticks": 2,
+        "missed_ticks": 0,
+        "jitter_last_ms": 20.0,
+        "jitter_mean_ms": 20.0,
+        "jitter_max_ms": 20.0,
+        "slot_waits": 0,
+        "slot_wait_max_ms": 0.0,
+    }
+
+
+def test_aligned_ticker_offset() -> None:
+    """Test ticks land on the offset and follow a changed offset."""
+    ticker = AlignedTicker()
+    ticker.offset = 0.25
+
+    assert ticker.next_tick(1000.3, 1) == 1001.25
+    ticker.record_tick(1001.25)
+
+    ticker.offset = 0.5
+    assert ticker.next_tick(1001.4, 1) == 1002.5
+    ticker.record_tick(1002.5)
+    assert ticker.next_tick(1002.6, 2) == 1004.5
+
+
+def test_aligned_ticker_skips_overrun_ticks() -> None:
+    """Test ticks that passed during a slow poll are skipped, not queued."""
+    ticker = AlignedTicker()
+    ticker.next_tick(1000.5, 1)
+    ticker.record_tick(1001.0)
+
+    # The poll started at 1001 took 2.3 seconds
+    assert ticker.next_tick(1003.3, 1) == 1004
+    assert ticker.missed_ticks == 2
+
+    ticker.record_skipped()
+    assert ticker.missed_ticks == 3
+
+
+def test_aligned_ticker_clock_steps_back() -> None:
+    """Test a clock stepped back starts a new grid instead of waiting."""
+    ticker = AlignedTicker()
+    ticker.offset = 0.25
+    assert ticker.next_tick(4600.5, 1) == 4601.25
+
+    # An NTP correction moved the clock back an hour
+    assert ticker.next_tick(1000.6, 1) == 1001.25
+    ticker.record_tick(1001.25)
+    assert ticker.next_tick(1001.3, 1) == 1002.25
+    assert ticker.missed_ticks == 0
+
+
+def test_circuit_breaker_backs_off_exponentially() -> None:
+    """Test the circuit opens after repeated failures and backs off."""
+    breaker = CircuitBreaker()
+
+    with patch(
+        "custom_components.homewizard_instant.polling.uniform", return_value=1.0
+    ):
+        breaker.before_poll()
+        assert breaker.record_failure() is None
+        assert breaker.record_failure() is None
+        assert breaker.record_failure() == 2
+        assert breaker.state == "open"
+
+        delays = []
+        for _ in range(7):
+            breaker.before_poll()
+            assert breaker.state == "half_open"
+            delays.append(breaker.record_failure())
+
+    assert delays == [4, 8, 16, 32, 60, 60, 60]
+    assert breaker.as_dict() == {
+        "state": "open",
+        "consecutive_failures": 10,
+        "opened": 1,
+        "probes": 7,
+        "failed_probes": 7,
+        "backoff_s": 60.0,
+    }
+
+    breaker.before_poll()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.backoff is None
+    assert breaker.consecutive_failures == 0
+
+
+def test_circuit_breaker_jitter() -> None:
+    """Test the backoff is jittered around the exponential delay."""
+    delays = set()
+    for _ in range(20):
+        breaker = CircuitBreaker()
+        for _ in range(3):
+            delay = breaker.record_failure()
+        delays.add(delay)
+
+    assert len(delays) > 1
+    assert all(1.6 <= delay <= 2.4 for delay in delays)
@@ -0,0 +1,224 @@
+"""Tests for the API v2 push client."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import Mock, patch
+
+from aiohttp import ClientSession, TCPConnector, ThreadedResolver, web
+from aiohttp.test_utils import TestServer
+import pytest
+
+from custom_components.homewizard_instant.push import (
+    HomeWizardPushClient,
+    async_create_ssl_context,
+)
+
+
+def _make_device(
+    token: str, measurements: list[dict], frames: list[Any] | None = None
+) -> web.Application:
+    """Return an aiohttp app that mimics the API v2 WebSocket.
+
+    Raw frames are sent before the measurements once subscribed.
+    """
+
+    async def _ws_handler(request: web.Request) -> web.WebSocketResponse:
+        websocket = web.WebSocketResponse()
+        await websocket.prepare(request)
+        await websocket.send_json(
+            {"type": "authorization_requested", "data": {"api_version": "2.0.0"}}
+        )
+
+        async for message in websocket:
+            payload = message.json()
+            if payload["type"] == "authorization":
+                if payload["data"] != token:
+                    await websocket.send_json(
+                        {"type": "error", "data": {"message": "user:unauthorized"}}
+                    )
+                    continue
+                await websocket.send_json({"type": "authorized"})
+            elif payload["type"] == "subscribe":
+                for frame in frames or ():
+                    await websocket.send_json(frame)
+                for measurement in measurements:
+                    await websocket.send_json(
+                        {"type": "measurement", "data": measurement}
+                    )
+                await websocket.close()
+
+        return websocket
+
+    app = web.Application()
+    app.router.add_get("/api/ws", _ws_handler)
+    return app
+
+
+def _make_session() -> ClientSession:
+    """Return a client session that does not start a DNS resolver thread."""
+    return ClientSession(connector=TCPConnector(resolver=ThreadedResolver()))
+
+
+@pytest.mark.usefixtures("socket_enabled")
+async def test_push_client_forwards_measurements() -> None:
+    """Test measurements are forwarded after authorization."""
+    # Malformed measurements are skipped
+    app = _make_device(
+        "secret", [{"power_w": 123.0}, None, {"power_w": "high"}, {"power_w": 456.0}]
+    )
+
+    on_connect = Mock()
+    on_disconnect = Mock()
+    received: list[float | None] = []
+
+    async with TestServer(app) as server, _make_session() as session:
+        client = HomeWizardPushClient(
+            session,
+            str(server.make_url("/api/ws")),
+            "secret",
+            ssl_context=False,
+            on_connect=on_connect,
+            on_measurement=lambda measurement: received.append(measurement.power_w),
+            on_disconnect=on_disconnect,
+        )
+
+        with patch(
+            "custom_components.homewizard_instant.push.asyncio.sleep",
+            side_effect=asyncio.CancelledError,
+        ):
+            with pytest.raises(asyncio.CancelledError):
+                await client.run()
+
+    assert received == [123.0, 456.0]
+    on_connect.assert_called_once()
+    on_disconnect.assert_called_once()
+    assert client.connected is False
+
+
+@pytest.mark.parametrize(
+    "frame",
+    [
+        pytest.param({"type": "measurement"}, id="missing_data"),
+        pytest.param({"type": "measurement", "data": None}, id="data_not_object"),
+        pytest.param(
+            {"type": "measurement", "data": {"power_w": "high"}}, id="invalid_value"
+        ),
+        pytest.param([{"type": "measurement"}], id="list_frame"),
+        pytest.param("measurement", id="string_frame"),
+        pytest.param(5, id="number_frame"),
+        pytest.param({"type": "error", "data": "boom"}, id="error_not_object"),
+    ],
+)
+@pytest.mark.usefixtures("socket_enabled")
+async def test_push_client_skips_malformed_frames(frame: Any) -> None:
+    """Test malformed frames are skipped without dropping the connection."""
+    app = _make_device("secret", [{"power_w": 456.0}], frames=[frame])
+
+    on_disconnect = Mock()
+    received: list[float | None] = []
+
+    async with TestServer(app) as server, _make_session() as session:
+        client = HomeWizardPushClient(
+            session,
+            str(server.make_url("/api/ws")),
+            "secret",
+            ssl_context=False,
+            on_connect=Mock(),
+            on_measurement=lambda measurement: received.append(measurement.power_w),
+            on_disconnect=on_disconnect,
+        )
+
+        with (
+            patch(
+                "custom_components.homewizard_instant.push.asyncio.sleep",
+                side_effect=asyncio.CancelledError,
+            ),
+            pytest.raises(asyncio.CancelledError),
+        ):
+            await client.run()
+
+    # The measurement after the bad frame still arrived on the same connection
+    assert received == [456.0]
+    on_disconnect.assert_called_once()
+
+
+@pytest.mark.usefixtures("socket_enabled")
+async def test_push_client_stops_on_rejected_token() -> None:
+    """Test run returns when the device rejects the token."""
+    app = _make_device("secret", [])
+
+    on_connect = Mock()
+    on_disconnect = Mock()
+
+    async with TestServer(app) as server, _make_session() as session:
+        client = HomeWizardPushClient(
+            session,
+            str(server.make_url("/api/ws")),
+            "wrong",
+            ssl_context=False,
+            on_connect=on_connect,
+            on_measurement=Mock(),
+            on_disconnect=on_disconnect,
+        )
+
+        await asyncio.wait_for(client.run(), timeout=5)
+
+    on_connect.assert_not_called()
+    on_disconnect.assert_not_called()
+
+
+@pytest.mark.usefixtures("socket_enabled")
+async def test_push_client_retries_after_connection_error() -> None:
+    """Test connection errors are retried after the reconnect delay."""
+    async with _make_session() as session:
+        client = HomeWizardPushClient(
+            session,
+            "ws://127.0.0.1:1/api/ws",
+            "secret",
+            ssl_context=False,
+            on_connect=Mock(),
+            on_measurement=Mock(),
+            on_disconnect=Mock(),
+        )
+
+        with patch(
+            "custom_components.homewizard_instant.push.asyncio.sleep",
+            side_effect=asyncio.CancelledError,
+        ) as sleep:
+            with pytest.raises(asyncio.CancelledError):
+                await client.run()
+
+    sleep.assert_called_once()
+
+
+async def test_push_client_disconnects_when_stopped() -> None:
+    """Test the owner falls back to polling however the task ends."""
+    on_disconnect = Mock()
+    client = HomeWizardPushClient(
+        Mock(),
+        "ws://127.0.0.1:1/api/ws",
+        "secret",
+        ssl_context=False,
+        on_connect=Mock(),
+        on_measurement=Mock(),
+        on_disconnect=on_disconnect,
+    )
+    client.connected = True
+
+    with (
+        patch.object(client, "_listen", side_effect=RuntimeError),
+        pytest.raises(RuntimeError),
+    ):
+        await client.run()
+
+    on_disconnect.assert_called_once()
+    assert client.connected is False
+
+
+async def test_async_create_ssl_context(hass) -> None:
+    """Test the device SSL context requires a certificate."""
+    context = await async_create_ssl_context(hass)
+
+    assert context.check_hostname is False
@@ -0,0 +1,94 @@
+"""Tests for the rolling window statistics."""
+
+from __future__ import annotations
+
+from custom_components.homewizard_instant.rolling import RollingSamples
+
+
+def test_rolling_windows() -> None:
+    """Test samples leave each window once they are older than it."""
+    samples = RollingSamples(windows=(10, 30))
+    short, long = samples.windows[10], samples.windows[30]
+    assert short.mean is None
+    assert short.min is None
+    assert short.max is None
+
+    for now, value in enumerate((5.0, 1.0, 3.0)):
+        samples.add(float(now), value)
+
+    assert short.count == 3
+    assert short.mean == 3.0
+    assert short.min == 1.0
+    assert short.max == 5.0
+
+    # The first two samples are out of the short window, not the long one
+    samples.add(11.0, 2.0)
+    assert short.count == 2
+    assert short.mean == 2.5
+    assert short.min == 2.0
+    assert short.max == 3.0
+    assert long.count == 4
+    assert long.mean == 2.75
+    assert long.min == 1.0
+    assert long.max == 5.0
+
+    # A sample after a gap replaces all older ones
+    samples.add(100.0, -4.0)
+    assert short.count == long.count == 1
+    assert short.mean == -4.0
+    assert long.min == long.max == -4.0
+
+
+def test_rolling_expire() -> None:
+    """Test samples leave the windows without new samples."""
+    samples = RollingSamples(windows=(10, 30))
+    short, long = samples.windows[10], samples.windows[30]
+    samples.add(0.0, 5.0)
+    samples.add(5.0, 1.0)
+
+    assert not samples.expire(8.0)
+    assert samples.expire(12.0)
+    assert short.count == 1
+    assert short.mean == 1.0
+    assert long.count == 2
+
+    assert samples.expire(40.0)
+    assert short.count == long.count == 0
+    assert short.mean is None
+    assert long.max is None
+    assert not samples.expire(50.0)
+
+
+def test_rolling_buffer_capacity() -> None:
+    """Test samples are evicted before the ring buffer overwrites them."""
+    samples = RollingSamples(windows=(1000,), size=4)
+    window = samples.windows[1000]
+
+    for now, value in enumerate((9.0, 1.0, 2.0, 3.0, 4.0, 5.0)):
+        samples.add(float(now), value)
+
+    assert len(samples) == 4
+    assert window.count == 4
+    assert window.mean == 3.5
+    assert window.min == 2.0
+    assert window.max == 5.0
+
+
+def test_rolling_matches_naive_statistics() -> None:
+    """Test the running aggregates against recomputing every window."""
+    samples = RollingSamples(windows=(7, 20), size=16)
+    history: list[tuple[float, float]] = []
+
+    for step in range(200):
+        now = step * 0.75
+        value = float((step * 37) % 23 - 11)
+        samples.add(now, value)
+        history.append((now, value))
+
+        for seconds, window in samples.windows.items():
+            values = [v for t, v in history[-16:] if t > now - seconds]
+            assert window.count == len(values)
+            assert window.mean is not None
+            assert abs(window.mean - sum(values) / len(values)) < 1e-9
+            assert window.min == min(values)
+            assert window.max == max(values)
@@ -0,0 +1,104 @@
+"""Tests for the shared poll scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.homewizard_instant.const import DOMAIN
+from custom_components.homewizard_instant.coordinator import (
+    HWEnergyDeviceUpdateCoordinator,
+)
+from custom_components.homewizard_instant.polling import AlignedTicker
+from custom_components.homewizard_instant.scheduler import (
+    PollScheduler,
+    async_get_scheduler,
+)
+
+
+async def test_scheduler_spreads_meters(hass) -> None:
+    """Test meters get evenly spread offsets as they come and go."""
+    scheduler = PollScheduler(hass.loop)
+    tickers = [AlignedTicker() for _ in range(4)]
+    for index, ticker in enumerate(tickers):
+        scheduler.async_add(f"Meter {index}", ticker)
+
+    assert [ticker.offset for ticker in tickers] == [0.0, 0.25, 0.5, 0.75]
+
+    scheduler.async_remove(tickers[1])
+    scheduler.async_remove(tickers[1])
+    assert [ticker.offset for ticker in tickers[2:]] == [1 / 3, 2 / 3]
+    assert scheduler.as_dict()["meters"] == 3
+
+
+async def test_scheduler_runs_due_actions_from_one_timer(hass) -> None:
+    """Test actions run in time order and cancelled ones are dropped."""
+    scheduler = PollScheduler(hass.loop)
+    calls: list[str] = []
+    now = hass.loop.time()
+
+    scheduler.async_schedule(now + 0.02, lambda: calls.append("second"))
+    cancel = scheduler.async_schedule(now + 0.01, lambda: calls.append("cancelled"))
+    scheduler.async_schedule(now + 0.01, lambda: calls.append("first"))
+    timer = scheduler._timer
+    assert timer is not None
+    assert timer.when() == now + 0.01
+
+    cancel()
+    # The pending timer is kept for the action due at the same time
+    assert scheduler._timer is timer
+
+    await asyncio.sleep(0.05)
+
+    assert calls == ["first", "second"]
+    assert scheduler._timer is None
+    assert not scheduler._queue
+
+
+async def test_scheduler_caps_concurrent_polls(hass) -> None:
+    """Test polls wait for a free slot beyond the cap."""
+    scheduler = PollScheduler(hass.loop, max_polls=2)
+    tickers = [AlignedTicker() for _ in range(3)]
+    release = asyncio.Event()
+
+    async def poll(ticker: AlignedTicker) -> None:
+        async with scheduler.slot(ticker):
+            await release.wait()
+
+    tasks = [hass.async_create_task(poll(ticker)) for ticker in tickers]
+    await asyncio.sleep(0)
+    assert scheduler.active == 2
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert scheduler.active == 0
+    assert scheduler.active_max == 2
+    assert [ticker.slot_waits for ticker in tickers] == [0, 0, 1]
+
+
+async def test_coordinators_share_the_scheduler(hass) -> None:
+    """Test the coordinators of all entries register with one scheduler."""
+    entries = [
+        MockConfigEntry(domain=DOMAIN, title=f"P1 Meter {index}") for index in range(2)
+    ]
+    coordinators = []
+    for entry in entries:
+        entry.add_to_hass(hass)
+        coordinators.append(
+            HWEnergyDeviceUpdateCoordinator(hass, entry, api=AsyncMock())
+        )
+
+    scheduler = async_get_scheduler(hass)
+    assert all(coordinator.scheduler is scheduler for coordinator in coordinators)
+    assert [coordinator.ticker.offset for coordinator in coordinators] == [0.0, 0.5]
+    assert [meter["name"] for meter in scheduler.as_dict()["per_meter"]] == [
+        "P1 Meter 0",
+        "P1 Meter 1",
+    ]
+
+    await coordinators[0].async_shutdown()
+    assert coordinators[1].ticker.offset == 0.0
+    assert scheduler.as_dict()["meters"] == 1
@@ -2,24 +2,48 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock
+from dataclasses import replace
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock, patch
+
+from homewizard_energy.models import ExternalDevice
 
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.const import UnitOfVolume
+from homeassistant.core import State
+from homeassistant.util.dt import utcnow
+from pytest_homeassistant_custom_component.common import (
+    async_fire_time_changed,
+    mock_restore_cache_with_extra_data,
+)
 
+from custom_components.homewizard_instant.const import (
+    POLL_STATISTICS_INTERVAL,
+    WRITE_SETTLE_DELAY,
+)
 from custom_components.homewizard_instant.coordinator import (
     HWEnergyDeviceUpdateCoordinator,
 )
 from custom_components.homewizard_instant.sensor import (
+    HomeWizardDemandSensorEntity,
+    HomeWizardEnergySensorEntity,
     HomeWizardExternalSensorEntity,
+    HomeWizardPollSensorEntity,
+    HomeWizardRollingSensorEntity,
     HomeWizardSensorEntity,
     async_setup_entry,
 )
 from custom_components.homewizard_instant.sensor import (
+    ENERGY_SENSORS,
+    EXTERNAL_SENSORS,
+    POLL_SENSORS,
+    ROLLING_SENSORS,
     SENSORS,
     to_percentage,
     uptime_to_datetime,
 )
+from custom_components.homewizard_instant.extraction import ExtractionPlan
+from custom_components.homewizard_instant.write_limits import WriteLimits
 
 
 async def test_async_setup_entry_adds_entities(hass, mock_config_entry, mock_combined_data):
@@ -43,6 +67,30 @@ async def test_async_setup_entry_adds_entities(hass, mock_config_entry, mock_com
     assert added
     assert any(isinstance(entity, HomeWizardSensorEntity) for entity in added)
     assert any(isinstance(entity, HomeWizardExternalSensorEntity) for entity in added)
+    assert sum(isinstance(entity, HomeWizardPollSensorEntity) for entity in added) == 5
+    # Power is reported, current per phase is not
+    rolling = [e for e in added if isinstance(e, HomeWizardRollingSensorEntity)]
+    assert len(rolling) == 9
+    assert {e.entity_description.metric for e in rolling} == {"power_w"}
+
+    demand = [e for e in added if isinstance(e, HomeWizardDemandSensorEntity)]
+    assert len(demand) == 4
+    coordinator.demand.add(0.0, 1000.0)
+    coordinator.demand.add(10.0, 1000.0)
+    assert {e.entity_description.key: e.native_value for e in demand} == {
+        "local_average_demand_w": 1000.0,
+        "local_average_demand_forecast_w": 1000.0,
+        "local_monthly_power_peak_w": None,
+        "local_monthly_power_peak_timestamp": None,
+    }
+
+    # Energy is only integrated from total power, anchored to the meter totals
+    coordinator.async_update_listeners()
+    energy = [e for e in added if isinstance(e, HomeWizardEnergySensorEntity)]
+    assert {e.entity_description.key: e.native_value for e in energy} == {
+        "local_energy_import_kwh": 1.23,
+        "local_energy_export_kwh": 0.0,
+    }
 
 
 async def test_sensor_entity_enabled_default(hass, mock_config_entry, mock_combined_data):
@@ -57,6 +105,7 @@ async def test_sensor_entity_enabled_default(hass, mock_config_entry, mock_combi
     description = next(
         d for d in SENSORS if d.key == "total_power_export_kwh"
     )
+    coordinator.async_set_extraction(ExtractionPlan([description]))
 
     entity = HomeWizardSensorEntity(coordinator, description)
 
@@ -74,6 +123,7 @@ async def test_sensor_entity_available(hass, mock_config_entry, mock_combined_da
     coordinator.data.measurement.power_w = None
 
     description = next(d for d in SENSORS if d.key == "active_power_w")
+    coordinator.async_set_extraction(ExtractionPlan([description]))
     entity = HomeWizardSensorEntity(coordinator, description)
 
     assert entity.native_value is None
@@ -190,3 +240,357 @@ async def test_import_tariff_t1_sensor_does_not_depend_on_export_t2(
         and entity.entity_description.key == "total_power_import_t1_kwh"
         for entity in added
     )
+
+
+async def test_sensor_writes_only_changed_values(
+    hass, mock_config_entry, mock_combined_data
+):
+    """Test coordinator updates only write sensors whose value changed."""
+    mock_config_entry.add_to_hass(hass)
+
+    coordinator = HWEnergyDeviceUpdateCoordinator(
+        hass, mock_config_entry, api=AsyncMock()
+    )
+    coordinator.data = mock_combined_data
+
+    descriptions = {d.key: d for d in SENSORS}
+    coordinator.async_set_extraction(
+        ExtractionPlan([descriptions["active_power_w"], descriptions["active_tariff"]])
+    )
+    power = HomeWizardSensorEntity(coordinator, descriptions["active_power_w"])
+    tariff = HomeWizardSensorEntity(coordinator, descriptions["active_tariff"])
+    external = HomeWizardExternalSensorEntity(
+        coordinator, EXTERNAL_SENSORS[ExternalDevice.DeviceType.GAS_METER], "gas123"
+    )
+    for entity in (power, tariff, external):
+        entity.async_write_ha_state = Mock()
+        entity._written_state = entity._state_snapshot()
+        coordinator.async_add_listener(entity._handle_coordinator_update)
+
+    coordinator.data.measurement.power_w = 75.0
+    coordinator.async_update_listeners()
+
+    power.async_write_ha_state.assert_called_once()
+    tariff.async_write_ha_state.assert_not_called()
+    external.async_write_ha_state.assert_not_called()
+
+    # Losing a value changes availability
+    coordinator.data.measurement.tariff = None
+    coordinator.async_update_listeners()
+    tariff.async_write_ha_state.assert_called_once()
+
+    assert coordinator.state_writes == 2
+    assert coordinator.state_writes_skipped == 4
+
+    await coordinator.async_shutdown()
+
+
+async def test_sensor_write_limits(hass, mock_config_entry, mock_combined_data):
+    """Test deadband and minimum write interval hold back small changes."""
+    mock_config_entry.add_to_hass(hass)
+
+    coordinator = HWEnergyDeviceUpdateCoordinator(
+        hass, mock_config_entry, api=AsyncMock()
+    )
+    coordinator.data = mock_combined_data
+    coordinator.data.measurement.voltage_v = 230.0
+    coordinator.write_limits = {
+        "voltage": WriteLimits(deadband=1.0, min_interval=60.0)
+    }
+
+    description = next(d for d in SENSORS if d.key == "active_voltage_v")
+    coordinator.async_set_extraction(ExtractionPlan([description]))
+    entity = HomeWizardSensorEntity(coordinator, description)
+    # Only the settle timers should fire, not coordinator refreshes
+    coordinator.update_interval = None
+    entity.hass = hass
+    entity.async_write_ha_state = Mock()
+    entity._written_state = entity._state_snapshot()
+    coordinator.async_add_listener(entity._handle_coordinator_update)
+
+    with patch(
+        "custom_components.homewizard_instant.sensor.monotonic", return_value=0.0
+    ) as monotonic:
+        # Within the deadband
+        coordinator.data.measurement.voltage_v = 230.5
+        coordinator.async_update_listeners()
+        entity.async_write_ha_state.assert_not_called()
+
+        # Outside the deadband, but within the write interval
+        monotonic.return_value = 10.0
+        coordinator.data.measurement.voltage_v = 235.0
+        coordinator.async_update_listeners()
+        entity.async_write_ha_state.assert_not_called()
+
+        # The held back change is written once the interval passed
+        monotonic.return_value = 60.0
+        async_fire_time_changed(hass, utcnow() + timedelta(seconds=60))
+        await hass.async_block_till_done()
+        entity.async_write_ha_state.assert_called_once()
+        assert entity._written_state == (True, 235.0)
+
+        # A small change settles into a final write
+        coordinator.data.measurement.voltage_v = 235.4
+        coordinator.async_update_listeners()
+        assert entity.async_write_ha_state.call_count == 1
+        async_fire_time_changed(
+            hass, utcnow() + WRITE_SETTLE_DELAY + timedelta(seconds=1)
+        )
+        await hass.async_block_till_done()
+        # ...but not before the write interval passed
+        assert entity.async_write_ha_state.call_count == 1
+        async_fire_time_changed(hass, utcnow() + timedelta(seconds=61))
+        await hass.async_block_till_done()
+
+    assert entity.async_write_ha_state.call_count == 2
+    assert entity._written_state == (True, 235.4)
+
+    # Losing the value is written right away
+    coordinator.data.measurement.voltage_v = None
+    coordinator.async_update_listeners()
+    assert entity.async_write_ha_state.call_count == 3
+
+    await coordinator.async_shutdown()
+
+
+async def test_sensor_write_limits_moving_value(
+    hass, mock_config_entry, mock_combined_data
+):
+    """Test a value that keeps moving within the deadband is still written."""
+    mock_config_entry.add_to_hass(hass)
+
+    coordinator = HWEnergyDeviceUpdateCoordinator(
+        hass, mock_config_entry, api=AsyncMock()
+    )
+    coordinator.data = mock_combined_data
+    coordinator.data.measurement.voltage_v = 230.0
+    coordinator.write_limits = {"voltage": WriteLimits(deadband=1.0)}
+
+    description = next(d for d in SENSORS if d.key == "active_voltage_v")
+    coordinator.async_set_extraction(ExtractionPlan([description]))
+    entity = HomeWizardSensorEntity(coordinator, description)
+    coordinator.update_interval = None
+    entity.hass = hass
+    entity.async_write_ha_state = Mock()
+    entity._written_state = entity._state_snapshot()
+    coordinator.async_add_listener(entity._handle_coordinator_update)
+
+    with (
+        patch(
+            "custom_components.homewizard_instant.sensor.monotonic", return_value=0.0
+        ) as monotonic,
+        patch(
+            "custom_components.homewizard_instant.sensor.async_call_later"
+        ) as call_later,
+    ):
+        # A change every 10 seconds does not push back the write
+        for seconds in range(0, 40, 10):
+            monotonic.return_value = float(seconds)
+            coordinator.data.measurement.voltage_v = 230.1 + seconds / 100
+            coordinator.async_update_listeners()
+
+        call_later.assert_called_once()
+        _, delay, settle = call_later.call_args.args
+        assert delay == WRITE_SETTLE_DELAY.total_seconds()
+        settle(utcnow())
+
+    entity.async_write_ha_state.assert_called_once()
+    assert entity._written_state == (True, 230.4)
+
+    await coordinator.async_shutdown()
+
+
+async def test_external_sensor_write_limits(
+    hass, mock_config_entry, mock_combined_data
+):
+    """Test the totals limits hold back small changes of a gas meter."""
+    mock_config_entry.add_to_hass(hass)
+
+    coordinator = HWEnergyDeviceUpdateCoordinator(
+        hass, mock_config_entry, api=AsyncMock()
+    )
+    coordinator.data = mock_combined_data
+    coordinator.update_interval = None
+    coordinator.write_limits = {
+        "totals": WriteLimits(deadband=0.01, min_interval=60.0)
+    }
+    gas = coordinator.data.measurement.external_devices["gas123"]
+
+    entity = HomeWizardExternalSensorEntity(
+        coordinator, EXTERNAL_SENSORS[gas.type], "gas123"
+    )
+    entity.hass = hass
+    entity.async_write_ha_state = Mock()
+    entity._written_state = entity._state_snapshot()
+    coordinator.async_add_listener(entity._handle_coordinator_update)
+
+    with (
+        patch(
+            "custom_components.homewizard_instant.sensor.monotonic", return_value=0.0
+        ),
+        patch("custom_components.homewizard_instant.sensor.async_call_later"),
+    ):
+        # Within the deadband, then within the write interval
+        gas.value = 1.505
+        coordinator.async_update_listeners()
+        gas.value = 1.6
+        coordinator.async_update_listeners()
+        entity.async_write_ha_state.assert_not_called()
+
+        # A new unit is written right away
+        gas.unit = "L"
+        coordinator.async_update_listeners()
+
+    entity.async_write_ha_state.assert_called_once()
+    assert entity._written_state == (True, 1.6, "L")
+
+    await coordinator.async_shutdown()
+
+
+async def test_poll_sensors(hass, mock_config_entry, mock_combined_data):
+    """Test poll statistics sensors are written on their own interval."""
+    mock_config_entry.add_to_hass(hass)
+
+    coordinator = HWEnergyDeviceUpdateCoordinator(
+        hass, mock_config_entry, api=AsyncMock()
+    )
+    coordinator.data = mock_combined_data
+    coordinator.update_interval = None
+
+    descriptions = {d.key: d for d in POLL_SENSORS}
+    assert not any(d.entity_registry_enabled_default for d in POLL_SENSORS)
+
+    entities = {
+        key: HomeWizardPollSensorEntity(coordinator, descriptions[key])
+        for key in ("poll_latency_p95", "polls_per_minute", "poll_error_rate")
+    }
+    for entity in entities.values():
+        entity.hass = hass
+        entity.async_write_ha_state = Mock()
+        await entity.async_added_to_hass()
+
+    with patch(
+        "custom_components.homewizard_instant.sensor.monotonic", return_value=10.0
+    ):
+        coordinator.poll_stats.record(10.0, 0.05, success=True)
+        coordinator.poll_stats.record(10.0, 0.05, success=False)
+
+        # Polls do not write the statistics
+        coordinator.last_update_success = False
+        for entity in entities.values():
+            entity._handle_coordinator_update()
+            entity.async_write_ha_state.assert_not_called()
+            assert entity.available
+
+        async_fire_time_changed(hass, utcnow() + POLL_STATISTICS_INTERVAL)
+        await hass.async_block_till_done()
+
+        assert entities["poll_latency_p95"].native_value == 49.6
+        assert entities["polls_per_minute"].native_value == 2
+        assert entities["poll_error_rate"].native_value == 50.0
+        for entity in entities.values():
+            entity.async_write_ha_state.assert_called_once()
+
+    for entity in entities.values():
+        entity._call_on_remove_callbacks()
+    await coordinator.async_shutdown()
+
+
+async def test_rolling_sensors(hass, mock_config_entry, mock_combined_data):
+    """Test rolling window sensors follow new measurements only."""
+    mock_config_entry.add_to_hass(hass)
+
+    coordinator = HWEnergyDeviceUpdateCoordinator(
+        hass, mock_config_entry, api=AsyncMock()
+    )
+    coordinator.data = mock_combined_data
+    coordinator.update_interval = None
+
+    descriptions = {d.key: d for d in ROLLING_SENSORS}
+    assert [d.key for d in ROLLING_SENSORS if d.entity_registry_enabled_default] == [
+        "active_power_w_mean_1m",
+        "active_power_w_mean_5m",
+        "active_power_w_mean_15m",
+    ]
+    assert descriptions["active_current_l2_a_max_15m"].translation_placeholders == {
+        "phase": "2",
+        "window": "15",
+    }
+
+    entities = {
+        key: HomeWizardRollingSensorEntity(coordinator, descriptions[key])
+        for key in (
+            "active_power_w_mean_1m",
+            "active_power_w_max_1m",
+            "active_power_w_mean_5m",
+        )
+    }
+    for entity in entities.values():
+        assert not entity.available
+
+    with patch(
+        "custom_components.homewizard_instant.coordinator.monotonic"
+    ) as monotonic:
+        for now, power in ((0.0, 100.0), (30.0, 400.0), (80.0, 250.0)):
+            monotonic.return_value = now
+            coordinator.data = replace(
+                coordinator.data,
+                measurement=replace(coordinator.data.measurement, power_w=power),
+            )
+            coordinator.async_update_listeners()
+
+        # The same measurement is only sampled once
+        coordinator.async_update_listeners()
+
+    assert entities["active_power_w_mean_1m"].native_value == 325.0
+    assert entities["active_power_w_max_1m"].native_value == 400.0
+    assert entities["active_power_w_mean_5m"].native_value == 250.0
+    assert entities["active_power_w_mean_5m"].available
+    assert coordinator.rolling["current_l1_a"].windows[60].count == 0
+
+    # Samples age out of the windows on ticks without a new measurement
+    with patch(
+        "custom_components.homewizard_instant.coordinator.monotonic",
+        return_value=150.0,
+    ):
+        coordinator._async_refresh_finished()
+
+    assert entities["active_power_w_mean_1m"].native_value is None
+    assert not entities["active_power_w_max_1m"].available
+    assert entities["active_power_w_mean_5m"].native_value == 250.0
+
+    await coordinator.async_shutdown()
+
+
+async def test_energy_sensor_restores_counter(
+    hass, mock_config_entry, mock_combined_data
+):
+    """Test integrated energy continues from the last state after a restart."""
+    mock_config_entry.add_to_hass(hass)
+
+    coordinator = HWEnergyDeviceUpdateCoordinator(
+        hass, mock_config_entry, api=AsyncMock()
+    )
+    coordinator.data = mock_combined_data
+    descriptions = {d.key: d for d in ENERGY_SENSORS}
+    mock_restore_cache_with_extra_data(
+        hass,
+        (
+            (
+                State("sensor.energy_import_phase_1", "2.5"),
+                {"native_value": 2.5, "native_unit_of_measurement": "kWh"},
+            ),
+        ),
+    )
+
+    entity = HomeWizardEnergySensorEntity(
+        coordinator, descriptions["local_energy_import_l1_kwh"]
+    )
+    entity.hass = hass
+    entity.entity_id = "sensor.energy_import_phase_1"
+    await entity.async_added_to_hass()
+
+    assert entity.native_value == 2.5
+    assert coordinator.energy["power_l1_w"].exported == 0.0
+
+    await coordinator.async_shutdown()
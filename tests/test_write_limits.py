@@ -0,0 +1,50 @@
+"""Tests for the sensor group write limits."""
+
+from __future__ import annotations
+
+from custom_components.homewizard_instant.const import (
+    CONF_DEADBAND,
+    CONF_DEADBAND_TYPE,
+    CONF_MIN_WRITE_INTERVAL,
+    DEADBAND_ABSOLUTE,
+    DEADBAND_RELATIVE,
+)
+from custom_components.homewizard_instant.write_limits import (
+    WriteLimits,
+    write_limits_from_options,
+)
+
+
+def test_exceeds_deadband() -> None:
+    """Test absolute and relative deadbands."""
+    absolute = WriteLimits(deadband=1.0)
+    assert not absolute.exceeds_deadband(230.0, 230.9)
+    assert absolute.exceeds_deadband(230.0, 228.9)
+
+    relative = WriteLimits(deadband=1.0, relative=True)
+    assert not relative.exceeds_deadband(230.0, 232.0)
+    assert relative.exceeds_deadband(230.0, 232.5)
+
+    assert WriteLimits().exceeds_deadband(230.0, 230.1)
+
+
+def test_write_limits_from_options() -> None:
+    """Test only groups with limits are returned."""
+    options = {
+        "max_update_interval": 5,
+        "power": {
+            CONF_DEADBAND: 0,
+            CONF_DEADBAND_TYPE: DEADBAND_ABSOLUTE,
+            CONF_MIN_WRITE_INTERVAL: 0,
+        },
+        "voltage": {
+            CONF_DEADBAND: 0.5,
+            CONF_DEADBAND_TYPE: DEADBAND_RELATIVE,
+            CONF_MIN_WRITE_INTERVAL: 60,
+        },
+    }
+
+    assert write_limits_from_options(options) == {
+        "voltage": WriteLimits(deadband=0.5, relative=True, min_interval=60.0)
+    }
+    assert write_limits_from_options({}) == {}